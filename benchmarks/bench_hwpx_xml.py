@@ -0,0 +1,121 @@
+"""
+HWPX XML 백엔드 벤치마크
+
+HWPX 파일별로 xml.etree.ElementTree와 lxml 백엔드의 header.xml 로드 시간과
+전체 파싱 시간을 비교하고, 두 백엔드의 결과(Document)가 같은지 확인한다.
+서식 정의가 많은 문서(header 위주)와 표가 많은 문서(section 위주)를 함께 넣어 비교하면 된다.
+
+사용법:
+    python benchmarks/bench_hwpx_xml.py 문서폴더/ [파일.hwpx ...] [-n 반복횟수]
+"""
+
+import argparse
+import io
+import sys
+import time
+import zipfile
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from hwpconv.parsers.hwpx import HAS_LXML, HwpxParser  # noqa: E402
+
+# auto: header.xml은 lxml, 구역은 ElementTree
+BACKENDS = ['etree', 'lxml', 'auto']
+
+
+def find_files(inputs: List[str]) -> List[Path]:
+    """입력 경로에서 .hwpx 파일 목록 생성 (폴더는 재귀 탐색)"""
+    files = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            files.extend(sorted(path.rglob('*.hwpx')))
+        elif path.suffix.lower() == '.hwpx':
+            files.append(path)
+    return files
+
+
+def time_header(data: bytes, backend: str, repeat: int) -> float:
+    """header.xml 로드(파싱 + 서식 테이블 구성) 최소 시간"""
+    best = float('inf')
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        for _ in range(repeat):
+            parser = HwpxParser(xml_backend=backend)
+            start = time.perf_counter()
+            parser._load_header(zf)
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_parse(data: bytes, backend: str, repeat: int) -> float:
+    """전체 파싱 최소 시간"""
+    best = float('inf')
+    for _ in range(repeat):
+        parser = HwpxParser(xml_backend=backend)
+        start = time.perf_counter()
+        parser.parse(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HWPX XML 백엔드(etree/lxml) 벤치마크')
+    parser.add_argument('inputs', nargs='+', help='HWPX 파일 또는 폴더')
+    parser.add_argument('-n', '--repeat', type=int, default=5, help='반복 횟수 (기본: 5)')
+    args = parser.parse_args()
+
+    if not HAS_LXML:
+        print('lxml이 설치되어 있지 않습니다.', file=sys.stderr)
+        sys.exit(1)
+
+    # 반복 측정이 캐시 적중이 되지 않도록 header 캐시 끔
+    HwpxParser.header_cache = None
+
+    files = find_files(args.inputs)
+    if not files:
+        print('HWPX 파일이 없습니다.', file=sys.stderr)
+        sys.exit(1)
+
+    print(f'{"파일":<30}{"header etree":>14}{"header lxml":>13}'
+          f'{"parse etree":>13}{"parse lxml":>12}{"parse auto":>12}')
+
+    totals = {key: 0.0 for key in ('header_etree', 'header_lxml', 'parse_etree', 'parse_lxml', 'parse_auto')}
+    for path in files:
+        data = path.read_bytes()
+
+        # 결과 검증
+        docs = [HwpxParser(xml_backend=backend).parse(data) for backend in BACKENDS]
+        if any(doc != docs[0] for doc in docs[1:]):
+            print(f'{path.name:<30}결과 불일치', file=sys.stderr)
+            continue
+
+        row = {
+            'header_etree': time_header(data, 'etree', args.repeat),
+            'header_lxml': time_header(data, 'lxml', args.repeat),
+        }
+        for backend in BACKENDS:
+            row[f'parse_{backend}'] = time_parse(data, backend, args.repeat)
+        for key, value in row.items():
+            totals[key] += value
+        print_row(path.name[:29], row)
+
+    print_row('합계', totals)
+
+
+def print_row(name: str, row: dict) -> None:
+    """한 줄 출력 (ms, 괄호 안은 etree 대비 배율)"""
+    cells = [f'{name:<30}']
+    for key, width in (('header_etree', 14), ('header_lxml', 13), ('parse_etree', 13),
+                       ('parse_lxml', 12), ('parse_auto', 12)):
+        cells.append(f'{row[key] * 1000:>{width}.2f}')
+    base_header = row['header_etree'] or 1e-9
+    base_parse = row['parse_etree'] or 1e-9
+    cells.append(f'   (header lxml {base_header / max(row["header_lxml"], 1e-9):.2f}x,'
+                 f' parse lxml {base_parse / max(row["parse_lxml"], 1e-9):.2f}x,'
+                 f' auto {base_parse / max(row["parse_auto"], 1e-9):.2f}x)')
+    print(''.join(cells))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+압축 해제 백엔드 벤치마크
+
+HWP 파일들의 압축된 스트림(DocInfo, BodyText/SectionN, BinData)을 모아
+설치된 백엔드(isal, zlib-ng, zlib)별로 압축 해제 시간을 비교한다.
+
+사용법:
+    python benchmarks/bench_inflate.py 문서폴더/ [파일.hwp ...] [-n 반복횟수]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from hwpconv.parsers import inflate  # noqa: E402
+from hwpconv.parsers.hwp import HwpParser, _open_ole  # noqa: E402
+
+
+def collect_streams(paths: List[Path]) -> List[bytes]:
+    """압축된 HWP 스트림 수집"""
+    streams = []
+    for path in paths:
+        try:
+            ole = _open_ole(str(path))
+        except Exception as e:
+            print(f'건너뜀: {path} ({e})', file=sys.stderr)
+            continue
+        try:
+            parser = HwpParser()
+            parser._check_file_header(ole)
+            if not parser._is_compressed:
+                continue
+            for entry in ole.listdir():
+                if entry[0] in ('DocInfo', 'BodyText', 'BinData'):
+                    streams.append(ole.openstream(entry).read())
+        finally:
+            ole.close()
+    return streams
+
+
+def find_files(inputs: List[str]) -> List[Path]:
+    """입력 경로에서 .hwp 파일 목록 생성 (폴더는 재귀 탐색)"""
+    files = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            files.extend(sorted(path.rglob('*.hwp')))
+        elif path.suffix.lower() == '.hwp':
+            files.append(path)
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HWP raw deflate 압축 해제 백엔드 벤치마크')
+    parser.add_argument('inputs', nargs='+', help='HWP 파일 또는 폴더')
+    parser.add_argument('-n', '--repeat', type=int, default=5, help='반복 횟수 (기본: 5)')
+    args = parser.parse_args()
+
+    files = find_files(args.inputs)
+    streams = collect_streams(files)
+    if not streams:
+        print('압축된 스트림이 없습니다.', file=sys.stderr)
+        sys.exit(1)
+
+    # 기준 결과 (표준 zlib)
+    inflate.set_backend('zlib')
+    expected = [inflate.inflate_or_raw(data) for data in streams]
+    compressed_size = sum(len(data) for data in streams)
+    inflated_size = sum(len(data) for data in expected)
+
+    print(f'파일 {len(files)}개, 스트림 {len(streams)}개, '
+          f'압축 {compressed_size / 1e6:.1f} MB -> 해제 {inflated_size / 1e6:.1f} MB, 반복 {args.repeat}회')
+    print(f'{"백엔드":<10}{"최소 시간(s)":>14}{"MB/s":>10}{"배율":>8}')
+
+    baseline = None
+    for name in reversed(inflate.available_backends()):  # zlib부터
+        inflate.set_backend(name)
+
+        # 결과 검증
+        if [inflate.inflate_or_raw(data) for data in streams] != expected:
+            print(f'{name:<10}결과 불일치', file=sys.stderr)
+            continue
+
+        best = float('inf')
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            for data in streams:
+                inflate.inflate_or_raw(data)
+            best = min(best, time.perf_counter() - start)
+
+        if baseline is None:
+            baseline = best
+        print(f'{name:<10}{best:>14.4f}{inflated_size / 1e6 / best:>10.1f}{baseline / best:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -27,6 +27,7 @@ from .models import (
 )
 from .parsers.hwpx import HwpxParser
 from .parsers.hwp import HwpParser
+from .parsers.base import ParseProfile
 from .converters.markdown import MarkdownConverter
 from .converters.html import HtmlConverter
 
@@ -48,6 +49,7 @@ __all__ = [
     # Parsers
     "HwpxParser",
     "HwpParser",
+    "ParseProfile",
     # Converters
     "MarkdownConverter",
     "HtmlConverter",
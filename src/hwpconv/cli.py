@@ -19,6 +19,8 @@ def main():
                         default='md', help='출력 포맷 (기본: md)')
     parser.add_argument('--quick', action='store_true', 
                         help='빠른 텍스트 추출 (Preview 활용)')
+    parser.add_argument('--full-text', action='store_true',
+                        help='본문 전체 텍스트만 추출 (서식/표 구조/이미지 제외)')
     parser.add_argument('--no-images', action='store_true',
                         help='이미지 포함하지 않음')
     parser.add_argument('--analyze-images', action='store_true',
@@ -34,6 +36,7 @@ def main():
         sys.exit(1)
     
     # 파서/변환기 임포트 (지연 로딩으로 시작 시간 단축)
+    from .parsers.base import ParseProfile
     from .parsers.hwpx import HwpxParser
     from .parsers.hwp import HwpParser
     from .converters.markdown import MarkdownConverter
@@ -42,18 +45,29 @@ def main():
     # 파서 선택
     ext = input_path.suffix.lower()
     
+    # 이미지를 출력하지 않으면 BinData를 읽지 않음
+    profile = ParseProfile(images=False) if args.no_images or args.format == 'txt' else None
+    
     if ext == '.hwpx':
         if args.quick:
             result = HwpxParser.quick_extract(str(input_path))
             _output(result, args.output)
             return
-        doc = HwpxParser().parse(str(input_path))
+        if args.full_text:
+            result = HwpxParser().extract_text(str(input_path))
+            _output(result, args.output)
+            return
+        doc = HwpxParser(profile=profile).parse(str(input_path))
     elif ext == '.hwp':
         if args.quick:
             result = HwpParser.quick_extract(str(input_path))
             _output(result, args.output)
             return
-        doc = HwpParser().parse(str(input_path))
+        if args.full_text:
+            result = HwpParser().extract_text(str(input_path))
+            _output(result, args.output)
+            return
+        doc = HwpParser(profile=profile).parse(str(input_path))
     else:
         print(f'Error: Unsupported format {ext}', file=sys.stderr)
         sys.exit(1)
@@ -5,7 +5,7 @@ Document, Section, Paragraph, Table, Footnote 등 핵심 데이터 구조
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Union
+from typing import Callable, List, Dict, Optional, Union
 from enum import Enum
 
 
@@ -20,9 +20,9 @@ class HeadingLevel(Enum):
     H6 = 6
 
 
-@dataclass
+@dataclass(frozen=True)
 class TextStyle:
-    """텍스트 스타일 정보"""
+    """텍스트 스타일 정보 (불변, 여러 런과 문서가 같은 인스턴스를 공유함)"""
     bold: bool = False
     italic: bool = False
     underline: bool = False
@@ -121,17 +121,45 @@ class Footnote:
         return '\n'.join(p.text for p in self.content)
 
 
+class _LazyData:
+    """Image.data 디스크립터 (지연 로딩)
+    
+    데이터 없이 loader만 지정된 Image는 data에 처음 접근할 때 loader를 호출해 읽고 캐시한다.
+    """
+    
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        data = obj.__dict__.get('_data')
+        if data is None:
+            loader = obj.__dict__.get('loader')
+            data = loader() if loader is not None else b''
+            obj.__dict__['_data'] = data
+            obj.__dict__['loader'] = None
+        return data
+    
+    def __set__(self, obj, value):
+        # 생성자에서 data를 생략하면 기본값으로 디스크립터 자신이 전달됨
+        obj.__dict__['_data'] = None if value is self else value
+
+
 @dataclass
 class Image:
     """이미지"""
     id: str                           # 이미지 ID
-    data: bytes = field(repr=False)   # 이미지 바이너리 데이터
+    data: bytes = field(default=_LazyData(), repr=False)   # 이미지 바이너리 데이터 (bytes 또는 memoryview, 생략 시 loader로 지연 로딩)
     format: str = 'png'               # 이미지 형식 (png, jpg, gif, etc)
     width: Optional[int] = None       # 너비 (픽셀)
     height: Optional[int] = None      # 높이 (픽셀)
     alt_text: str = ''                # 대체 텍스트
     description: Optional[str] = None # AI 분석 설명
     analyzed: bool = False            # 분석 시도 여부
+    loader: Optional[Callable[[], bytes]] = field(default=None, repr=False, compare=False)  # 지연 로딩 함수
+    
+    @property
+    def is_loaded(self) -> bool:
+        """바이너리 데이터를 이미 읽었는지 여부"""
+        return self.__dict__.get('_data') is not None
     
     @property
     def base64(self) -> str:
@@ -4,8 +4,9 @@
 HWP 및 HWPX 파일 형식을 파싱하는 모듈
 """
 
-from .base import BaseParser
+from .base import BaseParser, ParseProfile, ParserSource
 from .hwpx import HwpxParser
 from .hwp import HwpParser
+from .cache import StyleTableCache
 
-__all__ = ["BaseParser", "HwpxParser", "HwpParser"]
+__all__ = ["BaseParser", "ParseProfile", "ParserSource", "HwpxParser", "HwpParser", "StyleTableCache"]
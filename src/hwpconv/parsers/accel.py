@@ -0,0 +1,28 @@
+"""
+NumPy 가속 백엔드 (선택)
+
+NumPy가 설치되어 있으면 고정 폭 배열 디코딩에 사용하고, 없으면 파서가 순수 파이썬 경로를 그대로 사용한다.
+두 경로의 결과는 동일하다.
+"""
+
+from typing import List
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HAS_NUMPY = np is not None
+
+# 이보다 짧은 PARA_TEXT는 NumPy 호출 오버헤드가 더 커서 순수 파이썬으로 처리 (바이트)
+MIN_TEXT_BYTES = 256
+
+
+def find_ctrl_units(data) -> List[int]:
+    """PARA_TEXT에서 제어문자(U+0000~U+001F) WCHAR 위치 목록 (WCHAR 단위, 오름차순)
+
+    확장/인라인 제어문자의 부가 데이터 안에 있는 값도 포함되므로,
+    호출하는 쪽에서 현재 위치 이후의 항목만 사용해야 한다.
+    """
+    units = np.frombuffer(data, dtype='<u2', count=len(data) // 2)
+    return np.flatnonzero(units < 0x20).tolist()
@@ -2,24 +2,133 @@
 파서 베이스 클래스
 """
 
+import io
+import mmap
+import os
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Set
+from typing import BinaryIO, Optional, Set, Union
 
 from ..models import Document
 
 
+# 파서 입력: 파일 경로, 파일 내용(bytes/memoryview), 바이너리 파일 객체, mmap
+ParserSource = Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO, mmap.mmap]
+
+
+@dataclass(frozen=True)
+class ParseProfile:
+    """선택적 파싱 프로파일
+    
+    False인 개체는 하위 레코드(HWP) 또는 하위 요소(HWPX) 전체를 디코딩하지 않고 건너뛴다.
+    """
+    tables: bool = True      # 표
+    images: bool = True      # 그림 (BinData 포함)
+    drawings: bool = True    # 그리기 개체 (도형, 글상자)
+    footnotes: bool = True   # 각주/미주
+
+
+class _BufferReader(io.RawIOBase):
+    """mmap/memoryview 읽기 어댑터 (복사 없음)
+    
+    Python 3.13 미만의 mmap에는 zipfile이 쓰는 seekable()이 없고,
+    BytesIO는 bytes가 아닌 버퍼를 복사하므로 위치만 따로 가진 읽기 전용 파일 객체로 감싼다.
+    """
+    
+    def __init__(self, mm):
+        self._mm = mm
+        self._pos = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        data = self._mm[self._pos:self._pos + len(buffer)]
+        buffer[:len(data)] = data
+        self._pos += len(data)
+        return len(data)
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._mm)
+        self._pos = max(offset, 0)
+        return self._pos
+    
+    def tell(self) -> int:
+        return self._pos
+
+
+def open_source(source: ParserSource) -> Union[str, os.PathLike, BinaryIO]:
+    """파서 입력을 olefile/zipfile이 읽을 수 있는 형태로 변환
+    
+    경로와 파일 객체는 그대로 두고 bytes류는 BytesIO로, mmap은 읽기 어댑터로 감싼다.
+    (olefile은 1536바이트 미만의 bytes를 경로로 해석하므로 직접 넘기지 않음)
+    
+    Args:
+        source: 파일 경로 또는 파일 내용
+        
+    Returns:
+        경로 또는 파일 객체
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    if isinstance(source, mmap.mmap) and not hasattr(source, 'seekable'):
+        return _BufferReader(source)
+    return source
+
+
+def reopen_source(source: ParserSource) -> Optional[Union[str, os.PathLike, BinaryIO]]:
+    """같은 입력을 독립된 읽기 위치로 다시 열기 (스레드마다 별도 핸들이 필요할 때)
+    
+    경로, bytes류, mmap만 가능하며 내용을 복사하지 않는다.
+    파일 객체는 읽기 위치를 공유하므로 None을 반환한다.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return source
+    if isinstance(source, bytes):
+        return io.BytesIO(source)
+    if isinstance(source, mmap.mmap):
+        return _BufferReader(source)
+    if isinstance(source, (bytearray, memoryview)):
+        return _BufferReader(memoryview(source).cast('B'))
+    return None
+
+
+def map_source(source: ParserSource) -> Optional[memoryview]:
+    """입력 전체를 바이트 단위 memoryview로 매핑 (복사 없음)
+
+    경로는 읽기 전용 mmap으로 열고, bytes류와 mmap은 그대로 감싼다.
+    파일 객체나 빈 파일처럼 매핑할 수 없으면 None을 반환한다.
+    반환한 뷰(및 그 슬라이스)가 살아 있는 동안 mmap이 유지된다.
+    """
+    try:
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'rb') as f:
+                return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+            return memoryview(source).cast('B')
+    except (OSError, ValueError, TypeError):
+        pass
+    return None
+
+
 class BaseParser(ABC):
     """파서 베이스 클래스"""
     
     SUPPORTED_EXTENSIONS: Set[str] = set()
     
     @abstractmethod
-    def parse(self, file_path: str) -> Document:
+    def parse(self, file_path: ParserSource) -> Document:
         """파일을 파싱하여 Document 객체 반환
         
         Args:
-            file_path: 파싱할 파일 경로
+            file_path: 파싱할 파일 경로 또는 파일 내용 (bytes, memoryview, 파일 객체, mmap)
             
         Returns:
             Document: 파싱된 문서 객체
@@ -28,11 +137,11 @@ class BaseParser(ABC):
     
     @staticmethod
     @abstractmethod
-    def quick_extract(file_path: str) -> str:
+    def quick_extract(file_path: ParserSource) -> str:
         """빠른 텍스트 추출 (Preview 활용)
         
         Args:
-            file_path: 파일 경로
+            file_path: 파일 경로 또는 파일 내용 (bytes, memoryview, 파일 객체, mmap)
             
         Returns:
             str: 추출된 텍스트
@@ -0,0 +1,88 @@
+"""
+파서 공용 캐시
+
+같은 템플릿에서 만들어진 문서들은 서식 정보(DocInfo, header.xml)가 바이트 단위로 동일하므로,
+원본 스트림의 digest를 키로 파싱 결과를 프로세스 전역에서 재사용한다.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+def stream_digest(data: bytes) -> bytes:
+    """캐시 키용 스트림 digest"""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def copy_tables(tables: Tuple[dict, ...]) -> Tuple[dict, ...]:
+    """캐시 항목(dict 튜플) 복사
+
+    문서마다 수정될 수 있는 dict는 새로 만들고(값이 dict면 한 단계 더 복사),
+    그 밖의 값(불변인 TextStyle, 문자열 등)은 공유한다.
+    """
+    return tuple(
+        {key: dict(value) if isinstance(value, dict) else value for key, value in table.items()}
+        for table in tables
+    )
+
+
+class StyleTableCache:
+    """서식 테이블 LRU 캐시 (스레드 안전)
+
+    캐시된 값(TextStyle 등)은 여러 문서가 공유하므로 수정하면 안 된다.
+    (dict 테이블은 copy_tables()로 복사해서 넣고 꺼냄)
+    """
+
+    def __init__(self, maxsize: int = 64):
+        """
+        Args:
+            maxsize: 최대 항목 수 (0이면 캐시 사용 안 함)
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시 조회 (없으면 None)"""
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """캐시 저장 (가장 오래 사용되지 않은 항목부터 제거)"""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """캐시 및 통계 초기화"""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 통계"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,329 @@
+"""
+OLE 복합 파일(CFB) 리더
+
+HWP 파일을 읽기 위한 최소한의 읽기 전용 CFB 리더.
+파일 전체를 mmap으로 열고, 섹터 체인은 스트림을 읽을 때 FAT를 따라가며 해석한다.
+섹터가 연속되어 있으면 스트림 내용을 복사하지 않고 memoryview로 반환한다.
+
+olefile.OleFileIO 중 HwpParser가 사용하는 부분(exists, listdir, openstream, close)과 호환된다.
+"""
+
+import io
+import mmap
+import os
+import struct
+from typing import Dict, List, Optional, Union
+
+MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+# 특수 섹터 번호
+MAXREGSECT = 0xFFFFFFFA
+ENDOFCHAIN = 0xFFFFFFFE
+FREESECT = 0xFFFFFFFF
+NOSTREAM = 0xFFFFFFFF
+
+# 디렉터리 엔트리 종류
+STGTY_STORAGE = 1
+STGTY_STREAM = 2
+STGTY_ROOT = 5
+
+_HEADER = struct.Struct('<8s16sHHHHH6sIIIIIIIII')
+_DIR_ENTRY = struct.Struct('<64sHBBIII16sIQQIQ')
+_UINT32 = struct.Struct('<I')
+
+
+class CompoundFileError(Exception):
+    """CFB 형식 오류"""
+    pass
+
+
+class _DirEntry:
+    """디렉터리 엔트리"""
+
+    __slots__ = ('name', 'entry_type', 'left', 'right', 'child', 'start', 'size', 'kids')
+
+    def __init__(self, name: str, entry_type: int, left: int, right: int, child: int,
+                 start: int, size: int):
+        self.name = name
+        self.entry_type = entry_type
+        self.left = left
+        self.right = right
+        self.child = child
+        self.start = start
+        self.size = size
+        self.kids: List['_DirEntry'] = []
+
+
+class CompoundFile:
+    """mmap 기반 읽기 전용 CFB 리더
+
+    Args:
+        source: 파일 경로, mmap, bytes류 또는 fileno()가 있는 바이너리 파일 객체
+    """
+
+    def __init__(self, source):
+        self._file = None
+        self._mmap = None
+
+        if isinstance(source, (str, os.PathLike)):
+            self._file = open(source, 'rb')
+            try:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            except Exception:
+                self._file.close()
+                raise
+            buffer = self._mmap
+        elif isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+            buffer = source
+        elif hasattr(source, 'fileno'):
+            self._mmap = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+            buffer = self._mmap
+        else:
+            raise CompoundFileError('지원하지 않는 입력 형식')
+
+        self._data = memoryview(buffer)
+        try:
+            self._load_header()
+            self._load_directory()
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self) -> 'CompoundFile':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """파일 닫기 (반환한 memoryview가 남아 있으면 mmap 해제는 GC에 맡김)"""
+        data, self._data = self._data, None
+        if data is not None:
+            data.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # ------------------------------------------------------------------
+    # 헤더 / FAT / 디렉터리
+    # ------------------------------------------------------------------
+
+    def _load_header(self) -> None:
+        """헤더와 DIFAT(FAT 섹터 목록) 로드"""
+        data = self._data
+        if len(data) < 512:
+            raise CompoundFileError('파일이 너무 작음')
+
+        (magic, _, _, major, byte_order, sector_shift, mini_shift, _, _,
+         num_fat, first_dir, _, mini_cutoff, first_mini_fat, num_mini_fat,
+         first_difat, num_difat) = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise CompoundFileError('OLE 시그니처가 아님')
+        if byte_order != 0xFFFE or sector_shift not in (9, 12) or mini_shift != 6:
+            raise CompoundFileError('지원하지 않는 CFB 헤더')
+
+        self.sector_size = 1 << sector_shift
+        self.mini_sector_size = 1 << mini_shift
+        self.mini_cutoff = mini_cutoff
+        self._sector_shift = sector_shift
+        self._mini_shift = mini_shift
+        self._max_chain = len(data) // self.sector_size + 1  # 순환 체인 방지
+
+        # DIFAT: 헤더의 109개 + DIFAT 섹터 체인
+        fat_sectors = list(struct.unpack_from('<109I', data, 76))
+        per_sector = self.sector_size // 4
+        sector = first_difat
+        for _ in range(num_difat):
+            if sector > MAXREGSECT:
+                break
+            values = struct.unpack_from(f'<{per_sector}I', data, self._offset(sector))
+            fat_sectors.extend(values[:-1])
+            sector = values[-1]
+
+        self._fat_offsets = [self._offset(s) for s in fat_sectors[:num_fat] if s <= MAXREGSECT]
+        self._fat_per_sector = per_sector
+        self._first_dir = first_dir
+        self._first_mini_fat = first_mini_fat
+        self._num_mini_fat = num_mini_fat
+        self._mini_fat_offsets: Optional[List[int]] = None
+        self._mini_stream_offsets: Optional[List[int]] = None
+
+    def _offset(self, sector: int) -> int:
+        """섹터 번호 -> 파일 오프셋 (헤더가 첫 섹터 자리를 차지)"""
+        return (sector + 1) << self._sector_shift
+
+    def _next_sector(self, sector: int) -> int:
+        """FAT에서 다음 섹터 번호 조회"""
+        idx, pos = divmod(sector, self._fat_per_sector)
+        if idx >= len(self._fat_offsets):
+            raise CompoundFileError(f'FAT 범위를 벗어난 섹터: {sector}')
+        return _UINT32.unpack_from(self._data, self._fat_offsets[idx] + pos * 4)[0]
+
+    def _chain(self, start: int) -> List[int]:
+        """섹터 체인 (시작 섹터부터 ENDOFCHAIN까지)"""
+        sectors = []
+        sector = start
+        while sector <= MAXREGSECT:
+            sectors.append(sector)
+            if len(sectors) > self._max_chain:
+                raise CompoundFileError('순환 섹터 체인')
+            sector = self._next_sector(sector)
+        return sectors
+
+    def _load_directory(self) -> None:
+        """디렉터리 엔트리 로드 및 저장소 트리 구성"""
+        data = self._data
+        entries: List[_DirEntry] = []
+        for sector in self._chain(self._first_dir):
+            base = self._offset(sector)
+            for pos in range(base, min(base + self.sector_size, len(data) - 127), 128):
+                (name_raw, name_len, entry_type, _, left, right, child, _, _, _, _,
+                 start, size) = _DIR_ENTRY.unpack_from(data, pos)
+                if self.sector_size == 512:
+                    size &= 0xFFFFFFFF  # v3: 상위 DWORD는 무시
+                name = name_raw[:max(name_len - 2, 0)].decode('utf-16-le', 'replace')
+                entries.append(_DirEntry(name, entry_type, left, right, child, start, size))
+
+        if not entries or entries[0].entry_type != STGTY_ROOT:
+            raise CompoundFileError('루트 엔트리 없음')
+        self._entries = entries
+        self.root = entries[0]
+
+        # 저장소별 자식 목록 (olefile과 같이 이름순 정렬)
+        visited = set()
+        stack = [self.root]
+        while stack:
+            storage = stack.pop()
+            kids = []
+            self._collect_kids(storage.child, kids, visited)
+            kids.sort(key=lambda e: e.name)
+            storage.kids = kids
+            stack.extend(e for e in kids if e.entry_type == STGTY_STORAGE)
+
+        # 경로 조회 테이블 (대소문자 무시)
+        self._paths: Dict[str, _DirEntry] = {}
+        self._index_paths(self.root, '')
+
+    def _collect_kids(self, sid: int, kids: List[_DirEntry], visited: set) -> None:
+        """레드-블랙 트리(형제 목록) 순회"""
+        stack = [sid]
+        while stack:
+            sid = stack.pop()
+            if sid == NOSTREAM or sid >= len(self._entries) or sid in visited:
+                continue
+            visited.add(sid)
+            entry = self._entries[sid]
+            if entry.entry_type not in (STGTY_STORAGE, STGTY_STREAM):
+                continue
+            kids.append(entry)
+            stack.append(entry.left)
+            stack.append(entry.right)
+
+    def _index_paths(self, storage: _DirEntry, prefix: str) -> None:
+        for entry in storage.kids:
+            path = prefix + entry.name.lower()
+            self._paths[path] = entry
+            if entry.entry_type == STGTY_STORAGE:
+                self._index_paths(entry, path + '/')
+
+    # ------------------------------------------------------------------
+    # olefile 호환 API
+    # ------------------------------------------------------------------
+
+    def _find(self, path: Union[str, List[str]]) -> Optional[_DirEntry]:
+        if not isinstance(path, str):
+            path = '/'.join(path)
+        return self._paths.get(path.lower())
+
+    def exists(self, path: Union[str, List[str]]) -> bool:
+        """스트림/저장소 존재 여부 (대소문자 무시)"""
+        return self._find(path) is not None
+
+    def listdir(self) -> List[List[str]]:
+        """스트림 경로 목록 (olefile.OleFileIO.listdir과 같은 순서)"""
+        files: List[List[str]] = []
+        self._list(files, [], self.root)
+        return files
+
+    def _list(self, files: List[List[str]], prefix: List[str], storage: _DirEntry) -> None:
+        for entry in storage.kids:
+            if entry.entry_type == STGTY_STORAGE:
+                self._list(files, prefix + [entry.name], entry)
+            else:
+                files.append(prefix + [entry.name])
+
+    def openstream(self, path: Union[str, List[str]]) -> io.BytesIO:
+        """스트림을 파일 객체로 열기"""
+        return io.BytesIO(self.read_stream(path))
+
+    def read_stream(self, path: Union[str, List[str]]) -> Union[memoryview, bytes]:
+        """스트림 전체 내용
+
+        섹터가 연속되어 있으면 mmap의 memoryview(복사 없음), 아니면 bytes를 반환한다.
+        반환된 memoryview는 close() 이후 사용할 수 없다.
+        """
+        entry = self._find(path)
+        if entry is None or entry.entry_type != STGTY_STREAM:
+            raise OSError(f'스트림 없음: {path}')
+        if entry.size == 0:
+            return b''
+        if entry.size < self.mini_cutoff:
+            offsets = self._mini_offsets(entry.start)
+            unit = self.mini_sector_size
+        else:
+            offsets = [self._offset(s) for s in self._chain(entry.start)]
+            unit = self.sector_size
+        return self._gather(offsets, unit, entry.size)
+
+    # ------------------------------------------------------------------
+    # 스트림 조립
+    # ------------------------------------------------------------------
+
+    def _gather(self, offsets: List[int], unit: int, size: int) -> Union[memoryview, bytes]:
+        """섹터 오프셋 목록으로 스트림 조립 (연속이면 슬라이스 하나)"""
+        data = self._data
+        if not offsets:
+            raise CompoundFileError('빈 섹터 체인')
+        start = offsets[0]
+        if all(offsets[i] == start + i * unit for i in range(1, len(offsets))):
+            if start + size > len(data):
+                raise CompoundFileError('스트림이 파일 끝을 넘음')
+            return data[start:start + size]
+
+        chunks = b''.join(data[off:off + unit] for off in offsets)
+        if len(chunks) < size:
+            raise CompoundFileError('스트림이 파일 끝을 넘음')
+        return chunks[:size]
+
+    def _mini_offsets(self, start: int) -> List[int]:
+        """미니 섹터 체인 -> 파일 오프셋 목록"""
+        if self._mini_fat_offsets is None:
+            self._mini_fat_offsets = [self._offset(s) for s in self._chain(self._first_mini_fat)]
+            self._mini_stream_offsets = [self._offset(s) for s in self._chain(self.root.start)]
+
+        data = self._data
+        per_sector = self.sector_size // 4
+        minis_per_sector = self.sector_size >> self._mini_shift
+        max_chain = len(self._mini_fat_offsets) * per_sector
+
+        offsets = []
+        sector = start
+        while sector <= MAXREGSECT:
+            idx, pos = divmod(sector, minis_per_sector)
+            if idx >= len(self._mini_stream_offsets):
+                raise CompoundFileError(f'미니 스트림 범위를 벗어난 섹터: {sector}')
+            offsets.append(self._mini_stream_offsets[idx] + (pos << self._mini_shift))
+            if len(offsets) > max_chain:
+                raise CompoundFileError('순환 미니 섹터 체인')
+
+            fat_idx, fat_pos = divmod(sector, per_sector)
+            if fat_idx >= len(self._mini_fat_offsets):
+                raise CompoundFileError(f'미니 FAT 범위를 벗어난 섹터: {sector}')
+            sector = _UINT32.unpack_from(data, self._mini_fat_offsets[fat_idx] + fat_pos * 4)[0]
+        return offsets
@@ -0,0 +1,45 @@
+"""
+텍스트 필터
+
+HWP/HWPX 파서가 공통으로 사용하는 문자 필터 (사전 컴파일된 정규식)
+"""
+
+import re
+
+# HWP 그래픽 요소 마커 (선, 도형 등)
+# 실제로는 ASCII 코드의 조합(예: 'pn' -> 0x6e70)이 한자로 오인된 것들
+# 湰(0x6e70), 桤(0x6824), 湯(0x6e6f), 湷(0x6e37), 湰(0x6e30), (0xf0e8), 捤(0x6364), 獥(0x7365)
+GRAPHIC_MARKERS = frozenset({
+    0x6e70, 0x6824, 0x6e6f, 0x6e37,
+    0x6e30, 0xf0e8, 0x6364, 0x7365
+})
+
+_GRAPHIC_MARKER_CLASS = ''.join(map(chr, sorted(GRAPHIC_MARKERS)))
+
+# UTF-16 서로게이트 문자 (U+D800 ~ U+DFFF)
+# HWP의 PUA 문자가 잘못 파싱되어 서로게이트로 나타날 수 있음
+_SURROGATE_CLASS = '\ud800-\udfff'
+
+# HWP: 서로게이트 + 파싱 오류로 나타나는 특정 CJK 한자 潴(U+6F74), 景(U+666F), 慴(U+6174)
+# 주의: 한글 옛 자모(ᄒᆞᆫ글 등)는 원본 문서의 정상 텍스트이므로 유지
+_HWP_NOISE = re.compile(f'[{_SURROGATE_CLASS}潴景慴]')
+
+# HWPX: 서로게이트 + 그래픽 마커 + PUA 영역(U+E000 ~ U+F8FF)의 다른 마커들
+_HWPX_NOISE = re.compile(f'[{_SURROGATE_CLASS}{_GRAPHIC_MARKER_CLASS}\ue000-\uf8ff]')
+
+_GRAPHIC_MARKER = re.compile(f'[{_GRAPHIC_MARKER_CLASS}]')
+
+
+def clean_hwp_text(text: str) -> str:
+    """HWP에서 추출한 텍스트 정리 - 파싱 오류로 생긴 이상한 문자만 제거"""
+    return _HWP_NOISE.sub('', text)
+
+
+def clean_hwpx_text(text: str) -> str:
+    """HWPX t 요소 텍스트 정리 - 특수 마커 및 그래픽 앵커 제거"""
+    return _HWPX_NOISE.sub('', text)
+
+
+def is_valid_paragraph_text(text: str) -> bool:
+    """문단 유효성 검사 - 그래픽 마커가 포함된 짧은 문단(3자 이하) 제외"""
+    return len(text) > 3 or _GRAPHIC_MARKER.search(text) is None
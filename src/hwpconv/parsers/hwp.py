@@ -6,18 +6,129 @@ HWP (OLE Compound Document) 형식 파일을 파싱하는 모듈
 본 제품은 한글과컴퓨터의 한글 문서 파일(.hwp) 공개 문서를 참고하여 개발하였습니다.
 """
 
+import io
+import re
 import struct
-import zlib
-from typing import Dict, List, Optional, Set, Tuple
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import olefile
 
-from .base import BaseParser
+from . import accel, inflate
+from .base import BaseParser, ParseProfile, ParserSource, open_source, reopen_source
+from .cache import StyleTableCache, copy_tables, stream_digest
+from .cfb import CompoundFile
+from .filters import clean_hwp_text, is_valid_paragraph_text
 from ..models import (
     Document, Section, Paragraph, TextRun, Table, TableRow, TableCell,
     TextStyle, Footnote, HeadingLevel, Image
 )
 
+# 사전 컴파일된 구조체 (레코드 헤더 및 고정 길이 필드 디코딩)
+_UINT16 = struct.Struct('<H')
+_UINT32 = struct.Struct('<I')
+_CHAR_SHAPE_POS = struct.Struct('<II')  # PARA_CHAR_SHAPE (위치, 글자모양 ID)
+
+# PARA_TEXT에서 제어문자(U+0000~U+001F)가 아닌 WCHAR의 연속 구간
+# 2바이트 단위로만 매칭하므로 구간 끝은 항상 WCHAR 경계에 정렬된다.
+_TEXT_RUN = re.compile(rb'(?:[\x20-\xff][\x00-\xff]|[\x00-\x1f][\x01-\xff])*')
+
+# 디코딩한 PARA_TEXT 문자열에서 제어문자 위치 검색용
+_CTRL_CHAR = re.compile('[\x00-\x1f]')
+
+# 글자 모양이 없는 텍스트 런이 공유하는 기본 스타일 (TextStyle은 불변)
+_DEFAULT_STYLE = TextStyle()
+
+
+class _RecordTree(list):
+    """레코드 리스트 + 하위 트리 끝 색인
+    
+    한 번의 순회로 각 레코드의 하위 트리 끝(end)을 계산한다.
+    end[i]는 i 이후 처음으로 level이 records[i]의 level 이하인 레코드의 인덱스로,
+    표/그림 파서가 하위 레코드를 다시 훑지 않고 바로 건너뛸 때 사용한다.
+    """
+    
+    def __init__(self, records: Iterable[Tuple[int, memoryview, int]]):
+        super().__init__(records)
+        count = len(self)
+        end = [count] * count
+        stack: List[int] = []
+        
+        for idx, (_, _, level) in enumerate(self):
+            while stack and self[stack[-1]][2] >= level:
+                end[stack.pop()] = idx
+            stack.append(idx)
+        
+        self.end = end
+
+
+def _open_ole(source, backend: str = 'olefile'):
+    """OLE 복합 파일 열기
+    
+    Args:
+        source: 파일 경로 또는 파일 내용 (bytes, memoryview, 파일 객체, mmap)
+        backend: 'olefile' 또는 'mmap' (mmap 리더로 열 수 없는 입력은 olefile로 대체)
+    """
+    if backend == 'mmap':
+        try:
+            return CompoundFile(source)
+        except Exception:
+            pass
+    return olefile.OleFileIO(open_source(source))
+
+
+class _BinDataStorage:
+    """BinData 스트림 지연 로딩
+    
+    파싱 중에는 열려 있는 OLE 파일에서 읽는다. 본문에서 참조하는 그림은 파싱 중에 바로 읽으므로
+    파싱이 끝난 뒤(detach 이후)에는 참조되지 않은 BinData만 남는다. 이들은 원본 파일을 한 번만
+    다시 열어 공유하고, 남은 스트림을 모두 읽으면 닫는다. (다시 열 수 없는 파일 객체 입력은
+    파서가 파싱 중에 모두 읽음)
+    """
+    
+    def __init__(self, source, ole, is_compressed: bool, backend: str = 'olefile'):
+        self._source = source
+        self._ole = ole
+        self._is_compressed = is_compressed
+        self._backend = backend
+        self._detached = False
+        self._pending: Set[str] = set()  # 아직 읽지 않은 스트림 경로
+    
+    def loader(self, path: str) -> Callable[[], bytes]:
+        """Image.loader로 쓸 읽기 함수 (경로를 읽기 대기 목록에 등록)"""
+        self._pending.add(path)
+        return partial(self.read, path)
+    
+    def detach(self) -> None:
+        """파싱 종료: 파싱용 OLE 핸들 참조 해제 (이후 읽기는 다시 연 핸들 하나를 공유)"""
+        self._ole = None
+        self._detached = True
+    
+    def close(self) -> None:
+        """detach 이후 다시 연 OLE 핸들 닫기"""
+        if self._detached and self._ole is not None:
+            self._ole.close()
+            self._ole = None
+    
+    def read(self, path: str) -> bytes:
+        """BinData 스트림 읽기 (압축 해제 포함, 읽기 실패 시 예외 발생)"""
+        self._pending.discard(path)
+        try:
+            if self._ole is None:
+                self._ole = _open_ole(self._source, self._backend)
+            data = self._ole.openstream(path).read()
+        finally:
+            if self._detached and not self._pending:
+                self.close()
+        
+        # 압축 해제 시도
+        if self._is_compressed:
+            data = inflate.inflate_or_raw(data)
+        return data
+
 
 class HwpParser(BaseParser):
     """HWP (OLE Compound Document) 파일 파서"""
@@ -40,6 +151,7 @@ class HwpParser(BaseParser):
     HWPTAG_CTRL_HEADER = 21
     HWPTAG_LIST_HEADER = 24  # Standard
     HWPTAG_TABLE = 27        # 77 - 50 (normalized from shifted tag)
+    HWPTAG_SHAPE_COMPONENT_PICTURE = 85
     HWPTAG_FOOTNOTE_SHAPE = 74 # ?
     
     # Shifted tags (+50)
@@ -76,6 +188,8 @@ class HwpParser(BaseParser):
     CTRL_ID_TABLE = b' lbt'     # 'tbl ' reversed
     CTRL_ID_FOOTNOTE = b'  nf'  # 'fn  ' reversed
     CTRL_ID_ENDNOTE = b'  ne'   # 'en  ' reversed
+    CTRL_ID_PIC = b'cip$'       # '$pic' reversed
+    CTRL_ID_GSO = b' osg'       # 'gso ' reversed
     
     @staticmethod
     def normalize_tag(tag_id: int) -> int:
@@ -89,21 +203,75 @@ class HwpParser(BaseParser):
             return tag_id - 50
         return tag_id
     
-    def __init__(self):
+    # 10비트 TagID → 정규화된 TagID 조회 테이블 (레코드마다 normalize_tag 호출 방지)
+    NORMALIZED_TAGS: Tuple[int, ...] = tuple(map(normalize_tag.__func__, range(1024)))
+    
+    # 스트리밍 모드에서 한 번에 읽고 압축 해제할 최대 바이트 수
+    STREAM_CHUNK_SIZE = 64 * 1024
+    
+    # DocInfo 서식 테이블 캐시 (프로세스 전역, 원본 DocInfo 스트림 digest 기준, None이면 사용 안 함)
+    doc_info_cache: Optional[StyleTableCache] = StyleTableCache(maxsize=64)
+    
+    # NumPy 가속 사용 여부 (NumPy가 설치되어 있으면 기본 사용)
+    use_numpy: bool = accel.HAS_NUMPY
+    
+    def __init__(self, streaming: bool = False, workers: Optional[int] = None,
+                 profile: Optional[ParseProfile] = None, ole_backend: str = 'olefile'):
+        """
+        Args:
+            streaming: BodyText 섹션을 청크 단위로 압축 해제하면서 바로 레코드를 파싱할지 여부
+                (압축 해제된 섹션 전체 대신 청크 하나와 최상위 문단 하나 분량의 레코드만 메모리에 유지)
+            workers: 섹션을 병렬로 파싱할 프로세스 수 (None 또는 1 이하면 순차 파싱)
+            profile: 선택적 파싱 프로파일 (None이면 모든 개체 파싱)
+            ole_backend: OLE 리더 ('olefile' 또는 'mmap')
+                'mmap'은 내장 CFB 리더로 파일을 mmap하여 스트림을 복사 없이 읽으며,
+                열 수 없는 입력은 olefile로 대체한다.
+        """
+        self.streaming = streaming
+        self.workers = workers
+        self.profile = profile or ParseProfile()
+        self.ole_backend = ole_backend
         self.char_shapes: Dict[int, TextStyle] = {}
         self.para_shapes: Dict[int, dict] = {}
         self.font_names: Dict[int, str] = {}
+        self._char_shape_table: List[TextStyle] = []  # 글자 모양 ID -> TextStyle (char_shapes의 배열판)
         self._is_compressed: bool = True
         self._footnote_counter: int = 0
         self._base_font_size: int = 1000  # 기본 글자 크기 (10pt)
         self._image_counter: int = 0  # 이미지 삽입 순서 추적
         self._analyze_mode: str = "none"  # 이미지 분석 모드 (none/brief/detailed)
+        self._bin_data: Optional[_BinDataStorage] = None  # BinData 지연 로딩
+        
+        # 레코드 TagID별 처리기 (섹션 워커)
+        self._record_handlers = {
+            self.HWPTAG_PARA_HEADER: self._handle_para_header,
+            self.HWPTAG_CTRL_HEADER: self._handle_ctrl_header,
+        }
+        # CTRL_HEADER 컨트롤 ID별 처리기
+        self._ctrl_handlers = {
+            self.CTRL_ID_TABLE: self._handle_table,
+            self.CTRL_ID_PIC: self._handle_picture,
+            self.CTRL_ID_GSO: self._handle_picture,
+        }
+        # 프로파일에서 제외한 컨트롤은 하위 레코드 전체를 건너뜀
+        if not self.profile.tables:
+            self._ctrl_handlers[self.CTRL_ID_TABLE] = self._skip_subtree
+        if not self.profile.images:
+            # 그림만 넣지 않고 하위 레코드는 기본 프로파일과 똑같이 소비 (글상자 문단이 본문으로 새지 않도록)
+            self._ctrl_handlers[self.CTRL_ID_PIC] = self._consume_picture
+            self._ctrl_handlers[self.CTRL_ID_GSO] = self._consume_picture
+        # drawings는 gso 처리기를 바꾸지 않는다. HWP의 일반 그림도 gso 개체이고,
+        # 그림이 없는 gso(도형, 글상자)의 하위 트리는 그림 처리기가 이미 통째로 소비한다.
+        if not self.profile.footnotes:
+            self._ctrl_handlers[self.CTRL_ID_FOOTNOTE] = self._skip_subtree
+            self._ctrl_handlers[self.CTRL_ID_ENDNOTE] = self._skip_subtree
 
-    def parse(self, file_path: str, analyze_mode: str = "none") -> Document:
+    def parse(self, file_path: ParserSource, analyze_mode: str = "none") -> Document:
         """HWP 파일 파싱
 
         Args:
-            file_path: HWP 파일 경로
+            file_path: HWP 파일 경로 또는 파일 내용 (bytes, memoryview, 파일 객체, mmap)
+                (파일 객체 입력은 이미지를 파싱 중에 모두 읽으므로 파싱 후 닫아도 됨)
             analyze_mode: 이미지 분석 모드 ('none', 'brief', 'detailed')
 
         Returns:
@@ -113,15 +281,17 @@ class HwpParser(BaseParser):
         self._analyze_mode = analyze_mode
         
         # 인스턴스 변수 초기화 (재사용 시 이전 결과 제거)
-        self.char_shapes.clear()
-        self.para_shapes.clear()
-        self.font_names.clear()
+        # (캐시된 테이블을 공유할 수 있으므로 clear() 대신 새 dict 할당)
+        self.char_shapes = {}
+        self.para_shapes = {}
+        self.font_names = {}
         self._is_compressed = True
         self._footnote_counter = 0
         self._base_font_size = 1000
         self._image_counter = 0
         
-        ole = olefile.OleFileIO(file_path)
+        ole = _open_ole(file_path, self.ole_backend)
+        self._bin_data = None
         
         try:
             # 0. FileHeader에서 압축 여부 확인
@@ -130,6 +300,8 @@ class HwpParser(BaseParser):
             # 1. DocInfo에서 서식 정보 로드
             self._load_doc_info(ole)
             
+            self._build_char_shape_table()
+            
             # 2. 기본 글자 크기 결정 (첫 번째 CharShape 기준)
             if self.char_shapes:
                 first_shape = self.char_shapes.get(0)
@@ -137,27 +309,23 @@ class HwpParser(BaseParser):
                     self._base_font_size = first_shape.font_size
             
             # 3. BinData에서 이미지 먼저 추출 (섹션 파싱 전)
-            self._extract_images(ole, doc)
+            if self.profile.images:
+                self._extract_images(ole, doc, file_path)
             
             # 4. Section 스트림들 파싱
-            entries = ole.listdir()
-            section_entries = sorted([
-                '/'.join(entry) for entry in entries
-                if len(entry) == 2 and entry[0] == 'BodyText' and entry[1].startswith('Section')
-            ])
+            section_entries = self._section_paths(ole)
             
-            for path in section_entries:
-                data = ole.openstream(path).read()
-                
-                # 압축 해제 시도
-                if self._is_compressed:
-                    try:
-                        data = zlib.decompress(data, -15)  # raw deflate
-                    except zlib.error:
-                        pass  # 압축 안 된 경우
-                
-                section = self._parse_section(data, doc)
-                doc.sections.append(section)
+            if self.workers and self.workers > 1 and len(section_entries) > 1:
+                doc.sections.extend(self._parse_sections_parallel(ole, section_entries, doc))
+            else:
+                for path in section_entries:
+                    section = self._parse_section_stream(self._open_section(ole, path), doc)
+                    doc.sections.append(section)
+            
+            # 다시 열 수 없는 입력(파일 객체)은 닫힌 뒤에 읽을 수 없으므로 남은 이미지도 지금 읽음
+            if self._bin_data is not None and reopen_source(file_path) is None:
+                for image in list(doc.images.values()):
+                    self._load_image(image, doc)
             
             # 5. 인라인으로 삽입되지 않은 이미지를 문서 끝에 추가
             # (배포용 파일이나 gso/$pic이 없는 경우 대비)
@@ -183,12 +351,22 @@ class HwpParser(BaseParser):
                         doc.sections[-1].elements.append(doc.images[image_id])
             
         finally:
+            # 참조되지 않은 이미지는 이후 접근 시 원본 파일을 한 번 다시 열어서 읽음
+            if self._bin_data is not None:
+                self._bin_data.detach()
+                self._bin_data = None
             ole.close()
         
         return doc
     
-    def _extract_images(self, ole, doc: Document) -> None:
-        """BinData 스트림에서 이미지 추출"""
+    def _extract_images(self, ole, doc: Document, source=None) -> None:
+        """BinData 스트림에서 이미지 목록 구성
+        
+        이미지 바이너리는 바로 읽지 않는다. 본문에서 참조하는 그림은 섹션 파싱 중에
+        OLE 파일이 열려 있는 동안 읽고, 나머지는 Image.data에 처음 접근할 때 읽는다.
+        (이미지 분석 모드에서는 분석을 위해 즉시 읽음)
+        """
+        self._bin_data = _BinDataStorage(source, ole, self._is_compressed, self.ole_backend)
         image_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tif', '.tiff', '.wmf', '.emf'}
         
         for entry in ole.listdir():
@@ -203,14 +381,7 @@ class HwpParser(BaseParser):
             
             try:
                 path = '/'.join(entry)
-                image_data = ole.openstream(path).read()
-                
-                # 압축 해제 시도
-                if self._is_compressed:
-                    try:
-                        image_data = zlib.decompress(image_data, -15)
-                    except zlib.error:
-                        pass
+                loader = self._bin_data.loader(path)
                 
                 # 이미지 ID
                 image_id = file_name.rsplit('.', 1)[0] if '.' in file_name else file_name
@@ -233,23 +404,26 @@ class HwpParser(BaseParser):
                 # Gemini Vision API로 이미지 분석 (모드가 "on"이고 지원 포맷인 경우만)
                 description = None
                 analyzed = False
+                data = None  # 분석을 위해 읽은 경우 그대로 사용
                 if self._analyze_mode == "on" and mime_type:  # 분석 모드 확인 + None이면 Gemini 미지원 포맷
                     analyzed = True  # 분석 시도함
                     try:
                         from .. import image_analyzer
                         if image_analyzer.is_available():
-                            description = image_analyzer.analyze_image(image_data, mime_type)
+                            data = loader()
+                            description = image_analyzer.analyze_image(data, mime_type)
                     except Exception:
                         pass
 
-                # Image 객체 생성
+                # Image 객체 생성 (읽지 않은 데이터는 지연 로딩)
                 image = Image(
                     id=image_id,
-                    data=image_data,
+                    data=data,
                     format=image_format,
                     alt_text=f'Image: {file_name}',
                     description=description,
-                    analyzed=analyzed
+                    analyzed=analyzed,
+                    loader=loader
                 )
                 
                 doc.images[image_id] = image
@@ -263,10 +437,10 @@ class HwpParser(BaseParser):
             return
         
         try:
-            data = ole.openstream('FileHeader').read()
+            data = self._read_stream(ole, 'FileHeader')
             if len(data) >= 40:
                 # 속성 플래그 (offset 36, DWORD)
-                flags = struct.unpack('<I', data[36:40])[0]
+                flags = _UINT32.unpack_from(data, 36)[0]
                 self._is_compressed = bool(flags & 0x01)  # bit 0: 압축 여부
         except Exception:
             pass
@@ -276,40 +450,39 @@ class HwpParser(BaseParser):
         if not ole.exists('DocInfo'):
             return
         
-        data = ole.openstream('DocInfo').read()
+        data = self._read_stream(ole, 'DocInfo')
         
-        # 압축 해제 시도
+        # 같은 템플릿의 문서는 DocInfo가 동일하므로 이전에 파싱한 테이블 재사용
+        cache = self.doc_info_cache
+        cache_key = None
+        if cache is not None:
+            cache_key = (self._is_compressed, stream_digest(data))
+            cached = cache.get(cache_key)
+            if cached is not None:
+                self.char_shapes, self.para_shapes, self.font_names = copy_tables(cached)
+                return
+        
+        # 압축 해제 시도 (압축 안 된 경우 그대로)
         if self._is_compressed:
-            try:
-                data = zlib.decompress(data, -15)
-            except zlib.error:
-                pass  # 압축 안 된 경우
+            data = inflate.inflate_or_raw(data)
         
-        pos = 0
+        self._parse_doc_info_records(data)
+        
+        if cache_key is not None:
+            cache.put(cache_key, copy_tables((self.char_shapes, self.para_shapes, self.font_names)))
+    
+    def _build_char_shape_table(self) -> None:
+        """글자 모양 ID로 바로 인덱싱할 수 있는 배열 생성 (없는 ID는 기본 스타일)"""
+        size = max(self.char_shapes, default=-1) + 1
+        self._char_shape_table = [self.char_shapes.get(i, _DEFAULT_STYLE) for i in range(size)]
+    
+    def _parse_doc_info_records(self, data: bytes) -> None:
+        """DocInfo 레코드에서 FaceName, CharShape, ParaShape 파싱"""
         face_name_idx = 0
         char_shape_idx = 0
         para_shape_idx = 0
         
-        while pos < len(data) - 4:
-            # 레코드 헤더 읽기
-            header = struct.unpack('<I', data[pos:pos+4])[0]
-            pos += 4
-            
-            tag_id = header & 0x3FF
-            size = (header >> 20) & 0xFFF
-            
-            if size == 0xFFF:
-                if pos + 4 > len(data):
-                    break
-                size = struct.unpack('<I', data[pos:pos+4])[0]
-                pos += 4
-            
-            if pos + size > len(data):
-                break
-            
-            record_data = data[pos:pos+size]
-            pos += size
-            
+        for tag_id, record_data, _ in self._iter_records(data):
             # FACE_NAME (19) 파싱
             if tag_id == self.HWPTAG_FACE_NAME and len(record_data) >= 3:
                 font_name = self._parse_face_name(record_data)
@@ -343,7 +516,7 @@ class HwpParser(BaseParser):
             name_chars = []
             i = name_start
             while i + 1 < len(data):
-                code = struct.unpack('<H', data[i:i+2])[0]
+                code = _UINT16.unpack_from(data, i)[0]
                 if code == 0:
                     break
                 name_chars.append(chr(code))
@@ -355,40 +528,40 @@ class HwpParser(BaseParser):
     
     def _parse_char_shape(self, data: bytes) -> TextStyle:
         """CHAR_SHAPE 레코드 파싱 (HWP 5.0 사양서 기준)"""
-        style = TextStyle()
+        fields = {}
         
         try:
             # 기준 크기 (offset 42-45, HWPUNIT)
             if len(data) >= 46:
-                base_size = struct.unpack('<I', data[42:46])[0]
+                base_size = _UINT32.unpack_from(data, 42)[0]
                 # 실제 pt = base_size / 100
-                style.font_size = base_size / 100
+                fields['font_size'] = base_size / 100
             
             # 속성 (offset 46-49) ← 사양서 정확한 위치!
             if len(data) >= 50:
-                attrs = struct.unpack('<I', data[46:50])[0]
-                style.italic = bool(attrs & 0x01)      # bit 0
-                style.bold = bool(attrs & 0x02)        # bit 1
-                style.underline = bool((attrs >> 2) & 0x03)  # bit 2-3
-                style.strike = bool((attrs >> 18) & 0x07)    # bit 18-20
+                attrs = _UINT32.unpack_from(data, 46)[0]
+                fields['italic'] = bool(attrs & 0x01)      # bit 0
+                fields['bold'] = bool(attrs & 0x02)        # bit 1
+                fields['underline'] = bool((attrs >> 2) & 0x03)  # bit 2-3
+                fields['strike'] = bool((attrs >> 18) & 0x07)    # bit 18-20
             
             # 글꼴 (offset 0-1: 한글 글꼴 ID)
             if len(data) >= 2:
-                hangul_font_id = struct.unpack('<H', data[0:2])[0]
+                hangul_font_id = _UINT16.unpack_from(data, 0)[0]
                 if hangul_font_id in self.font_names:
-                    style.font_name = self.font_names[hangul_font_id]
+                    fields['font_name'] = self.font_names[hangul_font_id]
             
             # 글자 색상 (offset 52-55)
             if len(data) >= 56:
-                color_val = struct.unpack('<I', data[52:56])[0]
+                color_val = _UINT32.unpack_from(data, 52)[0]
                 r = color_val & 0xFF
                 g = (color_val >> 8) & 0xFF
                 b = (color_val >> 16) & 0xFF
-                style.color = f'#{r:02x}{g:02x}{b:02x}'
+                fields['color'] = f'#{r:02x}{g:02x}{b:02x}'
         except Exception:
             pass
         
-        return style
+        return TextStyle(**fields)
     
     def _parse_para_shape(self, data: bytes) -> dict:
         """PARA_SHAPE 레코드 파싱"""
@@ -397,7 +570,7 @@ class HwpParser(BaseParser):
         try:
             if len(data) >= 4:
                 # 속성 플래그
-                attrs = struct.unpack('<I', data[0:4])[0]
+                attrs = _UINT32.unpack_from(data, 0)[0]
                 
                 # 정렬 (bits 0-2)
                 align_code = attrs & 0x07
@@ -414,124 +587,415 @@ class HwpParser(BaseParser):
     
     def _parse_section(self, data: bytes, doc: Document) -> Section:
         """Section 데이터 파싱 (표, 각주 포함)"""
+        return self._parse_section_records(self._iter_records(data), doc)
+    
+    def iter_text(self, file_path: ParserSource) -> Iterator[str]:
+        """본문 텍스트만 문단 단위로 추출 (전체 텍스트 모드)
+        
+        PARA_HEADER/PARA_TEXT 레코드만 읽으며, 표 셀과 각주 안의 문단도 문서 순서대로 포함한다.
+        parse()의 Document.text와 같은 문단을 내도록, 프로파일에서 제외한 컨트롤과
+        그림/그리기 개체($pic, gso - 글상자 포함)의 하위 레코드는 건너뛴다.
+        PrvText(quick_extract)와 달리 문서 전체를 다루고, parse()와 달리 글자 모양, 제목 감지,
+        표 구조, BinData는 처리하지 않는다.
+        
+        Args:
+            file_path: HWP 파일 경로 또는 파일 내용 (bytes, memoryview, 파일 객체, mmap)
+            
+        Yields:
+            str: 문단 텍스트 (빈 문단 제외)
+        """
+        ole = _open_ole(file_path, self.ole_backend)
+        try:
+            self._is_compressed = True
+            self._check_file_header(ole)
+            
+            # 건너뛸 컨트롤 ID (프로파일에서 제외한 컨트롤, parse()가 통째로 소비하는 그림/gso)
+            skip_ctrls = {ctrl_id for ctrl_id, handler in self._ctrl_handlers.items()
+                          if handler == self._skip_subtree}
+            skip_ctrls.update((self.CTRL_ID_PIC, self.CTRL_ID_GSO))
+            
+            # 레코드마다 호출되므로 자주 쓰는 값은 지역 변수로
+            tag_ctrl_header = self.HWPTAG_CTRL_HEADER
+            tag_para_header = self.HWPTAG_PARA_HEADER
+            tag_para_text = self.HWPTAG_PARA_TEXT
+            unpack_uint32 = _UINT32.unpack_from
+            extract_text = self._extract_text_with_ctrls
+            is_valid_paragraph = self._is_valid_paragraph
+            
+            for path in self._section_paths(ole):
+                char_count = 0
+                skip_level = -1  # 프로파일에서 제외한 컨트롤의 level (하위 레코드 건너뜀)
+                for tag_id, record_data, level in self._iter_section_records(self._open_section(ole, path)):
+                    if skip_level >= 0:
+                        if level > skip_level:
+                            continue
+                        skip_level = -1
+                    
+                    if tag_id == tag_para_text:
+                        text = extract_text(record_data, char_count)[0].strip()
+                        if text and is_valid_paragraph(text):
+                            yield text
+                    elif tag_id == tag_para_header:
+                        # 문자 수만 필요하므로 PARA_HEADER 전체를 파싱하지 않음 (bit 31은 마스크)
+                        char_count = (unpack_uint32(record_data, 0)[0] & 0x7FFFFFFF
+                                      if len(record_data) >= 4 else 0)
+                    elif tag_id == tag_ctrl_header and bytes(record_data[:4]) in skip_ctrls:
+                        skip_level = level
+        finally:
+            ole.close()
+    
+    def extract_text(self, file_path: ParserSource) -> str:
+        """본문 전체 텍스트 추출 (문단은 줄바꿈으로 구분)
+        
+        Args:
+            file_path: HWP 파일 경로 또는 파일 내용 (bytes, memoryview, 파일 객체, mmap)
+            
+        Returns:
+            str: 추출된 텍스트
+        """
+        return '\n'.join(self.iter_text(file_path))
+    
+    @staticmethod
+    def _section_paths(ole) -> List[str]:
+        """BodyText/SectionN 스트림 경로 목록 (정렬됨)"""
+        return sorted([
+            '/'.join(entry) for entry in ole.listdir()
+            if len(entry) == 2 and entry[0] == 'BodyText' and entry[1].startswith('Section')
+        ])
+    
+    @staticmethod
+    def _read_stream(ole, path: str):
+        """스트림 전체 읽기 (mmap 리더는 섹터가 연속이면 복사 없이 memoryview 반환)"""
+        read_stream = getattr(ole, 'read_stream', None)
+        if read_stream is not None:
+            return read_stream(path)
+        return ole.openstream(path).read()
+    
+    def _open_section(self, ole, path: str):
+        """섹션 스트림 열기 (스트리밍 모드는 파일 객체, 아니면 스트림 내용 전체)"""
+        if self.streaming:
+            return ole.openstream(path)
+        return self._read_stream(ole, path)
+    
+    def _iter_section_records(self, stream) -> Iterator[Tuple[int, memoryview, int]]:
+        """BodyText/SectionN 스트림 하나의 레코드 순회
+        
+        stream은 파일 객체 또는 이미 읽은 스트림 내용(bytes, memoryview).
+        스트리밍 모드에서는 청크 단위로 압축 해제하면서 레코드를 바로 넘겨준다.
+        """
+        is_data = isinstance(stream, (bytes, bytearray, memoryview))
+        if self.streaming:
+            if is_data:
+                stream = io.BytesIO(stream)
+            return self._iter_records_incremental(self._iter_inflated_chunks(stream))
+        
+        data = stream if is_data else stream.read()
+        
+        # 압축 해제 시도 (압축 안 된 경우 그대로)
+        if self._is_compressed:
+            data = inflate.inflate_or_raw(data)
+        
+        return self._iter_records(data)
+    
+    def _parse_section_stream(self, stream, doc: Document) -> Section:
+        """BodyText/SectionN 스트림 하나를 읽어 파싱"""
+        return self._parse_section_records(self._iter_section_records(stream), doc)
+    
+    def _parse_sections_parallel(self, ole, section_entries: List[str], doc: Document) -> List[Section]:
+        """섹션들을 프로세스 풀에서 병렬 파싱 (결과는 섹션 순서대로 반환)
+        
+        각 섹션은 DocInfo 서식 표와 이미지 목록만 알면 독립적으로 파싱할 수 있다.
+        작업자에는 압축된 스트림 바이트를 보내고 압축 해제도 작업자에서 수행한다.
+        """
+        state = {
+            'streaming': self.streaming,
+            'profile': self.profile,
+            'is_compressed': self._is_compressed,
+            'char_shapes': self.char_shapes,
+            'para_shapes': self.para_shapes,
+            'font_names': self.font_names,
+            'base_font_size': self._base_font_size,
+            'image_ids': list(doc.images),
+        }
+        raw_sections = [ole.openstream(path).read() for path in section_entries]
+        max_workers = min(self.workers, len(raw_sections))
+        
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_section_worker,
+                                 initargs=(state,)) as executor:
+            sections = list(executor.map(_parse_section_in_worker, raw_sections))
+        
+        # 작업자가 만든 이미지 자리표시자를 실제 Image 객체로 교체하고,
+        # 참조된 그림은 OLE 파일이 열려 있는 동안 읽음
+        for section in sections:
+            elements = []
+            for elem in section.elements:
+                if isinstance(elem, Image):
+                    elem = doc.images[elem.id]
+                    if not self._load_image(elem, doc):
+                        continue
+                elif isinstance(elem, Table):
+                    for row in elem.rows:
+                        for cell in row.cells:
+                            cell.image_ids = [
+                                image_id for image_id in cell.image_ids
+                                if image_id not in doc.images or self._load_image(doc.images[image_id], doc)
+                            ]
+                elements.append(elem)
+            section.elements = elements
+        return sections
+    
+    def _parse_section_records(self, records: Iterable[Tuple[int, memoryview, int]],
+                               doc: Document) -> Section:
+        """레코드 시퀀스를 최상위 문단 단위로 묶어 Section 생성"""
         section = Section()
-        records = self._parse_records(data) # records 변수 정의 추가
-        # 섹션의 레코드 파싱 (사용자 가이드 기준)
+        for group in self._group_records(records):
+            self._parse_record_group(group, section, doc)
+        return section
+    
+    def _parse_record_group(self, records: Iterable[Tuple[int, memoryview, int]],
+                            section: Section, doc: Document) -> None:
+        """최상위 문단 하나와 그 하위 레코드들을 파싱하여 section에 추가
+        
+        레코드 TagID로 처리기를 찾아 호출하고, 처리기는 다음에 읽을 인덱스를 반환한다.
+        """
+        handlers = self._record_handlers
+        records = _RecordTree(records)
+        count = len(records)
         i = 0
-        while i < len(records):
-            tag_id, record_data, level = records[i]
+        while i < count:
+            handler = handlers.get(records[i][0])
+            if handler is None:
+                i += 1
+            else:
+                i = handler(records, i, section, doc)
+    
+    def _handle_para_header(self, records: List[Tuple[int, memoryview, int]], i: int,
+                            section: Section, doc: Document) -> int:
+        """PARA_HEADER: 일반 문단"""
+        _, record_data, base_level = records[i]
+        para_info = self._parse_para_header(record_data)
+        text = ''
+        char_positions = []
+        
+        # 다음 레코드들 수집
+        j = i + 1
+        while j < len(records):
+            next_tag, next_data, next_level = records[j]
             
-            # PARA_HEADER: 일반 문단
-            if tag_id == self.HWPTAG_PARA_HEADER:
-                para_info = self._parse_para_header(record_data)
-                text = ''
-                char_positions = []
-                
-                # 다음 레코드들 수집
-                base_level = level
-                j = i + 1
-                while j < len(records):
-                    next_tag, next_data, next_level = records[j]
-                    
-                    # CTRL_HEADER나 다른 PARA_HEADER를 만나면 문단 종료
-                    if next_tag == self.HWPTAG_CTRL_HEADER or next_tag == self.HWPTAG_PARA_HEADER:
-                        break
-                    
-                    # level이 base_level 이하로 떨어지고 PARA_TEXT가 아니면 문단 종료
-                    if next_level <= base_level and next_tag != self.HWPTAG_PARA_TEXT:
-                        break
-                    
-                    if next_tag == self.HWPTAG_PARA_TEXT:
-                        text, ctrl_info = self._extract_text_with_ctrls(next_data, para_info.get('char_count', 0))
-                    elif next_tag == self.HWPTAG_PARA_CHAR_SHAPE:
-                        char_shape_count = para_info.get('char_shape_count', 0)
-                        char_positions = self._parse_para_char_shape(next_data, char_shape_count)
-                    
-                    j += 1
-                
-                # 일반 문단 생성 (테이블은 CTRL_HEADER tbl로만 처리)
-                if text.strip() and self._is_valid_paragraph(text.strip()):
-                    para = self._create_paragraph(text, char_positions, para_info)
-                    section.elements.append(para)
-                i = j
+            # CTRL_HEADER나 다른 PARA_HEADER를 만나면 문단 종료
+            if next_tag == self.HWPTAG_CTRL_HEADER or next_tag == self.HWPTAG_PARA_HEADER:
+                break
             
-            # CTRL_HEADER: 표, 그림 등 객체
-            elif tag_id == self.HWPTAG_CTRL_HEADER:
-                if len(record_data) >= 4:
-                    ctrl_id = struct.unpack('<I', record_data[0:4])[0]
-
-                    if ctrl_id == 0x74626C20:  # 'tbl ' - 표
-                        table, consumed = self._parse_table_from_records_v2(records, i)
-                        if table and not table.is_empty():
-                            section.elements.append(table)
-                        i += consumed
-
-                    elif ctrl_id == 0x24706963:  # '$pic' - 그림
-                        picture_info, consumed = self._parse_picture_from_records(records, i)
-                        if picture_info:
-                            bin_data_id = picture_info.get('bin_data_id', 0)
-                            if bin_data_id > 0:
-                                image_key = f'BIN{bin_data_id:04X}'
-                                if image_key in doc.images:
-                                    section.elements.append(doc.images[image_key])
-                        i += consumed
-
-                    elif ctrl_id == 0x67736F20:  # 'gso ' - General Shape Object (그림 포함)
-                        picture_info, consumed = self._parse_picture_from_records(records, i)
-                        if picture_info:
-                            bin_data_id = picture_info.get('bin_data_id', 0)
-                            if bin_data_id > 0:
-                                image_key = f'BIN{bin_data_id:04X}'
-                                if image_key in doc.images:
-                                    section.elements.append(doc.images[image_key])
-                        i += consumed
-
-                    else:
-                        i += 1
-                else:
-                    i += 1
+            # level이 base_level 이하로 떨어지고 PARA_TEXT가 아니면 문단 종료
+            if next_level <= base_level and next_tag != self.HWPTAG_PARA_TEXT:
+                break
             
-            else:
-                i += 1
+            if next_tag == self.HWPTAG_PARA_TEXT:
+                text, ctrl_info = self._extract_text_with_ctrls(next_data, para_info.get('char_count', 0))
+            elif next_tag == self.HWPTAG_PARA_CHAR_SHAPE:
+                char_shape_count = para_info.get('char_shape_count', 0)
+                char_positions = self._parse_para_char_shape(next_data, char_shape_count)
+            
+            j += 1
         
-        return section
+        # 일반 문단 생성 (테이블은 CTRL_HEADER tbl로만 처리)
+        if text.strip() and self._is_valid_paragraph(text.strip()):
+            para = self._create_paragraph(text, char_positions, para_info)
+            section.elements.append(para)
+        return j
     
-    def _parse_records(self, data: bytes) -> List[Tuple[int, bytes, int]]:
-        """바이트 스트림을 레코드 리스트로 파싱
+    def _handle_ctrl_header(self, records: List[Tuple[int, memoryview, int]], i: int,
+                            section: Section, doc: Document) -> int:
+        """CTRL_HEADER: 컨트롤 ID로 표, 그림 등 객체 처리기 선택"""
+        record_data = records[i][1]
+        if len(record_data) < 4:
+            return i + 1
         
-        Returns:
-            List of (normalized_tag_id, record_data, level)
+        handler = self._ctrl_handlers.get(bytes(record_data[:4]))
+        if handler is None:
+            return i + 1
+        return handler(records, i, section, doc)
+    
+    def _skip_subtree(self, records: _RecordTree, i: int, section: Section, doc: Document) -> int:
+        """프로파일에서 제외한 컨트롤: 하위 레코드 전체 건너뜀"""
+        return records.end[i]
+    
+    def _handle_table(self, records: List[Tuple[int, memoryview, int]], i: int,
+                      section: Section, doc: Document) -> int:
+        """'tbl ' - 표"""
+        table, consumed = self._parse_table_from_records_v2(records, i, doc)
+        if table and not table.is_empty():
+            section.elements.append(table)
+        return i + consumed
+    
+    def _handle_picture(self, records: List[Tuple[int, memoryview, int]], i: int,
+                        section: Section, doc: Document) -> int:
+        """'$pic' - 그림, 'gso ' - General Shape Object (그림 포함)"""
+        picture_info, consumed = self._parse_picture_from_records(records, i)
+        if picture_info:
+            bin_data_id = picture_info.get('bin_data_id', 0)
+            if bin_data_id > 0:
+                image = doc.images.get(f'BIN{bin_data_id:04X}')
+                if image is not None and self._load_image(image, doc):
+                    section.elements.append(image)
+        return i + consumed
+    
+    def _consume_picture(self, records: _RecordTree, i: int, section: Section, doc: Document) -> int:
+        """프로파일에서 그림을 제외한 경우: _handle_picture와 같은 범위를 소비하고 그림만 넣지 않음"""
+        return i + self._parse_picture_from_records(records, i)[1]
+    
+    def _load_image(self, image: Image, doc: Document) -> bool:
+        """본문에서 참조하는 그림은 OLE 파일이 열려 있는 동안 바로 읽음
+        
+        (파싱이 끝난 뒤 Image.data에 접근할 때마다 원본 파일을 다시 열지 않도록)
+        읽을 수 없는 BinData는 문서의 이미지 목록에서 빼고 False를 반환한다.
+        """
+        if self._bin_data is None or image.is_loaded:
+            return True
+        try:
+            image.data  # loader 호출 후 캐시
+        except Exception:
+            doc.images.pop(image.id, None)
+            return False
+        return True
+    
+    def _iter_records(self, data: bytes) -> Iterator[Tuple[int, memoryview, int]]:
+        """바이트 스트림을 레코드 단위로 순회
+        
+        레코드 데이터는 복사하지 않고 원본 버퍼의 memoryview 슬라이스로 반환한다.
+        
+        Yields:
+            (normalized_tag_id, record_data, level)
         """
-        records = []
+        view = memoryview(data)
+        end = len(view)
         pos = 0
+        unpack_header = _UINT32.unpack_from
+        normalized_tags = self.NORMALIZED_TAGS
         
-        while pos < len(data) - 4:
-            header = struct.unpack('<I', data[pos:pos+4])[0]
+        while pos < end - 4:
+            header = unpack_header(view, pos)[0]
             pos += 4
             
-            original_tag_id = header & 0x3FF
-            level = (header >> 10) & 0x3FF
-            size = (header >> 20) & 0xFFF
-            
             # 크기가 0xFFF이면 다음 4바이트가 실제 크기
+            size = header >> 20
             if size == 0xFFF:
-                if pos + 4 > len(data):
+                if pos + 4 > end:
                     break
-                size = struct.unpack('<I', data[pos:pos+4])[0]
+                size = unpack_header(view, pos)[0]
                 pos += 4
             
-            if pos + size > len(data):
+            if pos + size > end:
                 break
             
-            record_data = data[pos:pos+size]
+            # Shifted tag를 표준 tag로 변환 (조회 테이블)
+            yield normalized_tags[header & 0x3FF], view[pos:pos+size], (header >> 10) & 0x3FF
             pos += size
+    
+    def _iter_inflated_chunks(self, stream) -> Iterator[bytes]:
+        """섹션 스트림을 읽으면서 압축 해제된 청크를 순서대로 반환
+        
+        decompressobj의 max_length로 청크 하나의 출력 크기를 제한한다.
+        압축 해제 결과가 나오기 전에 실패하면(또는 스트림이 끝나면) 압축되지 않은 스트림으로 보고
+        그때까지 읽은 원본부터 그대로 반환한다. (inflate_or_raw와 같은 판단)
+        """
+        chunk_size = self.STREAM_CHUNK_SIZE
+        chunk = stream.read(chunk_size)
+        
+        if self._is_compressed:
+            inflater = inflate.decompressobj()  # raw deflate
+            pending: Optional[List[bytes]] = [chunk]  # 첫 출력 전까지 읽은 원본
+            while chunk:
+                try:
+                    inflated = inflater.decompress(chunk, chunk_size)
+                except inflate.InflateError:
+                    if pending is None:
+                        return  # 손상된 스트림: 읽은 데까지만 사용
+                    break  # 압축 안 된 경우
+                if inflated:
+                    pending = None
+                    yield inflated
+                if inflater.eof:
+                    return
+                chunk = inflater.unconsumed_tail
+                if not chunk:
+                    chunk = stream.read(chunk_size)
+                    if pending is not None:
+                        pending.append(chunk)
+            else:
+                tail = inflater.flush()
+                if pending is None or tail:
+                    if tail:
+                        yield tail
+                    return
+            chunk = b''.join(pending)
+        
+        while chunk:
+            yield chunk
+            chunk = stream.read(chunk_size)
+    
+    def _iter_records_incremental(self, chunks: Iterable[bytes]) -> Iterator[Tuple[int, memoryview, int]]:
+        """청크 단위로 들어오는 바이트 스트림을 레코드 단위로 순회
+        
+        완성된 레코드만 잘라서 반환하고 남은 바이트는 다음 청크와 이어 붙인다.
+        종료 조건은 _iter_records와 같다.
+        
+        Yields:
+            (normalized_tag_id, record_data, level)
+        """
+        buffer = bytearray()
+        unpack_header = _UINT32.unpack_from
+        normalized_tags = self.NORMALIZED_TAGS
+        chunks = iter(chunks)
+        finished = False
+        
+        while not finished:
+            chunk = next(chunks, None)
+            if chunk is None:
+                finished = True
+            else:
+                buffer += chunk
             
-            # Shifted tag를 표준 tag로 변환
-            normalized_tag_id = self.normalize_tag(original_tag_id)
+            end = len(buffer)
+            pos = 0
+            while pos < end - 4:
+                header = unpack_header(buffer, pos)[0]
+                data_pos = pos + 4
+                
+                # 크기가 0xFFF이면 다음 4바이트가 실제 크기
+                size = header >> 20
+                if size == 0xFFF:
+                    if data_pos + 4 > end:
+                        break
+                    size = unpack_header(buffer, data_pos)[0]
+                    data_pos += 4
+                
+                if data_pos + size > end:
+                    break
+                
+                # 버퍼는 이후 청크로 다시 쓰이므로 레코드 데이터만 한 번 복사
+                record_data = memoryview(bytes(memoryview(buffer)[data_pos:data_pos+size]))
+                yield normalized_tags[header & 0x3FF], record_data, (header >> 10) & 0x3FF
+                pos = data_pos + size
             
-            records.append((normalized_tag_id, record_data, level))
+            del buffer[:pos]
+    
+    def _group_records(self, records: Iterable[Tuple[int, memoryview, int]]
+                       ) -> Iterator[List[Tuple[int, memoryview, int]]]:
+        """레코드를 최상위 문단(level 0 PARA_HEADER) 단위로 묶기
         
-        return records
+        문단/표/그림 파서는 모두 자기 하위 레코드(level이 더 큰 레코드)만 읽으므로
+        최상위 문단 경계를 넘지 않는다. 섹션 전체 레코드 리스트를 만들지 않고
+        문단 하나 분량만 메모리에 유지한다.
+        """
+        group: List[Tuple[int, memoryview, int]] = []
+        for record in records:
+            if record[2] == 0 and record[0] == self.HWPTAG_PARA_HEADER and group:
+                yield group
+                group = []
+            group.append(record)
+        if group:
+            yield group
     
     def _parse_para_header(self, data: bytes) -> dict:
         """PARA_HEADER 레코드 파싱 (HWP 5.0 사양서 기준)
@@ -550,15 +1014,15 @@ class HwpParser(BaseParser):
 
         try:
             if len(data) >= 4:
-                char_count = struct.unpack('<I', data[0:4])[0]
+                char_count = _UINT32.unpack_from(data, 0)[0]
                 info['char_count'] = char_count & 0x7FFFFFFF
                 info['is_last'] = bool(char_count & 0x80000000)
 
             if len(data) >= 10:
-                info['para_shape_id'] = struct.unpack('<H', data[8:10])[0]
+                info['para_shape_id'] = _UINT16.unpack_from(data, 8)[0]
 
             if len(data) >= 14:
-                info['char_shape_count'] = struct.unpack('<H', data[12:14])[0]
+                info['char_shape_count'] = _UINT16.unpack_from(data, 12)[0]
         except Exception:
             pass
 
@@ -577,71 +1041,105 @@ class HwpParser(BaseParser):
             if count == 0:
                 count = len(data) // 8
             
-            for i in range(count):
-                offset = i * 8
-                if offset + 8 > len(data):
-                    break
-                pos = struct.unpack('<I', data[offset:offset+4])[0]
-                shape_id = struct.unpack('<I', data[offset+4:offset+8])[0]
-                positions.append((pos, shape_id))
+            # 완전한 (위치, ID) 쌍만 한 번에 디코딩
+            count = min(count, len(data) // 8)
+            positions = list(_CHAR_SHAPE_POS.iter_unpack(data[:count * 8]))
         except Exception:
             pass
         
         return positions
     
     def _extract_text_with_ctrls(self, data: bytes, char_count: int = 0) -> Tuple[str, List[Tuple[int, int, bytes]]]:
-        """PARA_TEXT 레코드에서 텍스트와 제어문자 정보 추출 (HWP 5.0 사양서 완전 구현)"""
+        """PARA_TEXT 레코드에서 텍스트와 제어문자 정보 추출 (HWP 5.0 사양서 완전 구현)
+        
+        제어문자 사이의 일반 문자 구간은 정규식으로 한 번에 찾아 utf-16-le로 일괄
+        디코딩한다 (서로게이트 쌍도 올바르게 결합됨). 위치(char_pos)는 WCHAR 단위.
+        서로게이트 쌍이 없는 레코드(대부분)는 레코드 전체를 먼저 디코딩해 문자열에서
+        제어문자를 찾고, 나머지는 바이트 단위로 찾는다. (긴 레코드는 NumPy 사용)
+        """
         chars = []
         ctrl_info = []
         pos = 0
         char_pos = 0
+        size = len(data)
+        match_text_run = _TEXT_RUN.match
+        
+        # 문자열 경로: 디코딩한 문자 수가 WCHAR 수와 같으면 문자열 인덱스 = WCHAR 위치
+        decoded = None
+        if not size & 1:
+            decoded = str(data, 'utf-16-le', 'surrogatepass')
+            if len(decoded) * 2 != size:
+                decoded = None
+        search_ctrl = _CTRL_CHAR.search
+        
+        # NumPy 경로: 제어문자 WCHAR 위치 목록과 다음 후보 인덱스
+        ctrl_units = None
+        if decoded is None and self.use_numpy and size >= accel.MIN_TEXT_BYTES:
+            ctrl_units = accel.find_ctrl_units(data)
+            ctrl_count = len(ctrl_units)
+            text_end = size & ~1
+            k = 0
         
-        while pos < len(data):
+        while pos + 2 <= size:
             if char_count > 0 and char_pos >= char_count:
                 break
-            if pos + 2 > len(data):
-                break
-            
-            char_code = struct.unpack('<H', data[pos:pos+2])[0]
             
-            if char_code < 32:  # 제어문자
-                if char_code in self.CTRL_CHAR_TYPE:
-                    # char 타입: 1 WCHAR, 위치 1개
-                    if char_code == 10:
-                        chars.append('\n')
-                    elif char_code == 13:
-                        pass
-                    elif char_code == 30:
-                        chars.append('\u00A0')
-                    elif char_code == 31:
-                        chars.append(' ')
-                    elif char_code == 24:
-                        chars.append('-')
-                    ctrl_info.append((char_pos, char_code, b''))
-                    pos += 2
-                    char_pos += 1
-                
-                elif char_code in self.CTRL_INLINE_TYPE:
-                    # inline 타입: 8 WCHAR, 위치 1개
-                    ctrl_data = data[pos:pos+16] if pos + 16 <= len(data) else data[pos:]
-                    if char_code == 9:
-                        chars.append('\t')
-                    ctrl_info.append((char_pos, char_code, ctrl_data))
-                    pos += 16
-                    char_pos += 1
-                
-                elif char_code in self.CTRL_EXTENDED_TYPE:
-                    # extended 타입: 8 WCHAR, 위치 차지 안함!
-                    ctrl_data = data[pos:pos+16] if pos + 16 <= len(data) else data[pos:]
-                    ctrl_info.append((char_pos, char_code, ctrl_data))
-                    pos += 16
-                    # char_pos 증가하지 않음 - 중요!
-                
+            # 일반 문자 구간 일괄 디코딩
+            if decoded is not None:
+                found = search_ctrl(decoded, pos >> 1)
+                end = found.start() << 1 if found is not None else size
+            elif ctrl_units is None:
+                end = match_text_run(data, pos).end()
+            else:
+                k = bisect_left(ctrl_units, pos >> 1, k)
+                end = ctrl_units[k] << 1 if k < ctrl_count else text_end
+            if end > pos:
+                run_length = (end - pos) // 2
+                if char_count > 0 and char_pos + run_length > char_count:
+                    run_length = char_count - char_pos
+                    end = pos + run_length * 2
+                if decoded is not None:
+                    chars.append(decoded[pos >> 1:end >> 1])
                 else:
-                    pos += 2
-                    char_pos += 1
+                    chars.append(str(data[pos:end], 'utf-16-le', 'surrogatepass'))
+                pos = end
+                char_pos += run_length
+                continue
+            
+            char_code = data[pos]  # 제어문자 (상위 바이트 0)
+            if char_code in self.CTRL_CHAR_TYPE:
+                # char 타입: 1 WCHAR, 위치 1개
+                if char_code == 10:
+                    chars.append('\n')
+                elif char_code == 13:
+                    pass
+                elif char_code == 30:
+                    chars.append('\u00A0')
+                elif char_code == 31:
+                    chars.append(' ')
+                elif char_code == 24:
+                    chars.append('-')
+                ctrl_info.append((char_pos, char_code, b''))
+                pos += 2
+                char_pos += 1
+            
+            elif char_code in self.CTRL_INLINE_TYPE:
+                # inline 타입: 8 WCHAR, 위치 1개
+                ctrl_data = data[pos:pos+16] if pos + 16 <= len(data) else data[pos:]
+                if char_code == 9:
+                    chars.append('\t')
+                ctrl_info.append((char_pos, char_code, ctrl_data))
+                pos += 16
+                char_pos += 1
+            
+            elif char_code in self.CTRL_EXTENDED_TYPE:
+                # extended 타입: 8 WCHAR, 위치 차지 안함!
+                ctrl_data = data[pos:pos+16] if pos + 16 <= len(data) else data[pos:]
+                ctrl_info.append((char_pos, char_code, ctrl_data))
+                pos += 16
+                # char_pos 증가하지 않음 - 중요!
+            
             else:
-                chars.append(chr(char_code))
                 pos += 2
                 char_pos += 1
         
@@ -651,80 +1149,51 @@ class HwpParser(BaseParser):
     
     def _clean_text(self, text: str) -> str:
         """HWP에서 추출한 텍스트 정리 - 파싱 오류로 생긴 이상한 문자만 제거"""
-        cleaned_chars = []
-        for char in text:
-            code = ord(char)
-
-            # UTF-16 서로게이트 문자 제거 (U+D800 ~ U+DFFF)
-            # HWP의 PUA 문자가 잘못 파싱되어 서로게이트로 나타날 수 있음
-            if 0xD800 <= code <= 0xDFFF:
-                continue
-
-            # HWP 파싱 오류로 나타나는 특정 CJK 한자들만 제거
-            # 潴(U+6F74), 景(U+666F), 慴(U+6174)
-            # 주의: 한글 옛 자모(ᄒᆞᆫ글 등)는 원본 문서의 정상 텍스트이므로 유지
-            if code in {0x6F74, 0x666F, 0x6174}:
-                continue
-
-            cleaned_chars.append(char)
-
-        return ''.join(cleaned_chars)
+        return clean_hwp_text(text)
     
     def _is_valid_paragraph(self, text: str) -> bool:
         """문단 유효성 검사 - HWP 특수 마커 필터링"""
-        # 짧은 문단만 검사
-        if len(text) <= 3:
-            # HWP 그래픽 요소 마커 (선, 도형 등)
-            # 이들은 실제로는 ASCII 코드의 조합(예: 'pn' -> 0x6e70)이 한자로 오인된 것들입니다.
-            # 湰(0x6e70), 桤(0x6824), 湯(0x6e6f), 湷(0x6e37), 捤(0x6364), 獥(0x7365) 등
-            GRAPHIC_MARKERS = {
-                0x6e70, 0x6824, 0x6e6f, 0x6e37, 
-                0x6e30, 0xf0e8, 0x6364, 0x7365
-            }
-            
-            for char in text:
-                if ord(char) in GRAPHIC_MARKERS:
-                    return False
-        return True
+        return is_valid_paragraph_text(text)
     
     def _create_paragraph(self, text: str, char_positions: List[Tuple[int, int]], 
                           para_info: dict) -> Paragraph:
         """텍스트와 스타일 정보로 Paragraph 생성"""
         para = Paragraph()
+        runs = para.runs
         
         if not char_positions:
             # 스타일 정보 없으면 전체 텍스트를 하나의 run으로
-            para.runs.append(TextRun(text=text))
+            runs.append(TextRun(text=text, style=_DEFAULT_STYLE))
         else:
-            # 스타일 적용 위치에 따라 run 분리
-            sorted_positions = sorted(char_positions, key=lambda x: x[0])
-            
-            last_end = 0
-            for i, (start_pos, shape_id) in enumerate(sorted_positions):
-                # 다음 위치 결정
-                if i + 1 < len(sorted_positions):
-                    end_pos = sorted_positions[i + 1][0]
-                else:
-                    end_pos = len(text)
-                
-                if start_pos < len(text):
-                    run_text = text[start_pos:end_pos]
-                    if run_text:
-                        style = self.char_shapes.get(shape_id, TextStyle())
-                        para.runs.append(TextRun(text=run_text, style=style))
+            # 위치 배열 (대부분 이미 정렬되어 있으므로 필요할 때만 정렬, 같은 위치는 기록 순서 유지)
+            starts = [pos for pos, _ in char_positions]
+            if any(a > b for a, b in zip(starts, starts[1:])):
+                char_positions = sorted(char_positions, key=itemgetter(0))
+                starts = [pos for pos, _ in char_positions]
             
             # 첫 번째 위치 이전 텍스트
-            if sorted_positions and sorted_positions[0][0] > 0:
-                first_text = text[:sorted_positions[0][0]]
-                if first_text:
-                    para.runs.insert(0, TextRun(text=first_text))
+            text_len = len(text)
+            if starts[0] > 0 and text_len:
+                runs.append(TextRun(text=text[:starts[0]], style=_DEFAULT_STYLE))
+            
+            # 텍스트 범위 안에서 시작하는 위치들만 run으로 분리
+            table = self._char_shape_table
+            table_size = len(table)
+            last = bisect_left(starts, text_len)
+            for i in range(last):
+                start_pos = starts[i]
+                end_pos = starts[i + 1] if i + 1 < last else text_len
+                if end_pos > start_pos:
+                    shape_id = char_positions[i][1]
+                    style = table[shape_id] if shape_id < table_size else _DEFAULT_STYLE
+                    runs.append(TextRun(text=text[start_pos:end_pos], style=style))
         
         # 제목 레벨 감지 (휴리스틱)
         para.heading_level = self._detect_heading_level(para, para_info)
         
         return para
     
-    def _collect_list_headers_as_table(self, records: List[Tuple[int, bytes, int]], start_idx: int, base_level: int) -> Tuple[Table, int]:
+    def _collect_list_headers_as_table(self, records: List[Tuple[int, memoryview, int]], start_idx: int, base_level: int) -> Tuple[Table, int]:
         """제어문자 11 다음의 LIST_HEADERs를 수집하여 표 생성
         
         이 파일 포맷: PARA_TEXT(ctrl11) → LIST_HEADER들
@@ -843,16 +1312,18 @@ class HwpParser(BaseParser):
                     return HeadingLevel.H2
         return HeadingLevel.NONE
     
-    def _parse_table_from_records_v2(self, records: List[Tuple[int, bytes, int]], start_idx: int) -> Tuple[Table, int]:
+    def _parse_table_from_records_v2(self, records: _RecordTree, start_idx: int,
+                                     doc: Optional[Document] = None) -> Tuple[Table, int]:
         """레코드 리스트에서 표 파싱 (가이드 문서 기준 - level 기반 종료)
 
         구조: CTRL_HEADER → TABLE → LIST_HEADERs → PARAs
-        핵심: level이 base_level 이하로 떨어지면 표 종료
+        핵심: level이 base_level 이하로 떨어지면 표 종료 (= CTRL_HEADER 하위 트리의 끝)
+        doc이 주어지면 셀에서 참조하는 그림을 바로 읽는다.
         """
         if start_idx >= len(records):
             return Table(), 0
 
-        base_level = records[start_idx][2]  # CTRL_HEADER의 level
+        table_end = records.end[start_idx]  # CTRL_HEADER 하위 트리의 끝
         table = Table()
         cells = []
         current_cell = None
@@ -863,18 +1334,14 @@ class HwpParser(BaseParser):
             col_count = 0
             total_cells = 0
 
-            while i < len(records):
+            while i < table_end:
                 tag_id, record_data, level = records[i]
 
-                # level이 base_level 이하면 표 종료 (가이드 핵심 원칙)
-                if level <= base_level:
-                    break
-
                 # TABLE 레코드에서 row/col 읽기
                 if tag_id == self.HWPTAG_TABLE:
                     if len(record_data) >= 8:
-                        row_count = struct.unpack('<H', record_data[4:6])[0]
-                        col_count = struct.unpack('<H', record_data[6:8])[0]
+                        row_count = _UINT16.unpack_from(record_data, 4)[0]
+                        col_count = _UINT16.unpack_from(record_data, 6)[0]
                         table.col_count = col_count
                         total_cells = row_count * col_count
 
@@ -910,7 +1377,7 @@ class HwpParser(BaseParser):
 
                     # 다음 레코드들에서 PARA_TEXT, PARA_CHAR_SHAPE 찾기
                     j = i + 1
-                    while j < len(records):
+                    while j < table_end:
                         next_tag, next_data, next_level = records[j]
 
                         # 문단 종료 조건: 같거나 낮은 레벨의 PARA_HEADER/LIST_HEADER
@@ -918,10 +1385,6 @@ class HwpParser(BaseParser):
                             if next_level <= para_level:
                                 break
 
-                        # level이 base_level 이하면 표 종료
-                        if next_level <= base_level:
-                            break
-
                         if next_tag == self.HWPTAG_PARA_TEXT:
                             text, _ = self._extract_text_with_ctrls(next_data, para_info.get('char_count', 0))
                         elif next_tag == self.HWPTAG_PARA_CHAR_SHAPE:
@@ -930,36 +1393,36 @@ class HwpParser(BaseParser):
                         elif next_tag == self.HWPTAG_CTRL_HEADER:
                             # 셀 내 중첩 개체 처리
                             if len(next_data) >= 4:
-                                nested_ctrl_id = struct.unpack('<I', next_data[0:4])[0]
+                                nested_handler = self._ctrl_handlers.get(bytes(next_data[:4]))
 
-                                # gso 또는 $pic인 경우 이미지 추출
-                                if nested_ctrl_id in (0x67736F20, 0x24706963):  # 'gso ' or '$pic'
+                                # gso 또는 $pic인 경우 이미지 추출 (프로파일에서 제외하면 ID만 기록하지 않음)
+                                if nested_handler in (self._handle_picture, self._consume_picture):
                                     picture_info, pic_consumed = self._parse_picture_from_records(records, j)
-                                    if picture_info:
+                                    if picture_info and nested_handler == self._handle_picture:
                                         bin_data_id = picture_info.get('bin_data_id', 0)
                                         if bin_data_id > 0:
                                             # 이미지 ID 저장 (나중에 처리)
-                                            if 'images' not in current_cell:
-                                                current_cell['images'] = []
-                                            current_cell['images'].append(f'BIN{bin_data_id:04X}')
+                                            image_key = f'BIN{bin_data_id:04X}'
+                                            image = doc.images.get(image_key) if doc is not None else None
+                                            if image is None or self._load_image(image, doc):
+                                                if 'images' not in current_cell:
+                                                    current_cell['images'] = []
+                                                current_cell['images'].append(image_key)
                                     j += pic_consumed
                                     continue
 
                                 # 중첩 테이블인 경우 내부 텍스트 추출
-                                elif nested_ctrl_id == 0x74626C20:  # 'tbl '
-                                    nested_level = next_level
+                                elif nested_handler == self._handle_table:
+                                    nested_end = records.end[j]
                                     nested_texts = []
-                                    j += 1
-                                    while j < len(records):
-                                        n_tag, n_data, n_level = records[j]
-                                        if n_level <= nested_level:
-                                            break
+                                    for k in range(j + 1, nested_end):
+                                        n_tag, n_data, _ = records[k]
                                         # 중첩 테이블 내 PARA_TEXT에서 텍스트 추출
                                         if n_tag == self.HWPTAG_PARA_TEXT:
                                             n_text, _ = self._extract_text_with_ctrls(n_data, 0)
                                             if n_text.strip():
                                                 nested_texts.append(n_text.strip())
-                                        j += 1
+                                    j = nested_end
                                     # 추출된 텍스트를 현재 셀에 추가
                                     if nested_texts:
                                         if text:
@@ -968,14 +1431,8 @@ class HwpParser(BaseParser):
                                             text = ' '.join(nested_texts)
                                     continue
 
-                            # 그 외 중첩 개체 - 스킵
-                            nested_level = next_level
-                            j += 1
-                            while j < len(records):
-                                _, _, skip_level = records[j]
-                                if skip_level <= nested_level:
-                                    break
-                                j += 1
+                            # 그 외 중첩 개체 - 하위 트리 전체 스킵
+                            j = records.end[j]
                             continue  # 중첩 개체 스킵 후 계속
 
                         j += 1
@@ -1015,7 +1472,7 @@ class HwpParser(BaseParser):
         consumed = i - start_idx
         return table, consumed
     
-    def _parse_table_from_ctrl(self, records: List[Tuple[int, bytes, int]], start_idx: int) -> Tuple[Table, int]:
+    def _parse_table_from_ctrl(self, records: List[Tuple[int, memoryview, int]], start_idx: int) -> Tuple[Table, int]:
         """CTRL_HEADER부터 시작하는 표 파싱 (사양서 기준)
         
         구조: CTRL_HEADER(ctrl_id='tbl ') → LIST_HEADER들 (각 셀) → PARA_HEADER/PARA_TEXT들
@@ -1129,7 +1586,7 @@ class HwpParser(BaseParser):
         
         return table, consumed
     
-    def _parse_picture_from_records(self, records: List[Tuple[int, bytes, int]], start_idx: int) -> Tuple[dict, int]:
+    def _parse_picture_from_records(self, records: _RecordTree, start_idx: int) -> Tuple[dict, int]:
         """레코드 리스트에서 그림 파싱 (HWP 5.0 사양서 기준)
 
         구조: CTRL_HEADER($pic) → SHAPE_COMPONENT → SHAPE_COMPONENT_PICTURE
@@ -1151,28 +1608,24 @@ class HwpParser(BaseParser):
         if start_idx >= len(records):
             return None, 0
 
-        base_level = records[start_idx][2]
+        picture_end = records.end[start_idx]  # level이 base_level 이하면 그림 종료
         bin_data_id = 0
 
         try:
             i = start_idx + 1
 
-            while i < len(records):
+            while i < picture_end:
                 tag_id, record_data, level = records[i]
 
-                # level이 base_level 이하면 그림 종료
-                if level <= base_level:
-                    break
-
                 # HWPTAG_SHAPE_COMPONENT_PICTURE = 0x055 = 85
                 # 또는 normalized 값 35 (85 - 50, 만약 shifted라면)
-                if tag_id == 85 or tag_id == 35:
+                if tag_id == self.HWPTAG_SHAPE_COMPONENT_PICTURE or tag_id == 35:
                     # bin_data_id는 offset 71-72에 위치
                     if len(record_data) >= 73:
-                        bin_data_id = struct.unpack('<H', record_data[71:73])[0]
+                        bin_data_id = _UINT16.unpack_from(record_data, 71)[0]
                     # 다른 오프셋 시도 (일부 HWP 버전 호환)
                     elif len(record_data) >= 76:
-                        bin_data_id = struct.unpack('<H', record_data[74:76])[0]
+                        bin_data_id = _UINT16.unpack_from(record_data, 74)[0]
                     break
 
                 i += 1
@@ -1205,7 +1658,7 @@ class HwpParser(BaseParser):
             'data': data[4:]
         }
     
-    def _parse_table_contents(self, data: bytes, records: List[Tuple[int, bytes, int]], start_idx: int) -> Tuple[Table, int]:
+    def _parse_table_contents(self, data: bytes, records: List[Tuple[int, memoryview, int]], start_idx: int) -> Tuple[Table, int]:
         """TABLE 레코드와 후속 셀 데이터로 표 파싱 (사양서 완전 구현)"""
         table = Table()
         consumed = 0
@@ -1292,17 +1745,17 @@ class HwpParser(BaseParser):
         return text
     
     @staticmethod
-    def quick_extract(file_path: str) -> str:
+    def quick_extract(file_path: ParserSource) -> str:
         """PrvText에서 빠른 텍스트 추출
         
         Args:
-            file_path: HWP 파일 경로
+            file_path: HWP 파일 경로 또는 파일 내용 (bytes, memoryview, 파일 객체, mmap)
             
         Returns:
             str: 추출된 텍스트
         """
         try:
-            ole = olefile.OleFileIO(file_path)
+            ole = olefile.OleFileIO(open_source(file_path))
             try:
                 if ole.exists('PrvText'):
                     data = ole.openstream('PrvText').read()
@@ -1312,3 +1765,30 @@ class HwpParser(BaseParser):
                 ole.close()
         except Exception:
             return ''
+
+
+# 병렬 섹션 파싱 작업자 상태 (프로세스마다 한 번 초기화)
+_worker_parser: Optional[HwpParser] = None
+_worker_doc: Optional[Document] = None
+
+
+def _init_section_worker(state: dict) -> None:
+    """프로세스 풀 작업자 초기화: 부모의 DocInfo 서식 표와 이미지 목록 복원"""
+    global _worker_parser, _worker_doc
+    parser = HwpParser(streaming=state['streaming'], profile=state['profile'])
+    parser._is_compressed = state['is_compressed']
+    parser.char_shapes = state['char_shapes']
+    parser.para_shapes = state['para_shapes']
+    parser.font_names = state['font_names']
+    parser._base_font_size = state['base_font_size']
+    parser._build_char_shape_table()
+    _worker_parser = parser
+    # 이미지 데이터는 보내지 않고 ID만 가진 자리표시자로 참조 여부만 판단
+    _worker_doc = Document(images={
+        image_id: Image(id=image_id, data=b'') for image_id in state['image_ids']
+    })
+
+
+def _parse_section_in_worker(data: bytes) -> Section:
+    """프로세스 풀 작업자: 압축된 섹션 스트림 하나를 파싱"""
+    return _worker_parser._parse_section_stream(io.BytesIO(data), _worker_doc)
@@ -5,16 +5,119 @@ HWPX (ZIP+XML) 형식 파일을 파싱하는 모듈
 """
 
 import io
+import struct
+import threading
 import zipfile
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional, Set
+from xml.parsers import expat
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Deque, Dict, Iterator, List, Optional, Set, Tuple
 
-from .base import BaseParser
+from .base import BaseParser, ParseProfile, ParserSource, map_source, open_source, reopen_source
+from .cache import StyleTableCache, copy_tables
+from .filters import clean_hwpx_text, is_valid_paragraph_text
 from ..models import (
     Document, Section, Paragraph, TextRun, Table, TableRow, TableCell,
     TextStyle, Footnote, HeadingLevel, Image
 )
 
+# lxml (선택): 설치되어 있으면 header.xml 파싱/조회에 사용 (xml_backend='lxml'이면 구역도)
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+HAS_LXML = lxml_etree is not None
+
+if HAS_LXML:
+    # 주석/처리 명령은 ElementTree와 같이 버림 (요소의 tag가 항상 문자열)
+    _LXML_PARSER = lxml_etree.XMLParser(remove_comments=True, remove_pis=True)
+
+# charPr 참조가 없는 런이 공유하는 기본 스타일
+_DEFAULT_STYLE = TextStyle()
+
+
+class _TagNames(dict):
+    """정규화된 태그('{URI}local') -> 로컬 이름 테이블
+    
+    파싱 시작 시 NS의 네임스페이스와 파서가 구분하는 요소로 미리 채워 두고,
+    그 밖의 태그는 처음 나왔을 때 한 번만 분리해서 저장한다.
+    """
+    
+    __slots__ = ()
+    
+    def __missing__(self, tag: str) -> str:
+        local_name = tag.split('}')[-1] if '}' in tag else tag
+        self[tag] = local_name
+        return local_name
+
+
+class _MemberPrefetcher:
+    """ZIP 멤버 선행 압축 해제
+    
+    zlib 압축 해제는 GIL을 놓으므로 작은 스레드 풀에서 멤버들을 요청 순서대로 미리 풀어 두고,
+    메인 스레드는 준비된 멤버부터 가져다 파싱한다. ZipFile은 스레드마다 따로 연다.
+    아카이브 전체가 한꺼번에 메모리에 풀리지 않도록 가져가지 않은 작업은 WINDOW_PER_WORKER × 스레드 수까지만 둔다.
+    """
+    
+    # 스레드 하나당 미리 제출해 둘 작업 수
+    WINDOW_PER_WORKER = 2
+    
+    def __init__(self, source: ParserSource, names: List[str], workers: int):
+        self._source = source
+        self._local = threading.local()
+        self._handles: List[zipfile.ZipFile] = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='hwpx-prefetch')
+        self._window = self.WINDOW_PER_WORKER * workers
+        self._members: Set[str] = set(names)  # 아직 가져가지 않은 멤버
+        self._queue: Deque[str] = deque(names)  # 아직 제출하지 않은 멤버 (소비 순서)
+        self._futures: Dict[str, Future] = {}
+        self._fill()
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._members
+    
+    def _fill(self) -> None:
+        """가져가지 않은 작업이 창 크기가 될 때까지 다음 멤버 제출"""
+        while self._queue and len(self._futures) < self._window:
+            name = self._queue.popleft()
+            self._futures[name] = self._executor.submit(self._read, name)
+    
+    def _read(self, name: str) -> bytes:
+        zf = getattr(self._local, 'zf', None)
+        if zf is None:
+            zf = zipfile.ZipFile(reopen_source(self._source), 'r')
+            self._local.zf = zf
+            with self._lock:
+                self._handles.append(zf)
+        return zf.read(name)
+    
+    def read(self, name: str) -> bytes:
+        """멤버 내용 (압축 해제가 끝날 때까지 대기, 한 번 가져가면 결과를 놓음)"""
+        self._members.discard(name)
+        future = self._futures.pop(name, None)
+        if future is None:
+            # 순서를 벗어난 요청: 바로 제출
+            self._queue.remove(name)
+            future = self._executor.submit(self._read, name)
+        self._fill()
+        return future.result()
+    
+    def close(self) -> None:
+        """남은 작업 취소 및 스레드별 ZipFile 닫기"""
+        self._queue.clear()
+        self._members.clear()
+        for future in self._futures.values():
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        self._futures.clear()
+        for zf in self._handles:
+            zf.close()
+        self._handles.clear()
+
 
 class HwpxParser(BaseParser):
     """HWPX (ZIP+XML) 파일 파서"""
@@ -32,19 +135,88 @@ class HwpxParser(BaseParser):
         'hv': 'http://www.hancom.co.kr/hwpml/2011/version',
     }
     
-    def __init__(self):
+    # 구역 순회에서 구분하는 요소 (로컬 이름)
+    TAG_NAMES = (
+        'sec', 'p', 'run', 't', 'lineBreak', 'tab', 'tbl', 'tr', 'tc', 'subList',
+        'pic', 'img', 'imgDat', 'imageRect', 'footNote', 'endNote',
+    )
+    
+    # ParseProfile 항목별로 건너뛸 요소 (로컬 이름)
+    PROFILE_ELEMENTS = {
+        'tables': {'tbl'},
+        'images': {'pic'},
+        'drawings': {'rect', 'ellipse', 'arc', 'polygon', 'curve', 'line', 'connectLine',
+                     'container', 'textart'},
+        'footnotes': {'footNote', 'endNote'},
+    }
+    
+    # 이미지로 추출하는 BinData 확장자
+    IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tif', '.tiff', '.wmf', '.emf'}
+    
+    # 전체 텍스트 모드에서 구역 XML을 한 번에 읽어 expat에 넣을 바이트 수
+    TEXT_CHUNK_SIZE = 64 * 1024
+    
+    # header.xml 서식 테이블 캐시 (프로세스 전역, ZIP 중앙 디렉터리의 CRC32/크기 기준, None이면 사용 안 함)
+    header_cache: Optional[StyleTableCache] = StyleTableCache(maxsize=64)
+    
+    def __init__(self, profile: Optional[ParseProfile] = None, streaming: bool = False,
+                 xml_backend: str = 'auto', workers: Optional[int] = None, worker_type: str = 'process',
+                 prefetch_workers: Optional[int] = None, bindata_backend: str = 'zipfile'):
+        """
+        Args:
+            profile: 선택적 파싱 프로파일 (None이면 모든 개체 파싱)
+            streaming: section*.xml을 iterparse로 읽으면서 최상위 요소(hp:p)가 닫히는 즉시 파싱하고 해제할지 여부
+                (메모리 사용량이 구역 전체가 아닌 최상위 문단 하나 크기로 제한됨)
+            xml_backend: XML 파서 ('auto', 'lxml' 또는 'etree')
+                'auto'는 lxml이 설치되어 있으면 header.xml만 lxml로 읽고 구역은 ElementTree로 읽는다.
+                (구역 순회는 요소마다 파이썬 코드를 거치므로 lxml 프록시 생성 비용 때문에 ElementTree가 더 빠름)
+            workers: 구역을 병렬로 파싱할 작업자 수 (None 또는 1 이하면 순차 파싱)
+            worker_type: 작업자 종류 ('process' 또는 'thread')
+            prefetch_workers: BinData 이미지와 section*.xml을 미리 압축 해제할 스레드 수
+                (None 또는 0이면 사용 안 함, 다시 열 수 없는 파일 객체 입력은 항상 순차 읽기)
+            bindata_backend: BinData 이미지 읽기 방식 ('zipfile' 또는 'mmap')
+                'mmap'은 압축 없이(STORED) 저장된 이미지를 복사하지 않고 아카이브 mmap의 memoryview 슬라이스로
+                Image.data에 넣는다. (CRC 검사 생략, 압축된 멤버와 매핑할 수 없는 파일 객체 입력은 zipfile로 읽음)
+        """
+        if xml_backend not in ('auto', 'lxml', 'etree'):
+            raise ValueError(f'지원하지 않는 XML 백엔드: {xml_backend}')
+        if xml_backend == 'lxml' and not HAS_LXML:
+            raise ValueError('lxml이 설치되어 있지 않습니다')
+        if worker_type not in ('process', 'thread'):
+            raise ValueError(f'지원하지 않는 작업자 종류: {worker_type}')
+        if bindata_backend not in ('zipfile', 'mmap'):
+            raise ValueError(f'지원하지 않는 BinData 백엔드: {bindata_backend}')
+        
+        self.profile = profile or ParseProfile()
+        self.streaming = streaming
+        self.xml_backend = xml_backend
+        self.workers = workers
+        self.worker_type = worker_type
+        self.prefetch_workers = prefetch_workers
+        self.bindata_backend = bindata_backend
+        self._header_lxml: bool = xml_backend == 'lxml' or (xml_backend == 'auto' and HAS_LXML)
+        self._section_lxml: bool = xml_backend == 'lxml'
+        self._skip_elements: Set[str] = set()
+        for key, names in self.PROFILE_ELEMENTS.items():
+            if not getattr(self.profile, key):
+                self._skip_elements |= names
         self.char_shapes: Dict[str, TextStyle] = {}  # id -> TextStyle
         self.para_shapes: Dict[str, dict] = {}       # id -> {align, ...}
         self.font_faces: Dict[str, str] = {}         # id -> font name
         self._footnote_counter: int = 0
         self._base_font_size: int = 1000  # 기본 글자 크기 (10pt = 1000)
         self._analyze_mode: str = "none"  # 이미지 분석 모드 (none/brief/detailed)
+        self._tag_names: _TagNames = _TagNames()
+        # 병렬 파싱 작업자에서 번호를 매기지 않고 모아 두는 각주/미주 (로컬 이름, id 속성, Footnote)
+        self._pending_notes: Optional[List[Tuple[str, Optional[str], Footnote]]] = None
+        self._prefetcher: Optional[_MemberPrefetcher] = None  # ZIP 멤버 선행 압축 해제
+        self._archive: Optional[memoryview] = None  # 아카이브 전체 매핑 (bindata_backend='mmap')
 
-    def parse(self, file_path: str, analyze_mode: str = "none") -> Document:
+    def parse(self, file_path: ParserSource, analyze_mode: str = "none") -> Document:
         """HWPX 파일 파싱
 
         Args:
-            file_path: HWPX 파일 경로
+            file_path: HWPX 파일 경로 또는 파일 내용 (bytes, memoryview, 파일 객체, mmap)
             analyze_mode: 이미지 분석 모드 ('none', 'brief', 'detailed')
 
         Returns:
@@ -54,57 +226,111 @@ class HwpxParser(BaseParser):
         self._analyze_mode = analyze_mode
 
         # 인스턴스 변수 초기화 (재사용 시 이전 결과 제거)
-        self.char_shapes.clear()
-        self.para_shapes.clear()
-        self.font_faces.clear()
+        # 캐시된 테이블을 공유할 수 있으므로 clear() 대신 새로 할당
+        self.char_shapes = {}
+        self.para_shapes = {}
+        self.font_faces = {}
         self._footnote_counter = 0
         self._base_font_size = 1000
         
-        with zipfile.ZipFile(file_path, 'r') as zf:
-            # 1. 네임스페이스 추출 (동적)
-            self._extract_namespaces(zf)
+        with zipfile.ZipFile(open_source(file_path), 'r') as zf:
+            # 구역 파일 목록
+            section_files = self._section_names(zf)
             
-            # 2. header.xml에서 서식 정보 로드
-            self._load_header(zf)
+            # 압축 없이 저장된 이미지는 아카이브 매핑에서 바로 잘라 씀
+            if self.bindata_backend == 'mmap' and self.profile.images:
+                self._archive = map_source(file_path)
             
-            # 3. 기본 글자 크기 결정 (첫 번째 CharShape 기준)
-            if self.char_shapes and '0' in self.char_shapes:
-                first_shape = self.char_shapes['0']
-                if first_shape.font_size:
-                    self._base_font_size = first_shape.font_size
+            # 0. 이미지/구역 압축 해제를 스레드에서 먼저 시작 (header 파싱과 겹침)
+            # 스트리밍 모드는 구역을 통째로 메모리에 올리지 않도록 이미지만 미리 읽음
+            if self.prefetch_workers and self.prefetch_workers > 0:
+                members = [
+                    name for name in (self._image_members(zf) if self.profile.images else [])
+                    if self._member_view(zf, name) is None
+                ]
+                if not self.streaming:
+                    members += section_files
+                if members and reopen_source(file_path) is not None:
+                    self._prefetcher = _MemberPrefetcher(file_path, members, self.prefetch_workers)
             
-            # 4. 이미지 추출 (BinData 폴더)
+            try:
+                self._parse_members(zf, section_files, doc)
+            finally:
+                if self._prefetcher is not None:
+                    self._prefetcher.close()
+                    self._prefetcher = None
+                # 이미지가 가진 슬라이스가 매핑을 유지하므로 참조만 놓음
+                self._archive = None
+        
+        return doc
+    
+    def _parse_members(self, zf: zipfile.ZipFile, section_files: List[str], doc: Document) -> None:
+        """header.xml, 이미지, 구역 순서로 파싱"""
+        # 1~2. header.xml에서 네임스페이스(동적)와 서식 정보 로드
+        self._load_header(zf)
+        self._tag_names = self._build_tag_table()
+        
+        # 3. 기본 글자 크기 결정 (첫 번째 CharShape 기준)
+        if self.char_shapes and '0' in self.char_shapes:
+            first_shape = self.char_shapes['0']
+            if first_shape.font_size:
+                self._base_font_size = first_shape.font_size
+        
+        # 4. 이미지 추출 (BinData 폴더)
+        if self.profile.images:
             self._extract_images(zf, doc)
-            
-            # 5. 구역 파일 목록
-            section_files = sorted([
-                f for f in zf.namelist()
-                if f.startswith('Contents/section') and f.endswith('.xml')
-            ])
-            
-            # 6. 각 section 파싱
+        
+        # 5. 각 section 파싱
+        if self.workers and self.workers > 1 and len(section_files) > 1:
+            doc.sections.extend(self._parse_sections_parallel(zf, section_files, doc))
+        else:
             for sf in section_files:
                 section = self._parse_section(zf, sf, doc)
                 doc.sections.append(section)
-        
-        return doc
     
-    def _extract_namespaces(self, zf: zipfile.ZipFile) -> None:
-        """header.xml에서 실제 네임스페이스 추출"""
-        if 'Contents/header.xml' not in zf.namelist():
-            return
-        
-        xml_data = zf.read('Contents/header.xml')
-        for event, elem in ET.iterparse(io.BytesIO(xml_data), events=['start-ns']):
-            prefix, uri = elem
-            if prefix:
-                self.NS[prefix] = uri
+    @staticmethod
+    def _section_names(zf: zipfile.ZipFile) -> List[str]:
+        """Contents/section*.xml 멤버 목록 (정렬됨)"""
+        return sorted([
+            f for f in zf.namelist()
+            if f.startswith('Contents/section') and f.endswith('.xml')
+        ])
     
-    def _extract_images(self, zf: zipfile.ZipFile, doc: Document) -> None:
-        """BinData 폴더에서 이미지 추출"""
-        # 지원하는 이미지 확장자
-        image_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tif', '.tiff', '.wmf', '.emf'}
+    def _read_member(self, zf: zipfile.ZipFile, name: str) -> bytes:
+        """ZIP 멤버 읽기 (미리 압축 해제한 멤버면 그 결과 사용)"""
+        if self._prefetcher is not None and name in self._prefetcher:
+            return self._prefetcher.read(name)
+        return zf.read(name)
+    
+    def _member_view(self, zf: zipfile.ZipFile, name: str) -> Optional[memoryview]:
+        """압축 없이 저장된 멤버의 내용을 아카이브 매핑의 슬라이스로 반환 (불가능하면 None)
         
+        데이터 위치는 로컬 파일 헤더(30바이트 + 파일명 + 추가 필드) 뒤이며,
+        크기는 중앙 디렉터리 값을 쓴다. 암호화된 멤버는 제외한다.
+        """
+        archive = self._archive
+        if archive is None:
+            return None
+        try:
+            info = zf.getinfo(name)
+            if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+                return None
+            offset = info.header_offset
+            header = archive[offset:offset + 30]
+            if len(header) < 30 or header[:4] != b'PK\x03\x04':
+                return None
+            name_len, extra_len = struct.unpack_from('<HH', header, 26)
+            start = offset + 30 + name_len + extra_len
+            end = start + info.file_size
+            if end > len(archive):
+                return None
+            return archive[start:end]
+        except Exception:
+            return None
+    
+    def _image_members(self, zf: zipfile.ZipFile) -> List[str]:
+        """BinData 폴더의 이미지 파일 목록"""
+        members = []
         for file_path in zf.namelist():
             # BinData 폴더 내 파일만 처리
             if not file_path.startswith('BinData/'):
@@ -112,19 +338,37 @@ class HwpxParser(BaseParser):
             
             # 파일 확장자 확인
             ext = '.' + file_path.rsplit('.', 1)[-1].lower() if '.' in file_path else ''
-            if ext not in image_extensions:
-                continue
-            
+            if ext in self.IMAGE_EXTENSIONS:
+                members.append(file_path)
+        return members
+    
+    def _build_tag_table(self) -> _TagNames:
+        """NS의 각 네임스페이스로 구분할 요소의 정규화된 태그를 미리 계산"""
+        local_names = set(self.TAG_NAMES)
+        for names in self.PROFILE_ELEMENTS.values():
+            local_names |= names
+        
+        table = _TagNames()
+        for uri in self.NS.values():
+            for local_name in local_names:
+                table[f'{{{uri}}}{local_name}'] = local_name
+        return table
+    
+    def _extract_images(self, zf: zipfile.ZipFile, doc: Document) -> None:
+        """BinData 폴더에서 이미지 추출"""
+        for file_path in self._image_members(zf):
             try:
-                # 이미지 데이터 읽기
-                image_data = zf.read(file_path)
+                # 이미지 데이터 읽기 (STORED 멤버는 매핑 슬라이스)
+                image_data = self._member_view(zf, file_path)
+                if image_data is None:
+                    image_data = self._read_member(zf, file_path)
                 
                 # 이미지 ID (파일명에서 추출)
                 file_name = file_path.rsplit('/', 1)[-1]
                 image_id = file_name.rsplit('.', 1)[0] if '.' in file_name else file_name
                 
-                # 이미지 형식
-                image_format = ext[1:]  # 점 제거
+                # 이미지 형식 (점 없는 확장자)
+                image_format = file_path.rsplit('.', 1)[-1].lower()
                 
                 # MIME 타입 결정 (Gemini API 미지원 포맷은 분석 스킵)
                 mime_map = {
@@ -170,18 +414,44 @@ class HwpxParser(BaseParser):
                 pass
     
     def _load_header(self, zf: zipfile.ZipFile) -> None:
-        """header.xml에서 charPr, paraPr, fontface 로드"""
-        if 'Contents/header.xml' not in zf.namelist():
+        """header.xml을 한 번 파싱하여 실제 네임스페이스와 charPr, paraPr, fontface 로드"""
+        # 네임스페이스는 인스턴스마다 따로 둠 (클래스의 NS는 모든 인스턴스와 스레드가 공유하므로 수정 금지)
+        self.NS = type(self).NS
+        try:
+            info = zf.getinfo('Contents/header.xml')
+        except KeyError:
             return
         
-        xml_data = zf.read('Contents/header.xml')
-        root = ET.fromstring(xml_data)
+        # 같은 템플릿의 문서는 header.xml이 동일하므로 이전에 만든 테이블 재사용 (적중 시 압축 해제 없음)
+        cache = self.header_cache
+        cache_key = None
+        if cache is not None:
+            cache_key = (info.CRC, info.file_size)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                namespaces, self.char_shapes, self.para_shapes, self.font_faces = copy_tables(cached)
+                self.NS = {**type(self).NS, **namespaces}
+                return
+        
+        # 파싱하면서 네임스페이스 선언 수집 (트리는 파싱이 끝난 뒤 root로 받음)
+        namespaces: Dict[str, str] = {}
+        with zf.open(info) as stream:
+            events = self._iterparse(stream, ('start-ns',), self._header_lxml)
+            for event, (prefix, uri) in events:
+                if prefix:
+                    namespaces[prefix] = uri
+            root = events.root
+        self.NS = {**type(self).NS, **namespaces}
+        
+        self._load_ref_list(root)
         
+        if cache_key is not None:
+            cache.put(cache_key, copy_tables((namespaces, self.char_shapes, self.para_shapes, self.font_faces)))
+    
+    def _load_ref_list(self, root) -> None:
+        """header.xml 트리의 refList에서 서식 정보 로드"""
         # refList 찾기
-        ref_list = root.find('.//hh:refList', self.NS)
-        if ref_list is None:
-            # 네임스페이스 없이 시도
-            ref_list = root.find('.//{*}refList')
+        ref_list = self._find_descendant(root, 'refList')
         
         if ref_list is None:
             return
@@ -197,14 +467,12 @@ class HwpxParser(BaseParser):
     
     def _load_font_faces(self, ref_list) -> None:
         """글꼴 정보 로드"""
-        fontfaces = ref_list.find('.//hh:fontfaces', self.NS)
-        if fontfaces is None:
-            fontfaces = ref_list.find('.//{*}fontfaces')
+        fontfaces = self._find_descendant(ref_list, 'fontfaces')
         
         if fontfaces is None:
             return
         
-        for fontface in fontfaces.findall('.//{*}font'):
+        for fontface in self._find_descendants(fontfaces, 'font'):
             font_id = fontface.get('id', '')
             font_name = fontface.get('face', '')
             if font_id and font_name:
@@ -212,55 +480,87 @@ class HwpxParser(BaseParser):
     
     def _load_char_properties(self, ref_list) -> None:
         """글자 모양 정보 로드"""
-        char_props = ref_list.find('.//hh:charProperties', self.NS)
-        if char_props is None:
-            char_props = ref_list.find('.//{*}charProperties')
+        char_props = self._find_descendant(ref_list, 'charProperties')
         
         if char_props is None:
             return
         
-        for cp in char_props.findall('.//{*}charPr'):
+        for cp in self._find_descendants(char_props, 'charPr'):
             cp_id = cp.get('id', '0')
-            style = TextStyle()
-            
-            # 속성 파싱
-            style.font_size = int(cp.get('height', '1000'))
-            style.color = cp.get('textColor', '#000000')
-            style.bold = cp.get('bold', 'false').lower() == 'true'
-            style.italic = cp.get('italic', 'false').lower() == 'true'
-            style.underline = cp.get('underline', 'false').lower() == 'true'
-            style.strike = cp.get('strikeout', 'false').lower() == 'true'
             
             # 글꼴 참조
-            font_ref = cp.find('.//{*}fontRef')
+            font_name = None
+            font_ref = self._find_descendant(cp, 'fontRef', any_ns=True)
             if font_ref is not None:
-                hangul_font_id = font_ref.get('hangul', '')
-                if hangul_font_id in self.font_faces:
-                    style.font_name = self.font_faces[hangul_font_id]
+                font_name = self.font_faces.get(font_ref.get('hangul', ''))
             
-            self.char_shapes[cp_id] = style
+            self.char_shapes[cp_id] = TextStyle(
+                font_size=int(cp.get('height', '1000')),
+                color=cp.get('textColor', '#000000'),
+                bold=cp.get('bold', 'false').lower() == 'true',
+                italic=cp.get('italic', 'false').lower() == 'true',
+                underline=cp.get('underline', 'false').lower() == 'true',
+                strike=cp.get('strikeout', 'false').lower() == 'true',
+                font_name=font_name,
+            )
     
     def _load_para_properties(self, ref_list) -> None:
         """문단 모양 정보 로드"""
-        para_props = ref_list.find('.//hh:paraProperties', self.NS)
-        if para_props is None:
-            para_props = ref_list.find('.//{*}paraProperties')
+        para_props = self._find_descendant(ref_list, 'paraProperties')
         
         if para_props is None:
             return
         
-        for pp in para_props.findall('.//{*}paraPr'):
+        for pp in self._find_descendants(para_props, 'paraPr'):
             pp_id = pp.get('id', '0')
             self.para_shapes[pp_id] = {
                 'align': pp.get('align', 'JUSTIFY'),
                 'heading': pp.get('heading', None),
             }
     
+    @staticmethod
+    def _fromstring(xml_data: bytes, use_lxml: bool):
+        """XML 파싱"""
+        if use_lxml:
+            return lxml_etree.fromstring(xml_data, _LXML_PARSER)
+        return ET.fromstring(xml_data)
+    
+    @staticmethod
+    def _iterparse(source, events, use_lxml: bool):
+        """XML 이벤트 파싱"""
+        if use_lxml:
+            return lxml_etree.iterparse(source, events=events, remove_comments=True, remove_pis=True)
+        return ET.iterparse(source, events=events)
+    
+    def _find_descendant(self, elem, local_name: str, any_ns: bool = False):
+        """header.xml에서 로컬 이름으로 첫 번째 하위 요소 찾기
+        
+        hh 네임스페이스 요소를 먼저 찾고, 없으면 네임스페이스와 관계없이 찾는다 (any_ns면 바로 후자).
+        """
+        if self._header_lxml:
+            found = None if any_ns else next(elem.iterdescendants(f'{{{self.NS["hh"]}}}{local_name}'), None)
+            if found is None:
+                found = next(elem.iterdescendants(f'{{*}}{local_name}'), None)
+            return found
+        
+        found = None if any_ns else elem.find(f'.//hh:{local_name}', self.NS)
+        if found is None:
+            # 네임스페이스 없이 시도
+            found = elem.find(f'.//{{*}}{local_name}')
+        return found
+    
+    def _find_descendants(self, elem, local_name: str) -> List:
+        """header.xml에서 로컬 이름으로 모든 하위 요소 찾기 (네임스페이스 무관, 문서 순서)"""
+        if self._header_lxml:
+            return list(elem.iterdescendants(f'{{*}}{local_name}'))
+        return elem.findall(f'.//{{*}}{local_name}')
+    
     def _get_image_id_from_pic(self, pic_elem) -> str:
         """pic 요소에서 이미지 ID 추출"""
         # imageRect > imgDat 또는 img 요소에서 binItemIdRef 찾기
+        names = self._tag_names
         for child in pic_elem.iter():
-            local_name = child.tag.split('}')[-1] if '}' in child.tag else child.tag
+            local_name = names[child.tag]
             if local_name in ('imgDat', 'img', 'imageRect'):
                 bin_ref = child.get('binItemIdRef', child.get('binaryItemIDRef', ''))
                 if bin_ref:
@@ -269,63 +569,230 @@ class HwpxParser(BaseParser):
     
     def _parse_section(self, zf: zipfile.ZipFile, path: str, doc: Document) -> Section:
         """section*.xml 파싱"""
+        if self.streaming:
+            with zf.open(path) as stream:
+                return self._parse_section_streaming(stream, doc)
+        return self._parse_section_data(self._read_member(zf, path), doc)
+    
+    def _parse_section_data(self, xml_data: bytes, doc: Document) -> Section:
+        """이미 읽은 section*.xml 내용 파싱"""
+        if self.streaming:
+            return self._parse_section_streaming(io.BytesIO(xml_data), doc)
+        
         section = Section()
-        xml_data = zf.read(path)
-        root = ET.fromstring(xml_data)
+        root = self._fromstring(xml_data, self._section_lxml)
+        self._parse_block(root, section, doc)
+        return section
+    
+    def _parse_sections_parallel(self, zf: zipfile.ZipFile, section_files: List[str],
+                                 doc: Document) -> List[Section]:
+        """구역들을 작업자 풀에서 병렬 파싱 (결과는 구역 순서대로 반환)
         
-        # 이미 처리된 요소 추적
-        processed = set()
+        header.xml의 서식 테이블이 만들어진 뒤에는 각 구역을 독립적으로 파싱할 수 있다.
+        작업자는 각주/미주를 번호 없이 모아 오고, 번호는 여기서 구역 순서대로 매긴다.
+        """
+        state = {
+            'profile': self.profile,
+            'streaming': self.streaming,
+            'xml_backend': self.xml_backend,
+            'namespaces': dict(self.NS),
+            'char_shapes': self.char_shapes,
+            'para_shapes': self.para_shapes,
+            'font_faces': self.font_faces,
+            'base_font_size': self._base_font_size,
+            'image_ids': list(doc.images),
+        }
+        raw_sections = [self._read_member(zf, path) for path in section_files]
+        max_workers = min(self.workers, len(raw_sections))
+        
+        if self.worker_type == 'thread':
+            # 스레드는 문서(이미지)를 그대로 공유하고, 작업마다 파서 인스턴스를 따로 만듦
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(partial(_parse_section_with_state, state, doc), raw_sections))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_section_worker,
+                                     initargs=(state,)) as executor:
+                results = list(executor.map(_parse_section_in_worker, raw_sections))
         
-        # 모든 p 요소 순회
-        for p_elem in root.iter():
-            local_name = p_elem.tag.split('}')[-1] if '}' in p_elem.tag else p_elem.tag
+        sections = []
+        for section, notes in results:
+            # 작업자가 만든 이미지 자리표시자를 실제 Image 객체로 교체
+            for idx, elem in enumerate(section.elements):
+                if isinstance(elem, Image):
+                    section.elements[idx] = doc.images[elem.id]
+            for local_name, note_id, note in notes:
+                self._register_note(local_name, note_id, note, doc)
+            sections.append(section)
+        return sections
+    
+    def _parse_section_streaming(self, stream, doc: Document) -> Section:
+        """section*.xml 스트리밍 파싱
+        
+        최상위 요소(hs:sec의 자식)가 닫힐 때마다 그 하위 트리를 파싱하고 바로 해제한다.
+        문서 순서와 결과는 전체 트리를 읽는 방식과 같다.
+        """
+        section = Section()
+        root = None
+        depth = 0
+        names = self._tag_names
+        
+        for event, elem in self._iterparse(stream, ('start', 'end'), self._section_lxml):
+            if event == 'start':
+                if root is None:
+                    root = elem
+                depth += 1
+                continue
             
-            if local_name == 'p' and id(p_elem) not in processed:
-                processed.add(id(p_elem))
-                
-                # 표가 포함된 문단인지 확인
-                tbl = self._find_child(p_elem, 'tbl')
-                if tbl is not None:
-                    table = self._parse_table(tbl, processed)
-                    if not table.is_empty():
-                        section.elements.append(table)
-                else:
-                    # 각주 처리
-                    self._extract_footnotes(p_elem, doc)
-                    
-                    # 이미지 참조 확인 (pic 요소)
-                    pic = self._find_child(p_elem, 'pic')
-                    if pic is not None:
-                        # 이미지 ID 추출
-                        img_id = self._get_image_id_from_pic(pic)
-                        if img_id and img_id in doc.images:
-                            section.elements.append(doc.images[img_id])
-                    
-                    para = self._parse_paragraph(p_elem)
-                    # HWP 특수 마커 필터링
-                    if not para.is_empty() and self._is_valid_paragraph(para):
-                        section.elements.append(para)
+            depth -= 1
+            if depth != 1:
+                continue
+            
+            # 최상위 요소 하나 완료
+            local_name = names[elem.tag]
+            if local_name not in self._skip_elements:
+                self._parse_block(elem, section, doc)
+            root.clear()
         
         return section
     
+    def _parse_block(self, elem, section: Section, doc: Document) -> None:
+        """요소 하위 트리의 문단/표/이미지를 문서 순서대로 section에 추가"""
+        self._walk(elem, self._tag_names[elem.tag], section, doc, set())
+    
+    def _walk(self, node, local_name: str, section: Section, doc: Document, tables: set) -> None:
+        """재귀 순회 - 요소 종류에 따라 한 번 처리하고 자식으로 내려감
+        
+        프로파일에서 제외한 요소는 하위 트리 전체를 건너뛴다.
+        tables는 문단에서 표로 처리한 tbl 집합 (셀 내용은 _parse_table에서 읽었으므로 다시 순회하지 않음).
+        """
+        if local_name == 'p':
+            tbl = self._parse_flow_paragraph(node, section, doc)
+            if tbl is not None:
+                tables.add(tbl)
+        elif local_name == 'tbl' and node in tables:
+            self._walk_table_rest(node, section, doc, tables)
+            return
+        
+        names = self._tag_names
+        skip = self._skip_elements
+        for child in node:
+            child_name = names[child.tag]
+            if child_name not in skip:
+                self._walk(child, child_name, section, doc, tables)
+    
+    def _walk_table_rest(self, tbl_elem, section: Section, doc: Document, tables: set) -> None:
+        """표로 처리한 tbl에서 셀(tr > tc) 밖의 요소만 순회 (캡션 등)"""
+        names = self._tag_names
+        skip = self._skip_elements
+        for child in tbl_elem:
+            child_name = names[child.tag]
+            if child_name in skip:
+                continue
+            if child_name != 'tr':
+                self._walk(child, child_name, section, doc, tables)
+                continue
+            for cell in child:
+                cell_name = names[cell.tag]
+                if cell_name != 'tc' and cell_name not in skip:
+                    self._walk(cell, cell_name, section, doc, tables)
+    
+    def _parse_flow_paragraph(self, p_elem, section: Section, doc: Document):
+        """본문 흐름의 p 요소 처리 (표, 각주, 이미지, 문단)
+        
+        자식과 손자(run 내부)를 한 번만 훑어서 필요한 요소를 모은다.
+        표가 있으면 문단 자체의 텍스트(있으면)와 표를 차례로 추가하고 그 tbl을 반환한다.
+        """
+        tbl = inner_tbl = None  # 직접 자식 / 손자 중 첫 번째 (직접 자식 우선)
+        pic = inner_pic = None
+        runs = []
+        texts = []  # (run, t)
+        notes = []  # (로컬 이름, footNote/endNote)
+        names = self._tag_names
+        
+        for child in p_elem:
+            child_name = names[child.tag]
+            is_run = child_name == 'run'
+            if is_run:
+                runs.append(child)
+            elif child_name == 'tbl':
+                if tbl is None:
+                    tbl = child
+            elif child_name == 'pic':
+                if pic is None:
+                    pic = child
+            
+            for grandchild in child:
+                name = names[grandchild.tag]
+                if name == 't':
+                    if is_run:
+                        texts.append((child, grandchild))
+                elif name == 'tbl':
+                    if inner_tbl is None:
+                        inner_tbl = grandchild
+                elif name == 'pic':
+                    if inner_pic is None:
+                        inner_pic = grandchild
+                elif is_run and (name == 'footNote' or name == 'endNote'):
+                    notes.append((name, grandchild))
+        
+        # 표가 포함된 문단
+        if self.profile.tables:
+            if tbl is None:
+                tbl = inner_tbl
+            if tbl is not None:
+                # 표를 품은 문단의 텍스트도 표 앞에 넣음 (iter_text, HWP 파서와 같은 순서)
+                para = self._build_paragraph(p_elem, runs, texts)
+                if not para.is_empty() and self._is_valid_paragraph(para):
+                    section.elements.append(para)
+                table = self._parse_table(tbl)
+                if not table.is_empty():
+                    section.elements.append(table)
+                return tbl
+        
+        # 각주 처리
+        if self.profile.footnotes:
+            for name, note_elem in notes:
+                self._extract_footnote(name, note_elem, doc)
+        
+        # 이미지 참조 확인 (pic 요소)
+        if self.profile.images:
+            if pic is None:
+                pic = inner_pic
+            if pic is not None:
+                # 이미지 ID 추출
+                img_id = self._get_image_id_from_pic(pic)
+                if img_id and img_id in doc.images:
+                    section.elements.append(doc.images[img_id])
+        
+        para = self._build_paragraph(p_elem, runs, texts)
+        # HWP 특수 마커 필터링
+        if not para.is_empty() and self._is_valid_paragraph(para):
+            section.elements.append(para)
+        return None
+    
     def _is_valid_paragraph(self, para: Paragraph) -> bool:
         """문단 유효성 검사 - HWP 특수 마커 필터링"""
         text = ''.join(run.text for run in para.runs).strip()
-        if len(text) <= 3:
-            # HWP 그래픽 요소 마커 (선, 도형 등)
-            # 이들은 실제로는 ASCII 코드의 조합(예: 'pn' -> 0x6e70)이 한자로 오인된 것들입니다.
-            GRAPHIC_MARKERS = {
-                0x6e70, 0x6824, 0x6e6f, 0x6e37, 
-                0x6e30, 0xf0e8, 0x6364, 0x7365
-            }
-            
-            for char in text:
-                if ord(char) in GRAPHIC_MARKERS:
-                    return False
-        return True
+        return is_valid_paragraph_text(text)
     
     def _parse_paragraph(self, p_elem) -> Paragraph:
         """p 요소 파싱"""
+        runs = []
+        texts = []  # (run, t)
+        names = self._tag_names
+        for run in p_elem:
+            run_name = names[run.tag]
+            if run_name != 'run':
+                continue
+            runs.append(run)
+            for child in run:
+                local_name = names[child.tag]
+                if local_name == 't':
+                    texts.append((run, child))
+        return self._build_paragraph(p_elem, runs, texts)
+    
+    def _build_paragraph(self, p_elem, runs: List, texts: List) -> Paragraph:
+        """미리 모은 run 목록과 (run, t) 목록으로 Paragraph 생성"""
         para = Paragraph()
         
         # 문단 스타일 ID로 제목 레벨 추정
@@ -333,30 +800,19 @@ class HwpxParser(BaseParser):
         para_pr_id = p_elem.get('paraPrIDRef', '')
         
         # 첫 번째 run의 charPrIDRef 가져오기
-        runs = self._find_all_children(p_elem, 'run')
         first_char_pr_id = runs[0].get('charPrIDRef', '') if runs else ''
         
-        for run in runs:
-            char_pr_id = run.get('charPrIDRef', '0')
-            style = self.char_shapes.get(char_pr_id, TextStyle())
+        current_run = None
+        style = None
+        for run, t_elem in texts:
+            if run is not current_run:
+                current_run = run
+                style = self.char_shapes.get(run.get('charPrIDRef', '0'), _DEFAULT_STYLE)
             
-            for child in run:
-                local_name = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-                
-                if local_name == 't':
-                    text = self._extract_text(child)
-                    if text:
-                        # 스타일 복사하여 사용
-                        run_style = TextStyle(
-                            bold=style.bold,
-                            italic=style.italic,
-                            underline=style.underline,
-                            strike=style.strike,
-                            font_size=style.font_size,
-                            font_name=style.font_name,
-                            color=style.color,
-                        )
-                        para.runs.append(TextRun(text=text, style=run_style))
+            text = self._extract_text(t_elem)
+            if text:
+                # TextStyle은 불변이므로 복사 없이 공유
+                para.runs.append(TextRun(text=text, style=style))
         
         # 제목 레벨 감지 (휴리스틱) - runs 파싱 후 실행
         para.heading_level = self._detect_heading_level(style_id, para_pr_id, first_char_pr_id)
@@ -412,8 +868,9 @@ class HwpxParser(BaseParser):
             parts.append(t_elem.text)
         
         # 자식 요소 처리
+        names = self._tag_names
         for child in t_elem:
-            local_name = child.tag.split('}')[-1] if '}' in child.tag else child.tag
+            local_name = names[child.tag]
             
             if local_name == 'lineBreak':
                 parts.append('\n')
@@ -424,75 +881,40 @@ class HwpxParser(BaseParser):
             if child.tail:
                 parts.append(child.tail)
         
-        text = ''.join(parts)
+        # HWP 특수 마커 및 그래픽 앵커 필터링 (선, 도형 등의 앵커, PUA 마커)
+        return clean_hwpx_text(''.join(parts))
+    
+    def _extract_footnote(self, local_name: str, note_elem, doc: Document) -> None:
+        """footNote/endNote 요소에서 각주/미주 추출"""
+        note = Footnote(id='', number=0, content=[])
         
-        # HWP 특수 마커 및 그래픽 앵커 필터링
-        # 湰(0x6e30), 桤(0x6824), 湯(0x6e6f), 湷(0x6e37), (0xf0e8)
-        # 이들은 텍스트가 아니라 선, 도형 등의 앵커입니다.
-        GRAPHIC_MARKERS = {
-            0x6e70, 0x6824, 0x6e6f, 0x6e37, 
-            0x6e30, 0xf0e8, 0x6364, 0x7365
-        }
+        # 각주 내 문단들
+        for note_p in self._find_all_children(note_elem, 'p'):
+            para = self._parse_paragraph(note_p)
+            note.content.append(para)
         
-        filtered_chars = []
-        for char in text:
-            code = ord(char)
-
-            # UTF-16 서로게이트 문자 제거 (U+D800 ~ U+DFFF)
-            # HWP의 PUA 문자가 잘못 파싱되어 서로게이트로 나타날 수 있음
-            if 0xD800 <= code <= 0xDFFF:
-                continue
-
-            if code in GRAPHIC_MARKERS:
-                continue
-            # PUA 영역의 다른 마커들도 안전하게 제거 (사용자 정의 영역 제외)
-            if 0xe000 <= code <= 0xf8ff:
-                continue
-
-            filtered_chars.append(char)
-
-        return ''.join(filtered_chars)
+        if self._pending_notes is not None:
+            # 병렬 파싱 작업자: 번호는 부모가 구역 순서대로 매김
+            self._pending_notes.append((local_name, note_elem.get('id'), note))
+        else:
+            self._register_note(local_name, note_elem.get('id'), note, doc)
     
-    def _extract_footnotes(self, p_elem, doc: Document) -> None:
-        """문단에서 각주 추출"""
-        for run in self._find_all_children(p_elem, 'run'):
-            for child in run:
-                local_name = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-                
-                if local_name == 'footNote':
-                    self._footnote_counter += 1
-                    fn_id = child.get('id', f'fn{self._footnote_counter}')
-                    
-                    footnote = Footnote(
-                        id=fn_id,
-                        number=self._footnote_counter,
-                        content=[]
-                    )
-                    
-                    # 각주 내 문단들
-                    for fn_p in self._find_all_children(child, 'p'):
-                        para = self._parse_paragraph(fn_p)
-                        footnote.content.append(para)
-                    
-                    doc.footnotes[fn_id] = footnote
-                
-                elif local_name == 'endNote':
-                    self._footnote_counter += 1
-                    en_id = child.get('id', f'en{self._footnote_counter}')
-                    
-                    endnote = Footnote(
-                        id=en_id,
-                        number=self._footnote_counter,
-                        content=[]
-                    )
-                    
-                    for en_p in self._find_all_children(child, 'p'):
-                        para = self._parse_paragraph(en_p)
-                        endnote.content.append(para)
-                    
-                    doc.endnotes[en_id] = endnote
-    
-    def _parse_table(self, tbl_elem, processed: set) -> Table:
+    def _register_note(self, local_name: str, note_id: Optional[str], note: Footnote,
+                       doc: Document) -> None:
+        """각주/미주에 문서 전체 순번을 매기고 문서에 추가 (id 속성이 없으면 순번으로 id 생성)"""
+        self._footnote_counter += 1
+        if note_id is None:
+            prefix = 'fn' if local_name == 'footNote' else 'en'
+            note_id = f'{prefix}{self._footnote_counter}'
+        note.id = note_id
+        note.number = self._footnote_counter
+        
+        if local_name == 'footNote':
+            doc.footnotes[note_id] = note
+        else:
+            doc.endnotes[note_id] = note
+    
+    def _parse_table(self, tbl_elem) -> Table:
         """tbl 요소 파싱"""
         table = Table()
         table.col_count = int(tbl_elem.get('colCnt', '0'))
@@ -505,19 +927,8 @@ class HwpxParser(BaseParser):
                 cell.colspan = int(tc.get('colSpan', '1'))
                 cell.rowspan = int(tc.get('rowSpan', '1'))
 
-                # 셀 내 문단들 (재귀 탐색)
-                # tc 하위의 모든 p 요소를 찾음 (중첩 포함)
-                for child in tc.iter():
-                    child_local = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-                    if child_local == 'p':
-                        processed.add(id(child))
-                        para = self._parse_paragraph(child)
-                        cell.paragraphs.append(para)
-                    # 셀 내 이미지 추출 (hp:pic > hc:img)
-                    elif child_local == 'img':
-                        img_ref = child.get('binaryItemIDRef')
-                        if img_ref:
-                            cell.image_ids.append(img_ref)
+                # 셀 내 문단들 (재귀 탐색, 중첩 표 포함)
+                self._collect_cell(tc, cell)
 
                 row.cells.append(cell)
 
@@ -525,45 +936,199 @@ class HwpxParser(BaseParser):
 
         return table
     
-    def _find_child(self, elem, local_name: str):
-        """로컬 이름으로 자식 요소 찾기 (직접 자식만)"""
+    def _collect_cell(self, elem, cell: TableCell) -> None:
+        """셀 하위의 모든 p 요소와 이미지(hp:pic > hc:img)를 문서 순서대로 모음"""
+        names = self._tag_names
+        skip = self._skip_elements
         for child in elem:
-            child_name = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-            if child_name == local_name:
-                return child
-        
-        # 한 단계 더 깊이 탐색 (run 내부)
-        for child in elem:
-            for grandchild in child:
-                grandchild_name = grandchild.tag.split('}')[-1] if '}' in grandchild.tag else grandchild.tag
-                if grandchild_name == local_name:
-                    return grandchild
-        
-        return None
+            local_name = names[child.tag]
+            if local_name in skip:
+                continue
+            if local_name == 'p':
+                cell.paragraphs.append(self._parse_paragraph(child))
+            # 셀 내 이미지 추출 (hp:pic > hc:img)
+            elif local_name == 'img':
+                img_ref = child.get('binaryItemIDRef')
+                if img_ref:
+                    cell.image_ids.append(img_ref)
+            self._collect_cell(child, cell)
     
     def _find_all_children(self, elem, local_name: str) -> List:
         """로컬 이름으로 모든 자식 요소 찾기 (직접 자식만)"""
         result = []
+        names = self._tag_names
         for child in elem:
-            child_name = child.tag.split('}')[-1] if '}' in child.tag else child.tag
+            child_name = names[child.tag]
             if child_name == local_name:
                 result.append(child)
         return result
     
+    def iter_text(self, file_path: ParserSource) -> Iterator[str]:
+        """본문 텍스트만 문단 단위로 추출 (전체 텍스트 모드)
+        
+        section*.xml을 트리 없이 expat 콜백으로 조금씩 읽으며 p > run > t의 텍스트(lineBreak/tab 포함)만 모은다.
+        표 셀, 각주, 글상자 안의 문단도 문서 순서대로 포함한다. (프로파일에서 제외한 요소의 하위는 건너뜀)
+        PrvText(quick_extract)와 달리 문서 전체를 다루고, parse()와 달리 header.xml, 글자 모양, 제목 감지,
+        표 구조, BinData는 처리하지 않는다.
+        
+        Args:
+            file_path: HWPX 파일 경로 또는 파일 내용 (bytes, memoryview, 파일 객체, mmap)
+            
+        Yields:
+            str: 문단 텍스트 (빈 문단 제외)
+        """
+        with zipfile.ZipFile(open_source(file_path), 'r') as zf:
+            for name in self._section_names(zf):
+                with zf.open(name) as stream:
+                    yield from self._iter_section_text(stream)
+    
+    def extract_text(self, file_path: ParserSource) -> str:
+        """본문 전체 텍스트 추출 (문단은 줄바꿈으로 구분)
+        
+        Args:
+            file_path: HWPX 파일 경로 또는 파일 내용 (bytes, memoryview, 파일 객체, mmap)
+            
+        Returns:
+            str: 추출된 텍스트
+        """
+        return '\n'.join(self.iter_text(file_path))
+    
+    def _iter_section_text(self, stream) -> Iterator[str]:
+        """구역 XML 스트림에서 문단 텍스트 추출 (expat)
+        
+        t 요소의 텍스트는 parse()와 같이 t 바로 아래의 문자열과 lineBreak/tab만 쓴다.
+        바깥 문단이 안쪽 문단(표 셀, 각주)보다 늦게 닫히므로, 끝난 안쪽 문단은 바깥 문단에 모아 두었다가
+        바깥 문단 텍스트 뒤에 내보낸다. 안쪽 문단이 열리면 바깥 t의 상태를 보관했다가 닫힐 때 되돌린다.
+        """
+        names = _TagNames()
+        skip = self._skip_elements
+        path: List[str] = []          # 열린 요소의 로컬 이름
+        frames: List[tuple] = []      # 열린 p마다 (t 텍스트, 먼저 끝난 안쪽 문단, 바깥 t 깊이, 바깥 t 조각)
+        t_parts: List[str] = []       # 현재 t 요소의 텍스트 조각
+        ready: List[str] = []         # 내보낼 문단
+        t_depth = -1                  # 현재 t 요소의 깊이 (-1이면 t 밖)
+        skip_depth = -1               # 건너뛰는 요소의 깊이 (-1이면 없음)
+        
+        def start(tag, attrs):
+            nonlocal t_depth, t_parts, skip_depth
+            local_name = names[tag]
+            depth = len(path)
+            path.append(local_name)
+            if skip_depth >= 0:
+                return
+            if local_name in skip:
+                skip_depth = depth
+            elif local_name == 'p':
+                frames.append(([], [], t_depth, t_parts))
+                t_depth = -1
+            elif local_name == 't':
+                if depth >= 2 and path[depth - 1] == 'run' and path[depth - 2] == 'p':
+                    t_depth = depth
+                    t_parts = []
+            elif depth == t_depth + 1 and t_depth >= 0:
+                if local_name == 'lineBreak':
+                    t_parts.append('\n')
+                elif local_name == 'tab':
+                    t_parts.append('\t')
+        
+        def end(tag):
+            nonlocal t_depth, t_parts, skip_depth
+            local_name = path.pop()
+            depth = len(path)
+            if skip_depth >= 0:
+                if depth == skip_depth:
+                    skip_depth = -1
+            elif depth == t_depth:
+                frames[-1][0].append(clean_hwpx_text(''.join(t_parts)))
+                t_depth = -1
+            elif local_name == 'p':
+                texts, inner, t_depth, t_parts = frames.pop()
+                text = ''.join(texts).strip()
+                out = frames[-1][1] if frames else ready
+                if text and is_valid_paragraph_text(text):
+                    out.append(text)
+                out.extend(inner)
+        
+        def characters(data):
+            if len(path) == t_depth + 1:
+                t_parts.append(data)
+        
+        parser = expat.ParserCreate(namespace_separator='}')
+        parser.buffer_text = True
+        parser.ordered_attributes = True  # 속성은 쓰지 않으므로 dict 대신 리스트로 받음 (생성 비용 절감)
+        parser.StartElementHandler = start
+        parser.EndElementHandler = end
+        parser.CharacterDataHandler = characters
+        
+        chunk_size = self.TEXT_CHUNK_SIZE
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            parser.Parse(chunk, False)
+            if ready:
+                yield from ready
+                ready.clear()
+        parser.Parse(b'', True)
+        yield from ready
+    
     @staticmethod
-    def quick_extract(file_path: str) -> str:
+    def quick_extract(file_path: ParserSource) -> str:
         """PrvText.txt에서 빠른 텍스트 추출
         
         Args:
-            file_path: HWPX 파일 경로
+            file_path: HWPX 파일 경로 또는 파일 내용 (bytes, memoryview, 파일 객체, mmap)
             
         Returns:
             str: 추출된 텍스트
         """
         try:
-            with zipfile.ZipFile(file_path, 'r') as zf:
+            with zipfile.ZipFile(open_source(file_path), 'r') as zf:
                 if 'Preview/PrvText.txt' in zf.namelist():
                     return zf.read('Preview/PrvText.txt').decode('utf-8', errors='ignore')
         except Exception:
             pass
         return ''
+
+
+# 병렬 구역 파싱 작업자 상태 (프로세스마다 한 번 초기화)
+_worker_parser: Optional[HwpxParser] = None
+_worker_doc: Optional[Document] = None
+
+
+def _make_worker_parser(state: dict) -> HwpxParser:
+    """부모의 header.xml 서식 테이블로 작업자용 파서 생성"""
+    parser = HwpxParser(profile=state['profile'], streaming=state['streaming'],
+                        xml_backend=state['xml_backend'])
+    parser.NS = state['namespaces']
+    parser.char_shapes = state['char_shapes']
+    parser.para_shapes = state['para_shapes']
+    parser.font_faces = state['font_faces']
+    parser._base_font_size = state['base_font_size']
+    parser._tag_names = parser._build_tag_table()
+    return parser
+
+
+def _init_section_worker(state: dict) -> None:
+    """프로세스 풀 작업자 초기화: 부모의 서식 테이블과 이미지 목록 복원"""
+    global _worker_parser, _worker_doc
+    _worker_parser = _make_worker_parser(state)
+    # 이미지 데이터는 보내지 않고 ID만 가진 자리표시자로 참조 여부만 판단
+    _worker_doc = Document(images={
+        image_id: Image(id=image_id, data=b'') for image_id in state['image_ids']
+    })
+
+
+def _parse_section_in_worker(xml_data: bytes) -> Tuple[Section, list]:
+    """프로세스 풀 작업자: section*.xml 하나를 파싱 (구역, 번호 없는 각주/미주 목록)"""
+    _worker_parser._pending_notes = []
+    section = _worker_parser._parse_section_data(xml_data, _worker_doc)
+    return section, _worker_parser._pending_notes
+
+
+def _parse_section_with_state(state: dict, doc: Document, xml_data: bytes) -> Tuple[Section, list]:
+    """스레드 풀 작업: 작업마다 파서를 새로 만들어 section*.xml 하나를 파싱"""
+    parser = _make_worker_parser(state)
+    parser._pending_notes = []
+    section = parser._parse_section_data(xml_data, doc)
+    return section, parser._pending_notes
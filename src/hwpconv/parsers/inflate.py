@@ -0,0 +1,83 @@
+"""
+raw deflate 압축 해제 백엔드
+
+HWP 스트림(DocInfo, BodyText/SectionN, BinData)은 헤더 없는 raw deflate로 압축되어 있다.
+더 빠른 구현(python-isal, zlib-ng)이 설치되어 있으면 자동으로 사용하고, 없으면 표준 zlib를 사용한다.
+"""
+
+import os
+import zlib
+from typing import Dict, List, Tuple
+
+# 백엔드 이름 -> zlib 호환 모듈 (설치된 것만, 우선순위 순)
+_BACKENDS: Dict[str, object] = {}
+
+try:
+    from isal import isal_zlib
+    _BACKENDS['isal'] = isal_zlib
+except ImportError:
+    pass
+
+try:
+    from zlib_ng import zlib_ng
+    _BACKENDS['zlib-ng'] = zlib_ng
+except ImportError:
+    pass
+
+_BACKENDS['zlib'] = zlib
+
+# 압축 해제 실패 시 발생하는 예외 (모든 백엔드)
+InflateError: Tuple[type, ...] = tuple({module.error for module in _BACKENDS.values()})
+
+_backend_name = 'zlib'
+_backend = zlib
+
+
+def available_backends() -> List[str]:
+    """사용 가능한 백엔드 이름 목록 (우선순위 순)"""
+    return list(_BACKENDS)
+
+
+def get_backend() -> str:
+    """현재 사용 중인 백엔드 이름"""
+    return _backend_name
+
+
+def set_backend(name: str) -> None:
+    """백엔드 선택
+
+    Args:
+        name: 'isal', 'zlib-ng', 'zlib' 또는 'auto' (설치된 것 중 가장 빠른 것)
+    """
+    global _backend_name, _backend
+    if name == 'auto':
+        name = next(iter(_BACKENDS))
+    if name not in _BACKENDS:
+        raise ValueError(f'사용할 수 없는 압축 해제 백엔드: {name} (가능: {", ".join(_BACKENDS)})')
+    _backend_name = name
+    _backend = _BACKENDS[name]
+
+
+def inflate(data) -> bytes:
+    """raw deflate 압축 해제 (실패 시 InflateError)"""
+    return _backend.decompress(data, -15)
+
+
+def inflate_or_raw(data):
+    """raw deflate 압축 해제 시도 (압축되지 않은 데이터면 그대로 반환)"""
+    try:
+        return _backend.decompress(data, -15)
+    except InflateError:
+        return data
+
+
+def decompressobj():
+    """스트리밍 압축 해제 객체 (zlib.decompressobj(-15)와 같은 인터페이스)"""
+    return _backend.decompressobj(-15)
+
+
+# 환경 변수 HWPCONV_INFLATE로 백엔드 고정 가능 (기본: auto)
+try:
+    set_backend(os.environ.get('HWPCONV_INFLATE', 'auto'))
+except ValueError:
+    set_backend('auto')
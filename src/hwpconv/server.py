@@ -6,7 +6,6 @@ python -m hwpconv.server 로 실행
 
 import os
 import sys
-import tempfile
 import webbrowser
 from pathlib import Path
 from typing import Optional
@@ -44,10 +43,6 @@ def add_cors_headers(response):
 def not_found(e):
     return jsonify({'success': False, 'error': 'Not found'}), 404
 
-# 임시 디렉토리
-TEMP_DIR = Path(tempfile.gettempdir()) / "hwpconv"
-TEMP_DIR.mkdir(exist_ok=True)
-
 # HTML 템플릿
 HTML_TEMPLATE = '''
 <!DOCTYPE html>
@@ -444,36 +439,26 @@ def convert():
         if not file:
             return jsonify({'success': False, 'error': 'No file provided'})
         
-        # 고유한 임시 파일로 저장 (경쟁 조건 방지)
-        import uuid
-        filename = file.filename
-        unique_name = f"{uuid.uuid4().hex}_{filename}"
-        temp_path = TEMP_DIR / unique_name
-        file.save(str(temp_path))
+        # 파서 선택
+        ext = Path(file.filename).suffix.lower()
+        if ext == '.hwpx':
+            parser = HwpxParser()
+        elif ext == '.hwp':
+            parser = HwpParser()
+        else:
+            return jsonify({'success': False, 'error': f'Unsupported format: {ext}'})
+        
+        # 업로드 내용을 임시 파일 없이 메모리에서 바로 파싱
+        doc = parser.parse(file.read())
+        
+        # 변환
+        if output_format == 'html':
+            content = HtmlConverter().convert(doc)
+        else:
+            content = MarkdownConverter().convert(doc)
+        
+        return jsonify({'success': True, 'content': content})
         
-        try:
-            # 파서 선택
-            ext = Path(filename).suffix.lower()
-            if ext == '.hwpx':
-                doc = HwpxParser().parse(str(temp_path))
-            elif ext == '.hwp':
-                doc = HwpParser().parse(str(temp_path))
-            else:
-                return jsonify({'success': False, 'error': f'Unsupported format: {ext}'})
-            
-            # 변환
-            if output_format == 'html':
-                content = HtmlConverter().convert(doc)
-            else:
-                content = MarkdownConverter().convert(doc)
-            
-            return jsonify({'success': True, 'content': content})
-            
-        finally:
-            # 임시 파일 삭제
-            if temp_path.exists():
-                temp_path.unlink()
-                
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
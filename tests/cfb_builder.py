@@ -0,0 +1,198 @@
+"""
+테스트용 OLE 복합 파일(CFB v3, 512바이트 섹터) 생성 도우미
+
+olefile은 새 파일을 쓸 수 없으므로 테스트 입력을 직접 만든다.
+섹터 배치를 조절해 조각난 스트림, 미니 스트림 체인, DIFAT 확장을 만들 수 있다.
+"""
+
+import struct
+from itertools import zip_longest
+from typing import Dict, List
+
+MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+SECTOR = 512
+MINI_SECTOR = 64
+MINI_CUTOFF = 4096
+ENDOFCHAIN = 0xFFFFFFFE
+FREESECT = 0xFFFFFFFF
+FATSECT = 0xFFFFFFFD
+DIFSECT = 0xFFFFFFFC
+NOSTREAM = 0xFFFFFFFF
+
+
+class Layout:
+    """생성한 파일의 섹터 배치 (손상 테스트에서 FAT 항목 위치를 찾을 때 사용)"""
+
+    def __init__(self):
+        self.chains: Dict[str, List[int]] = {}       # 일반 섹터 스트림 경로 -> 섹터 체인
+        self.mini_chains: Dict[str, List[int]] = {}  # 미니 스트림 경로 -> 미니 섹터 체인
+        self.fat_sectors: List[int] = []
+        self.difat_sectors: List[int] = []
+        self.mini_fat_sectors: List[int] = []
+
+    def fat_offset(self, sector: int) -> int:
+        """FAT에서 sector의 다음 섹터 번호가 저장된 파일 오프셋"""
+        idx, pos = divmod(sector, SECTOR // 4)
+        return (self.fat_sectors[idx] + 1) * SECTOR + pos * 4
+
+    def mini_fat_offset(self, sector: int) -> int:
+        """미니 FAT에서 sector의 다음 미니 섹터 번호가 저장된 파일 오프셋"""
+        idx, pos = divmod(sector, SECTOR // 4)
+        return (self.mini_fat_sectors[idx] + 1) * SECTOR + pos * 4
+
+
+def _sector_count(size: int, unit: int) -> int:
+    return (size + unit - 1) // unit
+
+
+def _interleave(sizes: List[int], fragment: bool) -> List[List[int]]:
+    """각 항목에 섹터 번호 할당 (fragment이면 항목들을 번갈아 배치해 체인을 조각냄)"""
+    chains: List[List[int]] = [[] for _ in sizes]
+    if fragment:
+        order = [idx for row in zip_longest(*[[i] * n for i, n in enumerate(sizes)]) for idx in row
+                 if idx is not None]
+    else:
+        order = [i for i, n in enumerate(sizes) for _ in range(n)]
+    for sector, idx in enumerate(order):
+        chains[idx].append(sector)
+    return chains
+
+
+def _cfb_key(name: str):
+    """CFB 형제 정렬 순서 (길이 우선, 대소문자 무시)"""
+    return len(name), name.upper()
+
+
+def build_cfb(streams: Dict[str, bytes], fragment: bool = False, min_fat_sectors: int = 0):
+    """스트림 목록으로 CFB 파일 생성
+
+    Args:
+        streams: '저장소/스트림' 경로 -> 내용
+        fragment: 일반/미니 섹터를 스트림끼리 번갈아 배치 (연속되지 않은 체인)
+        min_fat_sectors: 최소 FAT 섹터 수 (109개를 넘으면 DIFAT 섹터 사용)
+
+    Returns:
+        (파일 내용, Layout)
+    """
+    layout = Layout()
+
+    # 디렉터리 엔트리: [이름, 종류, 자식 목록, 시작 섹터, 크기]
+    root = {'name': 'Root Entry', 'type': 5, 'kids': {}, 'start': ENDOFCHAIN, 'size': 0}
+    entries = [root]
+    stream_entries = {}
+    for path, data in streams.items():
+        parent = root
+        parts = path.split('/')
+        for part in parts[:-1]:
+            if part not in parent['kids']:
+                storage = {'name': part, 'type': 1, 'kids': {}, 'start': 0, 'size': 0}
+                parent['kids'][part] = storage
+                entries.append(storage)
+            parent = parent['kids'][part]
+        entry = {'name': parts[-1], 'type': 2, 'kids': {}, 'start': ENDOFCHAIN, 'size': len(data)}
+        parent['kids'][parts[-1]] = entry
+        entries.append(entry)
+        stream_entries[path] = entry
+
+    # 미니 스트림 (MINI_CUTOFF 미만)
+    small = [path for path, data in streams.items() if 0 < len(data) < MINI_CUTOFF]
+    mini_chains = _interleave([_sector_count(len(streams[p]), MINI_SECTOR) for p in small], fragment)
+    mini_count = sum(len(chain) for chain in mini_chains)
+    mini_stream = bytearray(mini_count * MINI_SECTOR)
+    mini_fat = [FREESECT] * (_sector_count(mini_count * 4, SECTOR) * SECTOR // 4)
+    for path, chain in zip(small, mini_chains):
+        data = streams[path]
+        for idx, sector in enumerate(chain):
+            piece = data[idx * MINI_SECTOR:(idx + 1) * MINI_SECTOR]
+            mini_stream[sector * MINI_SECTOR:sector * MINI_SECTOR + len(piece)] = piece
+            mini_fat[sector] = chain[idx + 1] if idx + 1 < len(chain) else ENDOFCHAIN
+        stream_entries[path]['start'] = chain[0]
+        layout.mini_chains[path] = chain
+
+    # 일반 섹터 항목: 큰 스트림, 미니 스트림, 미니 FAT, 디렉터리
+    items = [(path, streams[path]) for path, data in streams.items() if len(data) >= MINI_CUTOFF]
+    if mini_count:
+        items.append(('<mini>', bytes(mini_stream)))
+        items.append(('<minifat>', struct.pack(f'<{len(mini_fat)}I', *mini_fat)))
+    dir_count = _sector_count(len(entries) * 128, SECTOR)
+    items.append(('<dir>', bytes(dir_count * SECTOR)))  # 자리만 잡고 마지막에 채움
+
+    chains = _interleave([_sector_count(len(data), SECTOR) for _, data in items], fragment)
+    data_sectors = sum(len(chain) for chain in chains)
+
+    # FAT/DIFAT 섹터 수 (FAT는 자신과 DIFAT 섹터까지 덮어야 함)
+    num_fat = max(min_fat_sectors, 1)
+    while True:
+        num_difat = _sector_count(max(num_fat - 109, 0), SECTOR // 4 - 1)
+        total = data_sectors + num_fat + num_difat
+        if num_fat * (SECTOR // 4) >= total:
+            break
+        num_fat += 1
+    layout.fat_sectors = list(range(data_sectors, data_sectors + num_fat))
+    layout.difat_sectors = list(range(data_sectors + num_fat, total))
+
+    fat = [FREESECT] * (num_fat * SECTOR // 4)
+    body = bytearray(total * SECTOR)
+    starts = {}
+    for (name, data), chain in zip(items, chains):
+        for idx, sector in enumerate(chain):
+            piece = data[idx * SECTOR:(idx + 1) * SECTOR]
+            body[sector * SECTOR:sector * SECTOR + len(piece)] = piece
+            fat[sector] = chain[idx + 1] if idx + 1 < len(chain) else ENDOFCHAIN
+        starts[name] = chain
+        if not name.startswith('<'):
+            stream_entries[name]['start'] = chain[0]
+            layout.chains[name] = chain
+    for sector in layout.fat_sectors:
+        fat[sector] = FATSECT
+    for sector in layout.difat_sectors:
+        fat[sector] = DIFSECT
+    for idx, sector in enumerate(layout.fat_sectors):
+        body[sector * SECTOR:(sector + 1) * SECTOR] = struct.pack(
+            '<128I', *fat[idx * 128:(idx + 1) * 128])
+
+    # DIFAT 섹터 (127개 + 다음 DIFAT 섹터 번호)
+    extra = layout.fat_sectors[109:]
+    for idx, sector in enumerate(layout.difat_sectors):
+        values = extra[idx * 127:(idx + 1) * 127]
+        values += [FREESECT] * (127 - len(values))
+        following = layout.difat_sectors[idx + 1] if idx + 1 < len(layout.difat_sectors) else ENDOFCHAIN
+        body[sector * SECTOR:(sector + 1) * SECTOR] = struct.pack('<128I', *values, following)
+
+    if mini_count:
+        root['start'] = starts['<mini>'][0]
+        root['size'] = len(mini_stream)
+        layout.mini_fat_sectors = starts['<minifat>']
+
+    # 디렉터리 (형제는 CFB 순서로 정렬해 오른쪽 자식으로 연결)
+    sids = {id(entry): sid for sid, entry in enumerate(entries)}
+    links = {sid: [NOSTREAM, NOSTREAM, NOSTREAM] for sid in range(len(entries))}  # left, right, child
+    for entry in entries:
+        kids = sorted(entry['kids'].values(), key=lambda e: _cfb_key(e['name']))
+        if kids:
+            links[sids[id(entry)]][2] = sids[id(kids[0])]
+            for prev, kid in zip(kids, kids[1:]):
+                links[sids[id(prev)]][1] = sids[id(kid)]
+
+    directory = bytearray(dir_count * SECTOR)
+    for sid, entry in enumerate(entries):
+        name = entry['name'].encode('utf-16-le')
+        left, right, child = links[sid]
+        directory[sid * 128:(sid + 1) * 128] = struct.pack(
+            '<64sHBBIII16sIQQIQ', name, len(name) + 2, entry['type'], 1, left, right, child,
+            b'\0' * 16, 0, 0, 0, entry['start'], entry['size'])
+    for sid in range(len(entries), dir_count * SECTOR // 128):
+        directory[sid * 128:(sid + 1) * 128] = struct.pack(
+            '<64sHBBIII16sIQQIQ', b'', 0, 0, 0, NOSTREAM, NOSTREAM, NOSTREAM,
+            b'\0' * 16, 0, 0, 0, 0, 0)
+    for idx, sector in enumerate(starts['<dir>']):
+        body[sector * SECTOR:(sector + 1) * SECTOR] = directory[idx * SECTOR:(idx + 1) * SECTOR]
+
+    header_difat = layout.fat_sectors[:109] + [FREESECT] * (109 - min(num_fat, 109))
+    header = struct.pack(
+        '<8s16sHHHHH6sIIIIIIIII', MAGIC, b'\0' * 16, 0x3E, 3, 0xFFFE, 9, 6, b'\0' * 6,
+        0, num_fat, starts['<dir>'][0], 0, MINI_CUTOFF,
+        layout.mini_fat_sectors[0] if mini_count else ENDOFCHAIN, len(layout.mini_fat_sectors),
+        layout.difat_sectors[0] if layout.difat_sectors else ENDOFCHAIN, len(layout.difat_sectors),
+    ) + struct.pack('<109I', *header_difat)
+    return header + bytes(body), layout
@@ -0,0 +1,116 @@
+"""
+테스트용 HWP 레코드/문서 생성 도우미
+"""
+
+import struct
+import zlib
+
+from hwpconv.parsers import HwpParser
+
+from cfb_builder import build_cfb
+
+PARA_HEADER = HwpParser.HWPTAG_PARA_HEADER
+PARA_TEXT = HwpParser.HWPTAG_PARA_TEXT
+PARA_CHAR_SHAPE = HwpParser.HWPTAG_PARA_CHAR_SHAPE
+CTRL_HEADER = HwpParser.HWPTAG_CTRL_HEADER
+LIST_HEADER = HwpParser.HWPTAG_LIST_HEADER
+TABLE = HwpParser.HWPTAG_TABLE
+SHAPE_COMPONENT = 76
+SHAPE_COMPONENT_PICTURE = HwpParser.HWPTAG_SHAPE_COMPONENT_PICTURE
+
+
+def record(tag_id, data=b'', level=0):
+    """레코드 하나 (크기가 0xFFF 이상이면 확장 크기 헤더)"""
+    size = len(data)
+    if size >= 0xFFF:
+        return struct.pack('<II', tag_id | (level << 10) | (0xFFF << 20), size) + data
+    return struct.pack('<I', tag_id | (level << 10) | (size << 20)) + data
+
+
+def deflate(data, level=6):
+    """raw deflate 압축 (HWP 스트림 형식)"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush()
+
+
+def paragraph(text, level=0, char_shapes=()):
+    """PARA_HEADER + PARA_TEXT (+ PARA_CHAR_SHAPE) 레코드
+
+    char_shapes: (위치, 글자 모양 ID) 목록
+    """
+    raw = text.encode('utf-16-le')
+    header = struct.pack('<IIHBBH', len(raw) // 2, 0, 0, 0, 0, len(char_shapes)).ljust(24, b'\0')
+    records = record(PARA_HEADER, header, level) + record(PARA_TEXT, raw, level + 1)
+    if char_shapes:
+        shapes = b''.join(struct.pack('<II', pos, shape_id) for pos, shape_id in char_shapes)
+        records += record(PARA_CHAR_SHAPE, shapes, level + 1)
+    return records
+
+
+def picture(bin_data_id, level=1, ctrl_id=HwpParser.CTRL_ID_GSO):
+    """그림 컨트롤 ($pic/gso → SHAPE_COMPONENT → SHAPE_COMPONENT_PICTURE)"""
+    data = bytearray(80)
+    struct.pack_into('<H', data, 71, bin_data_id)
+    return (record(CTRL_HEADER, ctrl_id, level)
+            + record(SHAPE_COMPONENT, b'\0' * 16, level + 1)
+            + record(SHAPE_COMPONENT_PICTURE, bytes(data), level + 2))
+
+
+def text_box(text, level=1):
+    """그림 없는 gso (글상자)"""
+    return (record(CTRL_HEADER, HwpParser.CTRL_ID_GSO, level)
+            + record(SHAPE_COMPONENT, b'\0' * 16, level + 1)
+            + record(LIST_HEADER, b'\0' * 8, level + 1)
+            + paragraph(text, level + 1))
+
+
+def table(rows, level=1):
+    """표 컨트롤
+
+    rows: 셀의 2차원 목록 (셀은 문단 텍스트 또는 level + 1 기준으로 만든 셀 레코드 바이트)
+    """
+    col_count = len(rows[0])
+    records = record(CTRL_HEADER, HwpParser.CTRL_ID_TABLE, level)
+    records += record(TABLE, struct.pack('<IHH', 0, len(rows), col_count), level + 1)
+    for row in rows:
+        for cell in row:
+            if isinstance(cell, str):
+                cell = paragraph(cell, level + 1)
+            records += record(LIST_HEADER, b'\0' * 8, level + 1) + cell
+    return records
+
+
+def char_shape(font_size=1000, bold=False, italic=False, color=0):
+    """DocInfo CHAR_SHAPE 레코드"""
+    data = bytearray(72)
+    struct.pack_into('<I', data, 42, font_size)
+    struct.pack_into('<I', data, 46, (0x02 if bold else 0) | (0x01 if italic else 0))
+    struct.pack_into('<I', data, 52, color)
+    return record(HwpParser.HWPTAG_CHAR_SHAPE, bytes(data))
+
+
+def para_shape(align=1):
+    """DocInfo PARA_SHAPE 레코드 (align: 0 양쪽, 1 왼쪽, 2 오른쪽, 3 가운데)"""
+    return record(HwpParser.HWPTAG_PARA_SHAPE, struct.pack('<II', align, 0))
+
+
+def build_hwp(sections, doc_info=b'', bin_data=None, compressed=True, fragment=False):
+    """HWP 파일 내용 생성
+
+    Args:
+        sections: 섹션별 BodyText 레코드 바이트 목록
+        doc_info: DocInfo 레코드 바이트
+        bin_data: BinData 스트림 이름(예: 'BIN0001.png') -> 이미지 바이트
+        compressed: 스트림 압축 여부 (FileHeader 플래그도 같이 설정)
+        fragment: CFB 섹터를 스트림끼리 번갈아 배치
+    """
+    pack = deflate if compressed else bytes
+    header = bytearray(256)
+    header[:17] = b'HWP Document File'
+    struct.pack_into('<II', header, 32, 0x05000300, 0x01 if compressed else 0)
+    streams = {'FileHeader': bytes(header), 'DocInfo': pack(doc_info)}
+    for idx, data in enumerate(sections):
+        streams[f'BodyText/Section{idx}'] = pack(data)
+    for name, data in (bin_data or {}).items():
+        streams[f'BinData/{name}'] = pack(data)
+    return build_cfb(streams, fragment=fragment)[0]
@@ -0,0 +1,198 @@
+"""
+CompoundFile(mmap CFB 리더) 테스트
+
+같은 파일을 olefile로 읽은 결과와 스트림 목록, 존재 여부, 스트림 내용이 같아야 하고,
+손상된 섹터 체인은 무한 루프나 잘못된 내용 대신 CompoundFileError를 내야 한다.
+"""
+
+import random
+import struct
+
+import olefile
+import pytest
+
+from hwpconv.parsers.cfb import CompoundFile, CompoundFileError
+
+from cfb_builder import build_cfb
+
+
+def _streams():
+    """일반 섹터 스트림, 미니 스트림(경계 크기 포함), 빈 스트림, 중첩 저장소"""
+    rng = random.Random(0)
+    sizes = {
+        'FileHeader': 256,
+        'DocInfo': 4095,            # 미니 스트림 최대 크기
+        'BodyText/Section0': 4096,  # 일반 섹터 최소 크기
+        'BodyText/Section1': 70000,
+        'BodyText/Section10': 1,
+        'BinData/BIN0001.png': 64,
+        'BinData/BIN0002.jpg': 65,
+        'BinData/BIN0003.bmp': 9000,
+        'Scripts/Empty': 0,
+        'A/B/Deep': 700,
+        '\x05HwpSummaryInformation': 513,
+    }
+    return {path: rng.randbytes(size) for path, size in sizes.items()}
+
+
+STREAMS = _streams()
+LAYOUTS = [
+    pytest.param((False, 0), id='contiguous'),
+    pytest.param((True, 0), id='fragmented'),
+    pytest.param((False, 120), id='difat'),
+    pytest.param((True, 120), id='difat-fragmented'),
+]
+
+
+@pytest.fixture(params=LAYOUTS)
+def cfb_file(request, tmp_path):
+    fragment, min_fat_sectors = request.param
+    data, layout = build_cfb(STREAMS, fragment=fragment, min_fat_sectors=min_fat_sectors)
+    path = tmp_path / 'test.cfb'
+    path.write_bytes(data)
+    return path, layout
+
+
+def test_listdir_and_exists_match_olefile(cfb_file):
+    path, _ = cfb_file
+    ole = olefile.OleFileIO(str(path))
+    with CompoundFile(str(path)) as cfb:
+        assert cfb.listdir() == ole.listdir()
+        for name in list(STREAMS) + ['BodyText', 'A/B', 'bodytext/SECTION0', 'BodyText/Section2', 'Nope']:
+            assert cfb.exists(name) == ole.exists(name), name
+    ole.close()
+
+
+def test_stream_contents_match_olefile(cfb_file):
+    path, _ = cfb_file
+    ole = olefile.OleFileIO(str(path))
+    with CompoundFile(str(path)) as cfb:
+        for entry in ole.listdir():
+            expected = ole.openstream(entry).read()
+            assert expected == STREAMS['/'.join(entry)]
+            assert bytes(cfb.read_stream(entry)) == expected
+            assert cfb.openstream('/'.join(entry)).read() == expected
+    ole.close()
+
+
+def test_difat_layout_is_exercised():
+    _, layout = build_cfb(STREAMS, min_fat_sectors=120)
+    assert len(layout.fat_sectors) == 120
+    assert layout.difat_sectors
+
+
+@pytest.mark.parametrize('kind', ['bytes', 'file'])
+def test_other_sources(tmp_path, kind):
+    data, _ = build_cfb(STREAMS, fragment=True)
+    path = tmp_path / 'test.cfb'
+    path.write_bytes(data)
+    if kind == 'bytes':
+        cfb = CompoundFile(data)
+    else:
+        f = open(path, 'rb')
+        cfb = CompoundFile(f)
+    with cfb:
+        assert {'/'.join(entry): bytes(cfb.read_stream(entry)) for entry in cfb.listdir()} == STREAMS
+    if kind == 'file':
+        f.close()
+
+
+def test_contiguous_stream_is_zero_copy():
+    data, layout = build_cfb(STREAMS)
+    with CompoundFile(data) as cfb:
+        view = cfb.read_stream('BodyText/Section1')
+        assert isinstance(view, memoryview)
+        assert view == STREAMS['BodyText/Section1']
+        view.release()
+    assert all(b - a == 1 for a, b in zip(layout.chains['BodyText/Section1'],
+                                          layout.chains['BodyText/Section1'][1:]))
+
+
+def test_fragmented_chains_are_gathered():
+    data, layout = build_cfb(STREAMS, fragment=True)
+    chain = layout.chains['BodyText/Section1']
+    mini_chain = layout.mini_chains['BinData/BIN0002.jpg']
+    assert any(b - a != 1 for a, b in zip(chain, chain[1:]))
+    assert any(b - a != 1 for a, b in zip(mini_chain, mini_chain[1:]))
+    with CompoundFile(data) as cfb:
+        assert cfb.read_stream('BodyText/Section1') == STREAMS['BodyText/Section1']
+        assert cfb.read_stream('BinData/BIN0002.jpg') == STREAMS['BinData/BIN0002.jpg']
+
+
+def test_missing_stream_raises():
+    data, _ = build_cfb(STREAMS)
+    with CompoundFile(data) as cfb:
+        with pytest.raises(OSError):
+            cfb.read_stream('BodyText/Section2')
+        with pytest.raises(OSError):
+            cfb.read_stream('BodyText')  # 저장소
+
+
+# ----------------------------------------------------------------------
+# 손상된 체인
+# ----------------------------------------------------------------------
+
+def _patch(data, offset, value):
+    data = bytearray(data)
+    struct.pack_into('<I', data, offset, value)
+    return bytes(data)
+
+
+@pytest.mark.parametrize('fragment', [False, True])
+def test_cyclic_fat_chain_raises(fragment):
+    data, layout = build_cfb(STREAMS, fragment=fragment)
+    chain = layout.chains['BodyText/Section1']
+    data = _patch(data, layout.fat_offset(chain[-1]), chain[0])
+    with CompoundFile(data) as cfb:
+        with pytest.raises(CompoundFileError):
+            cfb.read_stream('BodyText/Section1')
+        # 다른 스트림은 그대로 읽힘
+        assert cfb.read_stream('BinData/BIN0003.bmp') == STREAMS['BinData/BIN0003.bmp']
+
+
+def test_out_of_range_fat_chain_raises():
+    data, layout = build_cfb(STREAMS)
+    chain = layout.chains['BodyText/Section1']
+    # FAT가 덮는 범위 밖의 섹터
+    data = _patch(data, layout.fat_offset(chain[1]), 0x00FFFFFF)
+    with CompoundFile(data) as cfb:
+        with pytest.raises(CompoundFileError):
+            cfb.read_stream('BodyText/Section1')
+
+
+def test_chain_past_end_of_file_raises():
+    data, layout = build_cfb(STREAMS, min_fat_sectors=120)
+    chain = layout.chains['BodyText/Section1']
+    # FAT 범위 안이지만 파일 끝을 넘는 섹터
+    data = _patch(data, layout.fat_offset(chain[1]), len(data) // 512 + 10)
+    with CompoundFile(data) as cfb:
+        with pytest.raises(CompoundFileError):
+            cfb.read_stream('BodyText/Section1')
+
+
+@pytest.mark.parametrize('fragment', [False, True])
+def test_cyclic_mini_chain_raises(fragment):
+    data, layout = build_cfb(STREAMS, fragment=fragment)
+    chain = layout.mini_chains['DocInfo']
+    data = _patch(data, layout.mini_fat_offset(chain[-1]), chain[0])
+    with CompoundFile(data) as cfb:
+        with pytest.raises(CompoundFileError):
+            cfb.read_stream('DocInfo')
+        assert cfb.read_stream('FileHeader') == STREAMS['FileHeader']
+
+
+def test_out_of_range_mini_chain_raises():
+    data, layout = build_cfb(STREAMS)
+    chain = layout.mini_chains['DocInfo']
+    data = _patch(data, layout.mini_fat_offset(chain[0]), 0x00FFFFFF)
+    with CompoundFile(data) as cfb:
+        with pytest.raises(CompoundFileError):
+            cfb.read_stream('DocInfo')
+
+
+def test_cyclic_directory_chain_raises():
+    data, layout = build_cfb(STREAMS)
+    first_dir = struct.unpack_from('<I', data, 48)[0]
+    data = _patch(data, layout.fat_offset(first_dir), first_dir)
+    with pytest.raises(CompoundFileError):
+        CompoundFile(data)
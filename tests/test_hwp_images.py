@@ -0,0 +1,102 @@
+"""
+HwpParser BinData 로딩 테스트
+
+본문에서 참조하는 그림은 파싱 중에 읽고, 참조되지 않은 BinData만 지연 로딩한다.
+"""
+
+import io
+
+import pytest
+
+from hwpconv import image_analyzer
+from hwpconv.parsers import HwpParser, ParseProfile
+from hwpconv.parsers import hwp as hwp_module
+
+from hwp_builder import build_hwp, paragraph, picture, table
+
+IMAGES = {f'BIN{n:04X}': bytes([n]) * (300 * n) for n in range(1, 5)}
+
+
+def _document():
+    """BIN0001은 본문, BIN0003은 표 셀에서 참조하고 BIN0002/BIN0004는 참조하지 않는 문서"""
+    body = paragraph('그림 앞 문단') + picture(1)
+    body += paragraph('표 문단') + table([['셀', paragraph('셀 그림', 2) + picture(3, level=3)]])
+    body += paragraph('마지막 문단')
+    return build_hwp([body], bin_data={f'{key}.png': data for key, data in IMAGES.items()})
+
+
+@pytest.fixture
+def hwp_path(tmp_path):
+    path = tmp_path / 'images.hwp'
+    path.write_bytes(_document())
+    return path
+
+
+@pytest.fixture
+def open_count(monkeypatch):
+    """_open_ole 호출 횟수"""
+    calls = []
+    original = hwp_module._open_ole
+
+    def counting_open(source, backend='olefile'):
+        calls.append(source)
+        return original(source, backend)
+
+    monkeypatch.setattr(hwp_module, '_open_ole', counting_open)
+    return calls
+
+
+@pytest.mark.parametrize('backend', ['olefile', 'mmap'])
+def test_referenced_images_are_read_during_parse(hwp_path, open_count, backend):
+    doc = HwpParser(ole_backend=backend).parse(str(hwp_path))
+    assert len(open_count) == 1
+    assert doc.images['BIN0001'].is_loaded
+    assert doc.images['BIN0003'].is_loaded
+    assert not doc.images['BIN0002'].is_loaded
+    assert not doc.images['BIN0004'].is_loaded
+
+    # 참조되지 않은 이미지는 다시 연 파일 하나를 공유
+    assert {key: image.data for key, image in doc.images.items()} == IMAGES
+    assert len(open_count) == 2
+
+
+def test_file_object_images_survive_close(hwp_path):
+    with open(hwp_path, 'rb') as f:
+        doc = HwpParser().parse(f)
+    assert {key: image.data for key, image in doc.images.items()} == IMAGES
+
+
+def test_bytesio_images_survive_close():
+    stream = io.BytesIO(_document())
+    doc = HwpParser().parse(stream)
+    stream.close()
+    assert {key: image.data for key, image in doc.images.items()} == IMAGES
+
+
+def test_lazy_read_failure_raises(hwp_path):
+    doc = HwpParser().parse(str(hwp_path))
+    hwp_path.unlink()
+    with pytest.raises(OSError):
+        doc.images['BIN0002'].data
+
+
+def test_images_profile_skips_bindata(hwp_path, open_count):
+    doc = HwpParser(profile=ParseProfile(images=False)).parse(str(hwp_path))
+    assert doc.images == {}
+    assert len(open_count) == 1
+
+
+def test_analysis_reuses_read_bytes(hwp_path, monkeypatch):
+    analyzed = []
+    monkeypatch.setattr(image_analyzer, 'is_available', lambda: True)
+    monkeypatch.setattr(image_analyzer, 'analyze_image',
+                        lambda data, mime_type: analyzed.append(data) or 'desc')
+    reads = []
+    original = hwp_module._BinDataStorage.read
+    monkeypatch.setattr(hwp_module._BinDataStorage, 'read',
+                        lambda self, path: reads.append(path) or original(self, path))
+
+    doc = HwpParser().parse(str(hwp_path), analyze_mode='on')
+    assert analyzed == list(IMAGES.values())
+    assert {key: image.data for key, image in doc.images.items()} == IMAGES
+    assert len(reads) == len(IMAGES)
@@ -0,0 +1,41 @@
+"""
+HwpParser 문단 런 분할 테스트
+"""
+
+import dataclasses
+
+import pytest
+
+from hwpconv.models import TextStyle
+from hwpconv.parsers import HwpParser
+
+
+@pytest.fixture
+def parser():
+    parser = HwpParser()
+    parser.char_shapes = {0: TextStyle(font_size=10.0), 1: TextStyle(font_size=10.0, bold=True)}
+    parser._build_char_shape_table()
+    return parser
+
+
+def test_runs_split_at_char_shape_positions(parser):
+    para = parser._create_paragraph('일반굵게일반', [(0, 0), (2, 1), (4, 0)], {})
+    assert [(run.text, run.style.bold) for run in para.runs] == [
+        ('일반', False), ('굵게', True), ('일반', False),
+    ]
+    # 같은 글자 모양 ID의 런은 서식 테이블의 인스턴스를 공유
+    assert para.runs[0].style is parser.char_shapes[0]
+
+
+def test_unknown_shape_and_unstyled_runs_use_default_style(parser):
+    plain = parser._create_paragraph('스타일 없음', [], {})
+    unknown = parser._create_paragraph('없는 ID', [(0, 99)], {})
+    assert plain.runs[0].style == TextStyle()
+    assert unknown.runs[0].style is plain.runs[0].style
+
+
+def test_shared_styles_cannot_be_modified(parser):
+    para = parser._create_paragraph('문단', [], {})
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        para.runs[0].style.bold = True
+    assert parser._create_paragraph('다른 문단', [], {}).runs[0].style.bold is False
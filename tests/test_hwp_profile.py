@@ -0,0 +1,133 @@
+"""
+HwpParser 선택적 파싱 프로파일 테스트
+
+프로파일로 개체를 끄면 기본 프로파일 출력에서 그 개체만 빠져야 한다. (새 출력이 생기면 안 됨)
+"""
+
+import struct
+
+import pytest
+
+from hwpconv.models import Document, Image, Paragraph, Table
+from hwpconv.parsers import HwpParser, ParseProfile
+
+PARA_HEADER = HwpParser.HWPTAG_PARA_HEADER
+PARA_TEXT = HwpParser.HWPTAG_PARA_TEXT
+CTRL_HEADER = HwpParser.HWPTAG_CTRL_HEADER
+LIST_HEADER = HwpParser.HWPTAG_LIST_HEADER
+TABLE = HwpParser.HWPTAG_TABLE
+SHAPE_COMPONENT = 76
+SHAPE_COMPONENT_PICTURE = HwpParser.HWPTAG_SHAPE_COMPONENT_PICTURE
+
+
+def _paragraph(text, level):
+    header = struct.pack('<IIHBBH', len(text), 0, 0, 0, 0, 0).ljust(24, b'\0')
+    return [(PARA_HEADER, header, level), (PARA_TEXT, text.encode('utf-16-le'), level + 1)]
+
+
+def _picture(ctrl_id, bin_data_id, level):
+    picture = bytearray(80)
+    struct.pack_into('<H', picture, 71, bin_data_id)
+    return [
+        (CTRL_HEADER, ctrl_id, level),
+        (SHAPE_COMPONENT, b'\0' * 16, level + 1),
+        (SHAPE_COMPONENT_PICTURE, bytes(picture), level + 2),
+    ]
+
+
+def _text_box(text, level):
+    return [
+        (CTRL_HEADER, HwpParser.CTRL_ID_GSO, level),
+        (SHAPE_COMPONENT, b'\0' * 16, level + 1),
+        (LIST_HEADER, b'\0' * 8, level + 1),
+        *_paragraph(text, level + 1),
+    ]
+
+
+def _table(text, bin_data_id, level):
+    return [
+        (CTRL_HEADER, HwpParser.CTRL_ID_TABLE, level),
+        (TABLE, struct.pack('<IHH', 0, 1, 1), level + 1),
+        (LIST_HEADER, b'\0' * 8, level + 1),
+        *_paragraph(text, level + 1),
+        *_picture(HwpParser.CTRL_ID_GSO, bin_data_id, level + 2),
+    ]
+
+
+def _footnote(text, level):
+    return [
+        (CTRL_HEADER, HwpParser.CTRL_ID_FOOTNOTE, level),
+        (LIST_HEADER, b'\0' * 8, level + 1),
+        *_paragraph(text, level + 1),
+    ]
+
+
+def _records():
+    """본문 문단, gso 그림, $pic 그림, 글상자, 그림이 든 표, 각주가 섞인 섹션 레코드"""
+    records = []
+    records += _paragraph('첫 문단', 0)
+    records += _picture(HwpParser.CTRL_ID_GSO, 1, 1)
+    records += _paragraph('둘째 문단', 0)
+    records += _text_box('글상자 안 문단', 1)
+    records += _picture(HwpParser.CTRL_ID_PIC, 2, 1)
+    records += _paragraph('셋째 문단', 0)
+    records += _table('셀 문단', 3, 1)
+    records += _footnote('각주 문단', 1)
+    records += _paragraph('마지막 문단', 0)
+    return [(tag, memoryview(data), level) for tag, data, level in records]
+
+
+def _summarize(profile):
+    """섹션 요소를 비교 가능한 형태로 변환"""
+    doc = Document(images={
+        f'BIN{n:04X}': Image(id=f'BIN{n:04X}', data=b'img') for n in (1, 2, 3)
+    })
+    section = HwpParser(profile=profile)._parse_section_records(iter(_records()), doc)
+    summary = []
+    for elem in section.elements:
+        if isinstance(elem, Paragraph):
+            summary.append(('para', elem.text))
+        elif isinstance(elem, Image):
+            summary.append(('image', elem.id))
+        elif isinstance(elem, Table):
+            cells = [(cell.text, tuple(cell.image_ids)) for row in elem.rows for cell in row.cells]
+            summary.append(('table', tuple(cells)))
+    return summary
+
+
+def test_default_profile_places_pictures_inline():
+    summary = _summarize(ParseProfile())
+    assert summary == [
+        ('para', '첫 문단'),
+        ('image', 'BIN0001'),
+        ('para', '둘째 문단'),
+        ('image', 'BIN0002'),
+        ('para', '셋째 문단'),
+        ('table', (('셀 문단', ('BIN0003',)),)),
+        ('para', '각주 문단'),
+        ('para', '마지막 문단'),
+    ]
+
+
+def test_drawings_off_keeps_gso_pictures():
+    assert _summarize(ParseProfile(drawings=False)) == _summarize(ParseProfile())
+
+
+def test_images_off_only_removes_pictures():
+    default = _summarize(ParseProfile())
+    restricted = _summarize(ParseProfile(images=False))
+    expected = [
+        ('table', tuple((text, ()) for text, _ in elem[1])) if elem[0] == 'table' else elem
+        for elem in default if elem[0] != 'image'
+    ]
+    assert restricted == expected
+
+
+@pytest.mark.parametrize('profile, removed', [
+    (ParseProfile(tables=False), ('table', (('셀 문단', ('BIN0003',)),))),
+    (ParseProfile(footnotes=False), ('para', '각주 문단')),
+])
+def test_disabled_objects_only_remove_output(profile, removed):
+    default = _summarize(ParseProfile())
+    restricted = _summarize(profile)
+    assert restricted == [elem for elem in default if elem != removed]
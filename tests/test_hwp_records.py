@@ -0,0 +1,95 @@
+"""
+HwpParser 레코드 순회 테스트
+
+스트리밍 경로(_iter_inflated_chunks + _iter_records_incremental)는 청크 경계와 관계없이
+전체 스트림을 한 번에 읽는 _iter_records와 같은 레코드를 내야 한다.
+"""
+
+import io
+import random
+
+import pytest
+
+from hwpconv.parsers import HwpParser
+
+from hwp_builder import deflate, record
+
+
+def _stream():
+    """일반 레코드, 빈 레코드, 확장 크기(0xFFF 이상) 레코드가 섞인 레코드 스트림"""
+    rng = random.Random(0)
+    parts = []
+    for idx in range(200):
+        size = rng.choice((0, 1, 2, 3, 5, 13, 64, 300, 4094, 0xFFE))
+        parts.append(record(idx % 90, rng.randbytes(size), idx % 4))
+    parts.insert(50, record(67, rng.randbytes(0xFFF), 1))
+    parts.insert(120, record(67, rng.randbytes(70000), 2))
+    return b''.join(parts)
+
+
+def _records(records):
+    return [(tag, bytes(data), level) for tag, data, level in records]
+
+
+def _streamed(raw, chunk_size, compressed=True):
+    parser = HwpParser(streaming=True)
+    parser._is_compressed = compressed
+    parser.STREAM_CHUNK_SIZE = chunk_size
+    return _records(parser._iter_records_incremental(parser._iter_inflated_chunks(io.BytesIO(raw))))
+
+
+@pytest.fixture(scope='module')
+def stream():
+    data = _stream()
+    return data, _records(HwpParser()._iter_records(data))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 4096])
+def test_chunked_records_match_whole_stream(stream, chunk_size):
+    data, expected = stream
+    chunks = [data[pos:pos + chunk_size] for pos in range(0, len(data), chunk_size)]
+    assert _records(HwpParser()._iter_records_incremental(chunks)) == expected
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 4096])
+def test_streamed_inflate_matches_whole_stream(stream, chunk_size):
+    data, expected = stream
+    assert _streamed(deflate(data), chunk_size) == expected
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 4096])
+def test_uncompressed_stream_falls_back_to_raw(stream, chunk_size):
+    data, expected = stream
+    # FileHeader에 압축 플래그가 있어도 압축되지 않은 섹션은 그대로 읽음
+    assert _streamed(data, chunk_size, compressed=True) == expected
+    assert _streamed(data, chunk_size, compressed=False) == expected
+
+
+def test_extended_size_header_split_across_chunks():
+    body = bytes(range(256)) * 20
+    data = record(17, b'ab') + record(67, body, 1) + record(18, b'cd', 2)
+    expected = _records(HwpParser()._iter_records(data))
+    # 확장 크기 헤더(8바이트)의 모든 위치에서 청크를 나눔
+    for split in range(len(record(17, b'ab')), len(record(17, b'ab')) + 9):
+        chunks = [data[:split], data[split:]]
+        assert _records(HwpParser()._iter_records_incremental(chunks)) == expected
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 4096])
+def test_truncated_stream_yields_complete_records_only(stream, chunk_size):
+    data, expected = stream
+    cut = len(data) - 1000
+    truncated = _streamed(deflate(data)[:len(deflate(data)) // 2], chunk_size)
+    assert truncated == expected[:len(truncated)]
+
+    raw_truncated = _records(HwpParser()._iter_records_incremental([data[:cut]]))
+    assert raw_truncated == _records(HwpParser()._iter_records(data[:cut]))
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 4096])
+def test_corrupt_stream_stops_without_error(stream, chunk_size):
+    data, expected = stream
+    compressed = bytearray(deflate(data))
+    compressed[len(compressed) // 2:] = b'\xff' * (len(compressed) - len(compressed) // 2)
+    records = _streamed(bytes(compressed), chunk_size)
+    assert records == expected[:len(records)]
@@ -0,0 +1,105 @@
+"""
+HwpParser 전체 텍스트 모드 테스트
+
+레코드 텍스트 추출(iter_text)과 parse()의 Document.text가 같은 문단을 같은 순서로 내야 한다.
+"""
+
+import pytest
+
+from hwpconv.parsers import HwpParser, ParseProfile
+
+from hwp_builder import CTRL_HEADER, LIST_HEADER, build_hwp, paragraph, picture, record, table, text_box
+
+# 인라인 제어문자(탭): 코드 + 부가 데이터 6 WCHAR + 코드
+TAB = '\t' + '\0' * 6 + '\t'
+
+
+def _footnote(text, level=1):
+    return (record(CTRL_HEADER, HwpParser.CTRL_ID_FOOTNOTE, level)
+            + record(LIST_HEADER, b'\0' * 8, level + 1)
+            + paragraph(text, level + 1))
+
+
+def _document(nested_table=False):
+    """표(여러 문단 셀), 그림, 글상자, 각주, 제어문자가 섞인 두 구역 문서"""
+    outer_cell = paragraph('바깥 셀', 2)
+    if nested_table:
+        outer_cell += table([['안쪽 셀 A', '안쪽 셀 B']], level=3)
+    first = b''.join([
+        paragraph('제1조 목적'),
+        paragraph('표 앞 문단') + table([
+            ['셀 1-1', paragraph('셀 1-2', 2) + paragraph('셀 1-2 둘째 문단', 2)],
+            [outer_cell, '셀 2-2'],
+        ]),
+        paragraph('그림 앞 문단') + picture(1),
+        paragraph('글상자 앞 문단') + text_box('글상자 문단'),
+        paragraph('각주가 달린 문단') + _footnote('각주 문단'),
+        paragraph('줄\n바꿈과' + TAB + '탭'),
+        paragraph('서로게이트 😀 문단'),
+    ])
+    second = paragraph('둘째 구역 문단') + table([['둘째 구역 셀']]) + paragraph('마지막 문단')
+    return build_hwp([first, second], bin_data={'BIN0001.png': b'png'})
+
+
+def _lines(text):
+    return [line.strip() for line in text.split('\n') if line.strip()]
+
+
+@pytest.mark.parametrize('profile', [
+    ParseProfile(),
+    ParseProfile(tables=False),
+    ParseProfile(images=False),
+    ParseProfile(drawings=False),
+    ParseProfile(footnotes=False),
+])
+@pytest.mark.parametrize('streaming', [False, True])
+def test_iter_text_matches_document_text(profile, streaming):
+    data = _document()
+    parser = HwpParser(streaming=streaming, profile=profile)
+    expected = _lines(parser.parse(data).text)
+    assert expected
+    assert _lines('\n'.join(parser.iter_text(data))) == expected
+
+
+@pytest.mark.parametrize('streaming', [False, True])
+def test_nested_table_text_in_same_order(streaming):
+    # parse()는 중첩 표의 셀 텍스트를 바깥 셀 문단 한 줄로 합치고, iter_text는 문단마다 한 줄을 낸다.
+    # 줄 구분만 다르고 텍스트와 순서는 같아야 한다.
+    data = _document(nested_table=True)
+    parser = HwpParser(streaming=streaming)
+    document_text = parser.parse(data).text
+    assert '바깥 셀 안쪽 셀 A 안쪽 셀 B' in _lines(document_text)
+    assert '\n'.join(parser.iter_text(data)).split() == document_text.split()
+
+
+def test_iter_text_includes_tables_and_footnotes():
+    text = HwpParser().extract_text(_document(nested_table=True))
+    for fragment in ('셀 1-2 둘째 문단', '안쪽 셀 B', '각주 문단', '서로게이트 😀 문단', '둘째 구역 셀'):
+        assert fragment in text
+    # parse()처럼 그림/글상자(gso) 하위 문단은 넣지 않음
+    assert '글상자 문단' not in text
+
+
+def test_uncompressed_document():
+    data = build_hwp([paragraph('압축 안 된 문단') + table([['셀']])], compressed=False)
+    assert list(HwpParser().iter_text(data)) == ['압축 안 된 문단', '셀']
+
+
+@pytest.mark.parametrize('text, expected, positions', [
+    ('앞' + TAB + '뒤\r', '앞\t뒤', [(1, 9), (3, 13)]),
+    # 서로게이트 쌍이 있으면 바이트 단위 경로 (위치는 WCHAR 단위)
+    ('앞' + TAB + '😀뒤\r', '앞\t😀뒤', [(1, 9), (5, 13)]),
+])
+@pytest.mark.parametrize('use_numpy', [False, True])
+def test_extract_text_with_ctrls_positions(text, expected, positions, use_numpy):
+    parser = HwpParser()
+    parser.use_numpy = use_numpy
+    data = text.encode('utf-16-le') * 20  # NumPy 경로 최소 길이를 넘기도록 반복
+    extracted, ctrl_info = parser._extract_text_with_ctrls(data)
+    assert extracted == expected * 20
+    assert [(pos, code) for pos, code, _ in ctrl_info[:2]] == positions
+    # 반복 한 번의 위치 수 = 문단 끝(13) 위치 + 1
+    assert ctrl_info[2][0] == positions[0][0] + positions[1][0] + 1
+
+    # char_count로 자르기 (탭까지)
+    assert parser._extract_text_with_ctrls(data, 2)[0] == expected[:2]
@@ -0,0 +1,103 @@
+"""
+HwpxParser BinData 매핑 테스트 (bindata_backend='mmap')
+
+압축 없이 저장(STORED)된 멤버는 아카이브 매핑의 슬라이스로, 압축(DEFLATED)된 멤버는
+zipfile로 읽으며 어느 쪽이든 내용은 zipfile.read와 같아야 한다.
+"""
+
+import io
+import random
+import zipfile
+
+import pytest
+
+from hwpconv.parsers import HwpxParser
+from hwpconv.parsers.base import map_source
+
+SECTION = (
+    '<hs:sec xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section" '
+    'xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph">'
+    '<hp:p><hp:run><hp:t>본문</hp:t></hp:run></hp:p></hs:sec>'
+)
+rng = random.Random(0)
+IMAGES = {
+    'BinData/stored.png': (zipfile.ZIP_STORED, rng.randbytes(5000), b''),
+    'BinData/stored_extra.bmp': (zipfile.ZIP_STORED, rng.randbytes(700), b'\xfe\xca\x04\x00abcd'),
+    'BinData/empty.gif': (zipfile.ZIP_STORED, b'', b''),
+    'BinData/deflated.jpg': (zipfile.ZIP_DEFLATED, bytes(3000) + rng.randbytes(3000), b''),
+}
+
+
+def _hwpx():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zf:
+        zf.writestr('Contents/header.xml', '<hh:head xmlns:hh="http://www.hancom.co.kr/hwpml/2011/head"/>',
+                    zipfile.ZIP_DEFLATED)
+        zf.writestr('Contents/section0.xml', SECTION, zipfile.ZIP_DEFLATED)
+        for name, (compression, data, extra) in IMAGES.items():
+            info = zipfile.ZipInfo(name)
+            info.compress_type = compression
+            info.extra = extra
+            zf.writestr(info, data)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def hwpx_path(tmp_path):
+    path = tmp_path / 'images.hwpx'
+    path.write_bytes(_hwpx())
+    return path
+
+
+def _image_id(name):
+    return name.rsplit('/', 1)[-1].rsplit('.', 1)[0]
+
+
+@pytest.mark.parametrize('source', ['path', 'bytes'])
+@pytest.mark.parametrize('prefetch_workers', [None, 2])
+def test_mmap_backend_matches_zipfile_read(hwpx_path, source, prefetch_workers):
+    data = str(hwpx_path) if source == 'path' else hwpx_path.read_bytes()
+    parser = HwpxParser(bindata_backend='mmap', prefetch_workers=prefetch_workers)
+    doc = parser.parse(data)
+    with zipfile.ZipFile(hwpx_path) as zf:
+        for name, (compression, content, _) in IMAGES.items():
+            image = doc.images[_image_id(name)]
+            assert image.data == zf.read(name) == content
+            if compression == zipfile.ZIP_STORED:
+                assert isinstance(image.data, memoryview), name
+            else:
+                # 압축된 멤버는 zipfile로 풀어 읽음
+                assert isinstance(image.data, bytes), name
+
+
+def test_zipfile_backend_reads_bytes(hwpx_path):
+    doc = HwpxParser().parse(str(hwpx_path))
+    for name, (_, content, _) in IMAGES.items():
+        image = doc.images[_image_id(name)]
+        assert isinstance(image.data, bytes)
+        assert image.data == content
+
+
+def test_member_view(hwpx_path):
+    parser = HwpxParser(bindata_backend='mmap')
+    with zipfile.ZipFile(hwpx_path) as zf:
+        # 매핑이 없으면 항상 None
+        assert parser._member_view(zf, 'BinData/stored.png') is None
+
+        parser._archive = map_source(str(hwpx_path))
+        for name, (compression, content, _) in IMAGES.items():
+            view = parser._member_view(zf, name)
+            if compression == zipfile.ZIP_STORED:
+                assert view == zf.read(name), name
+            else:
+                assert view is None, name
+        assert parser._member_view(zf, 'BinData/missing.png') is None
+
+        # 암호화 플래그가 있는 멤버는 제외
+        zf.getinfo('BinData/stored.png').flag_bits |= 0x1
+        assert parser._member_view(zf, 'BinData/stored.png') is None
+
+        # 매핑이 잘린 경우(파일 끝을 넘는 멤버)도 None
+        parser._archive = parser._archive[:zf.getinfo('BinData/stored_extra.bmp').header_offset + 40]
+        assert parser._member_view(zf, 'BinData/stored_extra.bmp') is None
+    parser._archive = None
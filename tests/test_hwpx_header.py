@@ -0,0 +1,131 @@
+"""
+HwpxParser header.xml 캐시/네임스페이스 테스트
+
+header.xml 캐시는 ZIP 중앙 디렉터리의 (CRC32, 크기)를 키로 쓰고, 네임스페이스는 인스턴스마다 따로 둔다.
+네임스페이스가 다른 문서를 한 파서로 번갈아 파싱해도 결과가 섞이면 안 된다.
+"""
+
+import io
+import zipfile
+
+import pytest
+
+from hwpconv.parsers import HwpxParser, StyleTableCache
+
+HWPML_2011 = {
+    'hh': 'http://www.hancom.co.kr/hwpml/2011/head',
+    'hp': 'http://www.hancom.co.kr/hwpml/2011/paragraph',
+    'hs': 'http://www.hancom.co.kr/hwpml/2011/section',
+}
+OWPML_2024 = {
+    'hh': 'http://www.owpml.org/owpml/2024/head',
+    'hp': 'http://www.owpml.org/owpml/2024/paragraph',
+    'hs': 'http://www.owpml.org/owpml/2024/section',
+}
+
+
+def _hwpx(uris, prefixes=('hh', 'hp', 'hs'), bold_id='1', text='본문', sections=1):
+    """글꼴, 보통/굵게 charPr, 가운데 정렬 paraPr이 있는 문서 (구역은 모두 같은 내용)"""
+    h, p, s = prefixes
+    head_ns = ' '.join(f'xmlns:{prefix}="{uris[key]}"' for prefix, key in zip(prefixes, ('hh', 'hp', 'hs')))
+    header = (
+        f'<{h}:head {head_ns}><{h}:refList>'
+        f'<{h}:fontfaces><{h}:fontface lang="HANGUL"><{h}:font id="0" face="바탕"/></{h}:fontface></{h}:fontfaces>'
+        f'<{h}:charProperties>'
+        f'<{h}:charPr id="0" height="1000"><{h}:fontRef hangul="0"/></{h}:charPr>'
+        f'<{h}:charPr id="{bold_id}" height="1000" bold="true"><{h}:fontRef hangul="0"/></{h}:charPr>'
+        f'</{h}:charProperties>'
+        f'<{h}:paraProperties><{h}:paraPr id="0" align="CENTER"/></{h}:paraProperties>'
+        f'</{h}:refList></{h}:head>'
+    )
+    section = (
+        f'<{s}:sec xmlns:{s}="{uris["hs"]}" xmlns:{p}="{uris["hp"]}">'
+        f'<{p}:p paraPrIDRef="0"><{p}:run charPrIDRef="0"><{p}:t>{text} </{p}:t></{p}:run>'
+        f'<{p}:run charPrIDRef="{bold_id}"><{p}:t>굵게</{p}:t></{p}:run></{p}:p>'
+        f'<{p}:p><{p}:run><{p}:t>둘째 문단</{p}:t></{p}:run></{p}:p>'
+        f'</{s}:sec>'
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('Contents/header.xml', header)
+        for idx in range(sections):
+            zf.writestr(f'Contents/section{idx}.xml', section)
+    return buffer.getvalue()
+
+
+def _summary(doc, section=0):
+    paragraphs = doc.sections[section].elements
+    return [[(run.text, run.style.bold, run.style.font_name) for run in para.runs] for para in paragraphs]
+
+
+DOCUMENTS = {
+    'hwpml': _hwpx(HWPML_2011),
+    'owpml': _hwpx(OWPML_2024, bold_id='7', text='새 형식'),
+    'prefixes': _hwpx(HWPML_2011, prefixes=('head', 'para', 'sec'), text='다른 접두사'),
+}
+EXPECTED = {
+    name: [[(text + ' ', False, '바탕'), ('굵게', True, '바탕')], [('둘째 문단', False, '바탕')]]  # charPrIDRef가 없으면 0번
+    for name, text in (('hwpml', '본문'), ('owpml', '새 형식'), ('prefixes', '다른 접두사'))
+}
+
+
+@pytest.mark.parametrize('cache', [True, False], ids=['cache', 'no-cache'])
+def test_one_parser_handles_different_namespaces(cache):
+    parser = HwpxParser()
+    parser.header_cache = StyleTableCache() if cache else None
+    class_ns = dict(HwpxParser.NS)
+
+    order = ['hwpml', 'owpml', 'prefixes', 'owpml', 'hwpml', 'prefixes']
+    for name in order:
+        doc = parser.parse(DOCUMENTS[name])
+        assert _summary(doc) == EXPECTED[name], name
+        expected_uri = (OWPML_2024 if name == 'owpml' else HWPML_2011)['hh']
+        assert parser.NS['hh'] == expected_uri
+        assert HwpxParser.NS == class_ns
+
+    if cache:
+        # 'hwpml'과 'prefixes'는 header.xml 바이트가 달라 키도 다름
+        assert parser.header_cache.stats()['misses'] == 3
+        assert parser.header_cache.stats()['hits'] == 3
+
+
+def test_cache_key_is_crc_and_size():
+    parser = HwpxParser()
+    parser.header_cache = StyleTableCache()
+    with zipfile.ZipFile(io.BytesIO(DOCUMENTS['hwpml'])) as zf:
+        info = zf.getinfo('Contents/header.xml')
+    parser.parse(DOCUMENTS['hwpml'])
+    assert list(parser.header_cache._data) == [(info.CRC, info.file_size)]
+
+    # 본문만 다른 문서는 header.xml이 같으므로 적중
+    parser.parse(_hwpx(HWPML_2011, text='다른 본문'))
+    assert parser.header_cache.stats()['hits'] == 1
+
+
+def test_cache_hit_does_not_share_mutable_tables():
+    parser = HwpxParser()
+    parser.header_cache = StyleTableCache()
+    parser.parse(DOCUMENTS['owpml'])
+    (namespaces, char_shapes, para_shapes, font_faces), = parser.header_cache._data.values()
+
+    parser.para_shapes['0']['align'] = 'RIGHT'
+    parser.font_faces['0'] = '수정된 글꼴'
+    parser.NS['hh'] = 'urn:changed'
+    assert para_shapes['0']['align'] == 'CENTER'
+    assert font_faces['0'] == '바탕'
+    assert namespaces['hh'] == OWPML_2024['hh']
+
+    other = HwpxParser()
+    other.header_cache = parser.header_cache
+    assert _summary(other.parse(DOCUMENTS['owpml'])) == EXPECTED['owpml']
+    assert other.para_shapes['0'] is not para_shapes['0']
+    assert other.para_shapes['0']['align'] == 'CENTER'
+
+
+@pytest.mark.parametrize('worker_type', ['thread', 'process'])
+def test_worker_parsers_use_document_namespaces(worker_type):
+    parser = HwpxParser(workers=2, worker_type=worker_type)
+    for uris, name in ((OWPML_2024, 'owpml'), (HWPML_2011, 'hwpml')):
+        text = '새 형식' if name == 'owpml' else '본문'
+        doc = parser.parse(_hwpx(uris, text=text, sections=3))
+        assert [_summary(doc, idx) for idx in range(3)] == [EXPECTED[name]] * 3
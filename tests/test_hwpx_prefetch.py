@@ -0,0 +1,148 @@
+"""
+HwpxParser ZIP 멤버 선행 압축 해제(_MemberPrefetcher) 테스트
+
+가져가지 않은 작업은 창 크기를 넘지 않아야 하고, 순서를 벗어난 요청과 작업 중 예외도
+호출한 쪽에서 그대로 처리되어야 한다.
+"""
+
+import io
+import random
+import threading
+import zipfile
+
+import pytest
+
+from hwpconv.parsers import HwpxParser
+from hwpconv.parsers.hwpx import _MemberPrefetcher
+
+from test_hwpx_text import _document, _lines
+
+NAMES = [f'BinData/image{idx:02d}.png' for idx in range(20)]
+
+
+def _archive(compression=zipfile.ZIP_DEFLATED):
+    rng = random.Random(0)
+    contents = {name: rng.randbytes(1000) * (idx + 1) for idx, name in enumerate(NAMES)}
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression) as zf:
+        for name, data in contents.items():
+            zf.writestr(name, data)
+    return buffer.getvalue(), contents
+
+
+@pytest.fixture
+def archive(tmp_path):
+    data, contents = _archive()
+    path = tmp_path / 'members.zip'
+    path.write_bytes(data)
+    return str(path), contents
+
+
+@pytest.mark.parametrize('workers', [1, 3])
+def test_outstanding_jobs_stay_within_window(archive, monkeypatch, workers):
+    path, contents = archive
+    gate = threading.Event()
+    started = []
+    original = _MemberPrefetcher._read
+
+    def blocking_read(self, name):
+        started.append(name)
+        gate.wait(5)
+        return original(self, name)
+
+    monkeypatch.setattr(_MemberPrefetcher, '_read', blocking_read)
+    prefetcher = _MemberPrefetcher(path, NAMES, workers)
+    try:
+        window = _MemberPrefetcher.WINDOW_PER_WORKER * workers
+        # 작업이 막혀 있어도 창 크기만큼만 제출하고 나머지는 대기열에 남음
+        assert list(prefetcher._futures) == NAMES[:window]
+        assert list(prefetcher._queue) == NAMES[window:]
+        gate.set()
+
+        for idx, name in enumerate(NAMES):
+            assert prefetcher.read(name) == contents[name]
+            assert len(prefetcher._futures) <= window
+            assert len(prefetcher._futures) + len(prefetcher._queue) == len(NAMES) - idx - 1
+        assert sorted(started) == sorted(NAMES)
+    finally:
+        gate.set()
+        prefetcher.close()
+
+
+def test_out_of_order_reads(archive):
+    path, contents = archive
+    order = NAMES[::-1]
+    random.Random(1).shuffle(order)
+    prefetcher = _MemberPrefetcher(path, NAMES, 2)
+    try:
+        for name in order:
+            assert name in prefetcher
+            assert prefetcher.read(name) == contents[name]
+            assert name not in prefetcher
+            assert len(prefetcher._futures) <= prefetcher._window
+    finally:
+        prefetcher.close()
+
+
+def test_job_exception_reaches_caller(archive, monkeypatch):
+    path, contents = archive
+    original = _MemberPrefetcher._read
+    failing = NAMES[3]
+
+    def failing_read(self, name):
+        if name == failing:
+            raise RuntimeError(f'압축 해제 실패: {name}')
+        return original(self, name)
+
+    monkeypatch.setattr(_MemberPrefetcher, '_read', failing_read)
+    prefetcher = _MemberPrefetcher(path, NAMES, 2)
+    try:
+        for name in NAMES:
+            if name == failing:
+                with pytest.raises(RuntimeError, match='image03'):
+                    prefetcher.read(name)
+            else:
+                # 실패한 작업 다음 멤버도 계속 읽힘
+                assert prefetcher.read(name) == contents[name]
+    finally:
+        prefetcher.close()
+
+
+def test_corrupt_member_raises_from_read(tmp_path):
+    data, contents = _archive(zipfile.ZIP_STORED)
+    data = bytearray(data)
+    # 저장(STORED) 멤버 내용 한 바이트를 바꿔 CRC 불일치
+    with zipfile.ZipFile(io.BytesIO(bytes(data))) as zf:
+        info = zf.getinfo(NAMES[5])
+    data[info.header_offset + 30 + len(info.filename) + len(info.extra)] ^= 0xFF
+    path = tmp_path / 'corrupt.zip'
+    path.write_bytes(bytes(data))
+
+    prefetcher = _MemberPrefetcher(str(path), NAMES, 2)
+    try:
+        assert prefetcher.read(NAMES[0]) == contents[NAMES[0]]
+        with pytest.raises(zipfile.BadZipFile):
+            prefetcher.read(NAMES[5])
+        assert prefetcher.read(NAMES[6]) == contents[NAMES[6]]
+    finally:
+        prefetcher.close()
+
+
+def test_close_with_unread_jobs(archive):
+    path, contents = archive
+    prefetcher = _MemberPrefetcher(path, NAMES, 2)
+    assert prefetcher.read(NAMES[1]) == contents[NAMES[1]]
+    prefetcher.close()
+    assert NAMES[0] not in prefetcher
+    assert not prefetcher._futures and not prefetcher._handles
+
+
+@pytest.mark.parametrize('source', ['path', 'bytes'])
+def test_parse_with_prefetch_matches_sequential(tmp_path, source):
+    data = _document()
+    if source == 'path':
+        path = tmp_path / 'doc.hwpx'
+        path.write_bytes(data)
+        data = str(path)
+    expected = _lines(HwpxParser().parse(data).text)
+    assert _lines(HwpxParser(prefetch_workers=2).parse(data).text) == expected
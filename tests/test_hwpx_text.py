@@ -0,0 +1,107 @@
+"""
+HwpxParser 전체 텍스트 모드 테스트
+
+expat 텍스트 추출(iter_text)과 트리 파싱(parse)의 Document.text가 같은 문단을 같은 순서로 내야 한다.
+"""
+
+import io
+import zipfile
+
+import pytest
+
+from hwpconv.models import Paragraph, Table
+from hwpconv.parsers import HwpxParser, ParseProfile
+
+NAMESPACES = (
+    'xmlns:hs="http://www.hancom.co.kr/hwpml/2011/section" '
+    'xmlns:hp="http://www.hancom.co.kr/hwpml/2011/paragraph"'
+)
+
+
+def _p(*items):
+    """문단: 문자열은 hp:t가 든 run, 그 밖의 요소 XML은 별도 run으로 넣음"""
+    runs = []
+    for item in items:
+        if item.startswith('<'):
+            runs.append(f'<hp:run>{item}</hp:run>')
+        else:
+            runs.append(f'<hp:run><hp:t>{item}</hp:t></hp:run>')
+    return f'<hp:p>{"".join(runs)}</hp:p>'
+
+
+def _table(*rows):
+    """표: 각 셀은 문단 XML 목록"""
+    col_count = max(len(row) for row in rows)
+    trs = ''.join(
+        '<hp:tr>' + ''.join(
+            f'<hp:tc><hp:subList>{"".join(cell)}</hp:subList></hp:tc>' for cell in row
+        ) + '</hp:tr>'
+        for row in rows
+    )
+    return f'<hp:tbl rowCnt="{len(rows)}" colCnt="{col_count}">{trs}</hp:tbl>'
+
+
+def _text_box(*paragraphs):
+    return f'<hp:rect><hp:drawText><hp:subList>{"".join(paragraphs)}</hp:subList></hp:drawText></hp:rect>'
+
+
+def _hwpx(*sections):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('Contents/header.xml',
+                    '<hh:head xmlns:hh="http://www.hancom.co.kr/hwpml/2011/head"><hh:refList/></hh:head>')
+        for idx, body in enumerate(sections):
+            zf.writestr(f'Contents/section{idx}.xml', f'<hs:sec {NAMESPACES}>{body}</hs:sec>')
+    return buffer.getvalue()
+
+
+def _document():
+    """표(중첩 표, 셀 안 글상자, 텍스트가 있는 문단 안 표 포함), 글상자, 줄바꿈/탭이 섞인 두 구역 문서"""
+    first = ''.join([
+        _p('제1조 목적'),
+        _p(_table(
+            [[_p('셀 1-1')], [_p('셀 1-2'), _p('셀 1-2 둘째 문단')]],
+            [[_p('바깥 셀', _table([[_p('안쪽 셀 A')], [_p('안쪽 셀 B')]]))],
+             [_p('글상자가 든 셀', _text_box(_p('셀 안 글상자')))]],
+        )),
+        _p('본문 문단', _text_box(_p('글상자 첫 문단'), _p('글상자 둘째 문단'))),
+        _p('표 앞 텍스트 ', _table([[_p('문단 안 표')]]), '표 뒤 텍스트'),
+        _p('줄<hp:lineBreak/>바꿈과<hp:tab/>탭'),
+    ])
+    second = ''.join([
+        _p(_text_box(_p('본문 없는 글상자'))),
+        _p(_table([[_p('둘째 구역 셀')]])),
+        _p('마지막 문단'),
+    ])
+    return _hwpx(first, second)
+
+
+def _lines(text):
+    return [line.strip() for line in text.split('\n') if line.strip()]
+
+
+@pytest.mark.parametrize('profile', [
+    ParseProfile(),
+    ParseProfile(tables=False),
+    ParseProfile(drawings=False),
+])
+def test_iter_text_matches_document_text(profile):
+    data = _document()
+    parser = HwpxParser(profile=profile)
+    expected = _lines(parser.parse(data).text)
+    assert expected
+    assert _lines('\n'.join(parser.iter_text(data))) == expected
+
+
+def test_iter_text_includes_tables_and_text_boxes():
+    text = HwpxParser().extract_text(_document())
+    for fragment in ('셀 1-2 둘째 문단', '안쪽 셀 B', '셀 안 글상자', '글상자 둘째 문단', '본문 없는 글상자'):
+        assert fragment in text
+
+
+def test_paragraph_text_around_table_is_kept():
+    data = _hwpx(_p('표 앞 텍스트 ', _table([[_p('셀')]]), '표 뒤 텍스트'))
+    elements = HwpxParser().parse(data).sections[0].elements
+    assert [type(elem) for elem in elements] == [Paragraph, Table]
+    assert elements[0].text == '표 앞 텍스트 표 뒤 텍스트'
+    assert list(HwpxParser().iter_text(data)) == ['표 앞 텍스트 표 뒤 텍스트', '셀']
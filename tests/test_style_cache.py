@@ -0,0 +1,133 @@
+"""
+서식 테이블 캐시 테스트
+
+StyleTableCache의 LRU 동작과, HwpParser가 DocInfo 캐시 항목을 문서끼리 공유하지 않는지 확인한다.
+"""
+
+import dataclasses
+
+import pytest
+
+from hwpconv.models import TextStyle
+from hwpconv.parsers import HwpParser
+from hwpconv.parsers.cache import StyleTableCache, stream_digest
+
+from hwp_builder import build_hwp, char_shape, para_shape, paragraph
+
+DOC_INFO = char_shape(1000) + char_shape(1000, bold=True) + para_shape(align=3)
+
+
+def _document(doc_info=DOC_INFO, compressed=True):
+    return build_hwp([paragraph('보통굵게', char_shapes=[(0, 0), (2, 1)])],
+                     doc_info=doc_info, compressed=compressed)
+
+
+def _runs(doc):
+    return [(run.text, run.style.bold) for run in doc.sections[0].elements[0].runs]
+
+
+@pytest.fixture
+def parser():
+    parser = HwpParser()
+    parser.doc_info_cache = StyleTableCache(maxsize=4)
+    return parser
+
+
+def test_lru_evicts_least_recently_used():
+    cache = StyleTableCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1  # a가 최근 사용으로 이동
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+
+    cache.put('a', 10)  # 덮어쓰기도 최근 사용으로 이동
+    cache.put('d', 4)
+    assert cache.get('c') is None
+    assert (cache.get('a'), cache.get('d')) == (10, 4)
+    assert len(cache) == 2
+
+
+def test_hit_miss_counters_and_clear():
+    cache = StyleTableCache(maxsize=2)
+    assert cache.get('a') is None
+    cache.put('a', 1)
+    cache.get('a')
+    cache.get('a')
+    assert cache.stats() == {'hits': 2, 'misses': 1, 'size': 1, 'maxsize': 2}
+
+    cache.clear()
+    assert cache.stats() == {'hits': 0, 'misses': 0, 'size': 0, 'maxsize': 2}
+
+
+def test_zero_maxsize_disables_cache():
+    cache = StyleTableCache(maxsize=0)
+    cache.put('a', 1)
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+def test_stream_digest_depends_only_on_content():
+    assert stream_digest(b'abc') == stream_digest(bytearray(b'abc'))
+    assert stream_digest(b'abc') != stream_digest(b'abd')
+    assert len(stream_digest(b'')) == 16
+
+
+def test_same_doc_info_hits_cache(parser):
+    data = _document()
+    first = parser.parse(data)
+    second = parser.parse(data)
+    assert parser.doc_info_cache.stats()['hits'] == 1
+    assert parser.doc_info_cache.stats()['misses'] == 1
+    assert _runs(first) == _runs(second) == [('보통', False), ('굵게', True)]
+    assert parser.para_shapes[0]['align'] == 'center'
+
+
+def test_cache_key_is_doc_info_content_and_compression(parser):
+    parser.parse(_document())
+    # 다른 DocInfo 내용
+    parser.parse(_document(doc_info=char_shape(1000, bold=True) + char_shape(1000) + para_shape()))
+    # 같은 DocInfo라도 압축 여부가 다르면 스트림 바이트가 달라 다른 키
+    parser.parse(_document(compressed=False))
+    assert parser.doc_info_cache.stats()['misses'] == 3
+    assert len(parser.doc_info_cache) == 3
+
+    # 본문만 다른 문서는 DocInfo가 같으므로 히트
+    doc = parser.parse(build_hwp([paragraph('다른 본문')], doc_info=DOC_INFO))
+    assert parser.doc_info_cache.stats()['hits'] == 1
+    assert doc.text.strip() == '다른 본문'
+
+
+def test_cache_hit_does_not_share_mutable_tables(parser):
+    data = _document()
+    parser.parse(data)
+    (char_shapes, para_shapes, font_names), = parser.doc_info_cache._data.values()
+
+    # 한 문서의 테이블을 수정해도 캐시 항목에는 영향이 없어야 함
+    parser.char_shapes[1] = TextStyle(bold=False)
+    parser.para_shapes[0]['align'] = 'right'
+    parser.font_names[0] = '수정된 글꼴'
+    assert char_shapes[1].bold is True
+    assert para_shapes[0]['align'] == 'center'
+    assert font_names == {}
+
+    # 캐시 히트로 받은 테이블도 캐시 항목과 별개
+    other = HwpParser()
+    other.doc_info_cache = parser.doc_info_cache
+    doc = other.parse(data)
+    assert parser.doc_info_cache.stats()['hits'] == 1
+    assert _runs(doc) == [('보통', False), ('굵게', True)]
+    assert other.char_shapes is not char_shapes
+    assert other.para_shapes[0] is not para_shapes[0]
+    other.para_shapes[0]['align'] = 'justify'
+    assert para_shapes[0]['align'] == 'center'
+
+
+def test_shared_styles_are_frozen(parser):
+    data = _document()
+    parser.parse(data)
+    doc = parser.parse(data)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        doc.sections[0].elements[0].runs[1].style.bold = False